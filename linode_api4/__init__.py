@@ -1,7 +1,37 @@
 # isort: skip_file
-from linode_api4.objects import *
-from linode_api4.errors import ApiError, UnexpectedResponseError
-from linode_api4.linode_client import LinodeClient, MonitorClient
-from linode_api4.login_client import LinodeLoginClient, OAuthScopes
-from linode_api4.paginated_list import PaginatedList
-from linode_api4.polling import EventPoller
+"""
+The official Python SDK for Linode API v4.
+
+Everything exported here is imported the first time it is accessed, keeping
+``import linode_api4`` fast for short-lived processes.
+"""
+
+from linode_api4 import objects
+from linode_api4.util import lazy_exports
+
+_EXPORTS = {
+    ".objects": objects.__all__,
+    ".errors": ("ApiError", "UnexpectedResponseError"),
+    ".linode_client": ("LinodeClient", "MonitorClient"),
+    ".login_client": ("LinodeLoginClient", "OAuthScopes"),
+    ".paginated_list": ("PaginatedList", "ChangedSince", "AdaptivePageSize"),
+    ".polling": (
+        "EventHub",
+        "EventPoller",
+        "EventSubscription",
+        "EventWaitResult",
+        "PollSchedule",
+    ),
+    ".invalidation": ("Invalidator",),
+    ".mirror": ("Mirror", "MirrorCollection"),
+    ".cache": ("QueryCache",),
+    ".query": ("Query",),
+    ".batch": ("BatchExecutor", "BatchResult"),
+    ".scheduler": ("PriorityClass", "RequestScheduler"),
+}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__, globals(), _EXPORTS, ("objects", "groups")
+)
@@ -0,0 +1,182 @@
+"""
+Contains helpers for running many API operations concurrently.
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from linode_api4.linode_client import BaseClient
+
+
+@dataclass
+class BatchResult:
+    """
+    The outcome of a single item run by a :any:`BatchExecutor`.
+    """
+
+    #: The item this result is for, as it was given to the executor.
+    item: Any
+
+    #: The value returned by the item, if it completed successfully.
+    result: Any = None
+
+    #: The exception raised by the item, if it failed.
+    error: Optional[BaseException] = None
+
+    #: Whether the item was skipped because an earlier item failed while
+    #: running in fail-fast mode.
+    cancelled: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether this item ran and completed without raising.
+        """
+        return not self.cancelled and self.error is None
+
+
+class _RateLimiter:
+    """
+    Spaces out calls so that no more than ``rate`` start in any one second.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+class BatchExecutor:
+    """
+    BatchExecutor runs many API operations concurrently, such as rebooting or
+    tagging a large number of resources.  BatchExecutors should be created
+    through :meth:`LinodeClient.batch`.  For example::
+
+       instances = client.linode.instances(Instance.group == "prod")
+
+       results = client.batch(max_workers=16).run(
+           (instance, "reboot") for instance in instances
+       )
+
+       for r in results:
+           if not r.ok:
+               print("Failed to reboot {}: {}".format(r.item[0].label, r.error))
+
+    Each item may be a callable taking no arguments, or a tuple of
+    ``(object, method, args, kwargs)`` where ``method`` is either the name of a
+    method of ``object`` or a function to call with ``object`` as its first
+    argument.  ``args`` and ``kwargs`` are optional.
+
+    Requests made by items are subject to the client's retry configuration, so
+    rate-limited responses are retried as they would be outside of a batch.
+    """
+
+    def __init__(
+        self,
+        client: "BaseClient",
+        max_workers: int = 8,
+        rate: Optional[float] = None,
+        fail_fast: bool = False,
+        progress: Optional[Callable[[BatchResult, int, int], None]] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self._client = client
+        self.max_workers = max_workers
+        self.rate = rate
+        self.fail_fast = fail_fast
+        self.progress = progress
+
+    @staticmethod
+    def _make_call(item: Any) -> Callable[[], Any]:
+        """
+        Returns a callable that runs the given batch item.
+        """
+        if callable(item):
+            return item
+
+        if not isinstance(item, tuple) or not 2 <= len(item) <= 4:
+            raise TypeError(
+                "Batch items must be callables or (object, method, args, kwargs) "
+                "tuples, got {}".format(item)
+            )
+
+        obj, method = item[0], item[1]
+        args = item[2] if len(item) > 2 else ()
+        kwargs = item[3] if len(item) > 3 else {}
+
+        if isinstance(method, str):
+            func = getattr(obj, method)
+            return lambda: func(*args, **kwargs)
+
+        return lambda: method(obj, *args, **kwargs)
+
+    def run(self, items: Iterable[Any]) -> List[BatchResult]:
+        """
+        Runs all given items concurrently and waits for them to complete.
+
+        :param items: The items to run.
+        :type items: Iterable
+
+        :returns: A result for each item, in the order the items were given.
+        :rtype: List[BatchResult]
+        """
+        items = list(items)
+        calls = [self._make_call(item) for item in items]
+        results: List[Optional[BatchResult]] = [None] * len(items)
+
+        limiter = _RateLimiter(self.rate) if self.rate else None
+        stop = threading.Event()
+
+        def run_item(index: int) -> BatchResult:
+            if stop.is_set():
+                return BatchResult(items[index], cancelled=True)
+
+            if limiter is not None:
+                limiter.wait()
+
+            # check again, an item may have failed while we were waiting
+            if stop.is_set():
+                return BatchResult(items[index], cancelled=True)
+
+            try:
+                return BatchResult(items[index], result=calls[index]())
+            except Exception as e:
+                if self.fail_fast:
+                    stop.set()
+                return BatchResult(items[index], error=e)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # items run in the caller's context so that they keep its
+            # request priority
+            futures = {
+                executor.submit(contextvars.copy_context().run, run_item, i): i
+                for i in range(len(items))
+            }
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results[futures[future]] = result
+
+                if self.progress is not None:
+                    self.progress(result, completed, len(items))
+
+        return results
@@ -0,0 +1,295 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from linode_api4 import objects
+from linode_api4.invalidation import _changed_entities
+from linode_api4.objects.filtering import _flatten
+
+if TYPE_CHECKING:
+    from linode_api4.linode_client import BaseClient
+    from linode_api4.objects import Event
+    from linode_api4.polling import EventSubscription
+
+#: How long in seconds cached results are used for by default.
+DEFAULT_TTL = 30
+
+
+def _canonical(dct: Any) -> Any:
+    """
+    Returns the given X-Filter dict with its boolean conditions flattened and
+    sorted, so that filters with the same meaning are equal.
+    """
+    if isinstance(dct, list):
+        return [_canonical(v) for v in dct]
+
+    if not isinstance(dct, dict):
+        return dct
+
+    result = {}
+    for key, value in _flatten(dct).items():
+        if key in ("+and", "+or") and isinstance(value, list):
+            terms = [_canonical(v) for v in value]
+            value = sorted(terms, key=lambda t: json.dumps(t, sort_keys=True))
+        else:
+            value = _canonical(value)
+
+        result[key] = value
+
+    return result
+
+
+def cache_key(endpoint: str, filters: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Returns the key results listed from the given endpoint with the given
+    filters are cached under.  Filters that differ only in the order of their
+    keys or of the conditions they combine, or in how those are nested, have
+    the same key.
+
+    :param endpoint: The endpoint the results were listed from.
+    :type endpoint: str
+    :param filters: The X-Filter the results were listed with.
+    :type filters: Optional[dict]
+
+    :returns: The cache key.
+    :rtype: str
+    """
+    return "{} {}".format(
+        endpoint,
+        json.dumps(
+            _canonical(filters or {}), sort_keys=True, separators=(",", ":")
+        ),
+    )
+
+
+class QueryCache:
+    """
+    QueryCache keeps the results of filtered collection requests in memory, so
+    that services running the same queries repeatedly make one request per
+    query per TTL::
+
+       client = LinodeClient(token, query_cache=QueryCache(ttl=60))
+
+       # Only the first of these calls the API
+       for _ in range(10):
+           prod = client.linode.instances(Instance.tags.contains("prod"))
+
+    Results are cached by endpoint and filter, regardless of how the filter's
+    conditions are ordered or nested.  Entries expire after their TTL, the
+    least recently used entries are evicted once the cache is full, and
+    entries listing an endpoint are dropped when the client creates, changes or
+    deletes anything under it.
+
+    Changes made elsewhere are picked up once entries expire, or sooner by
+    applying the account's events with :meth:`subscribe`; each event drops the
+    entries for the types of objects it refers to, as decided by
+    :any:`ENTITY_MODELS` and :any:`ACTION_MODELS`.  Listed :any:`Event` results
+    are dropped on any event.
+
+    Each lookup answered from the cache returns a new list over the cached
+    pages, so callers iterate independently, but the models in them are shared.
+    Reads that must be current, like :meth:`LinodeGroup.changed_since`, aren't
+    cached.
+
+    :param ttl: How long in seconds results are used for, either for all
+                models or as a dict by model class.  Classes missing from the
+                dict use the entry of their nearest base class, or
+                :any:`DEFAULT_TTL`.
+    :type ttl: Union[float, Dict[type, float]]
+    :param max_entries: The most results kept at once.
+    :type max_entries: int
+    """
+
+    def __init__(
+        self,
+        ttl: Union[float, Dict[type, float]] = DEFAULT_TTL,
+        max_entries: int = 256,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        #: The number of lookups answered from this cache.
+        self.hits = 0
+
+        #: The number of lookups that weren't.
+        self.misses = 0
+
+        # key -> (expires at, model class name, endpoint, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, str, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _ttl_for(self, cls: type) -> float:
+        if not isinstance(self.ttl, dict):
+            return self.ttl
+
+        for c in cls.__mro__:
+            if c in self.ttl:
+                return self.ttl[c]
+
+        return DEFAULT_TTL
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the results cached under the given key, or None if there are
+        none or they've expired.
+
+        :param key: The key, as returned by :func:`cache_key`.
+        :type key: Hashable
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[3]
+
+    def put(self, key: Hashable, value: Any, cls: type, endpoint: str = ""):
+        """
+        Caches the given results under the given key.
+
+        :param key: The key, as returned by :func:`cache_key`.
+        :type key: Hashable
+        :param value: The results to cache.
+        :type value: Any
+        :param cls: The model class of the results.
+        :type cls: type
+        :param endpoint: The endpoint the results were listed from.
+        :type endpoint: str
+        """
+        ttl = self._ttl_for(cls)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + ttl,
+                cls.__name__,
+                endpoint,
+                value,
+            )
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self,
+        models: Optional[Set[str]] = None,
+        endpoint: Optional[str] = None,
+    ) -> int:
+        """
+        Drops cached results.  If neither argument is given, every entry is
+        dropped.
+
+        :param models: Drop results of these model classes, by name.
+        :type models: Set[str]
+        :param endpoint: Drop results listed from this endpoint, or from any
+                         endpoint it's under; given "/linode/instances/123",
+                         results listed from "/linode/instances" are dropped.
+        :type endpoint: str
+
+        :returns: The number of entries dropped.
+        :rtype: int
+        """
+        with self._lock:
+            if models is None and endpoint is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+
+            stale = [
+                key
+                for key, (_, model, listed, _) in self._entries.items()
+                if (models is not None and model in models)
+                or (
+                    endpoint is not None
+                    and listed
+                    and (
+                        endpoint == listed or endpoint.startswith(listed + "/")
+                    )
+                )
+            ]
+
+            for key in stale:
+                del self._entries[key]
+
+            return len(stale)
+
+    def apply(self, event: Union["Event", Dict[str, Any]]) -> int:
+        """
+        Drops the cached results the given event may have changed.  This is
+        called for each completed event by a subscription from
+        :meth:`subscribe`, but may also be called with events obtained
+        elsewhere.
+
+        :param event: The event, or its JSON.
+        :type event: Union[Event, Dict[str, Any]]
+
+        :returns: The number of entries dropped.
+        :rtype: int
+        """
+        if isinstance(event, objects.Base):
+            event = event._raw_json
+
+        models = {"Event"}
+
+        for names, _ in _changed_entities(event):
+            models.update(names)
+
+        return self.invalidate(models=models)
+
+    def subscribe(
+        self,
+        client: "BaseClient",
+        interval: float = 5,
+        after_id: Optional[int] = None,
+    ) -> "EventSubscription":
+        """
+        Starts applying the account's events as they complete, from a
+        background thread, until the returned subscription is stopped.
+
+        :param client: The client to poll the account's events with.
+        :type client: LinodeClient
+        :param interval: How long to wait in seconds between polls of the
+                         event feed.
+        :type interval: float
+        :param after_id: If given, events after this event ID are applied,
+                         rather than only events created after this is called.
+        :type after_id: int
+
+        :returns: The running subscription.
+        :rtype: EventSubscription
+        """
+        return client.polling.subscribe(
+            self.apply,
+            status=["finished", "failed", "notification"],
+            interval=interval,
+            workers=1,
+            after_id=after_id,
+        )
@@ -0,0 +1,177 @@
+import math
+from array import array
+from typing import Any, Callable, Dict, Iterable, Sequence, Union
+
+from linode_api4.objects.filtering import FilterableAttribute, _field_value
+
+#: The formats :meth:`PaginatedList.to_columns` can return columns in.
+COLUMN_FORMATS = ("array", "numpy", "pandas", "arrow")
+
+
+class _Column:
+    """
+    Collects the values of one field.  Integers are kept in an ``array("q")``
+    and floats in an ``array("d")``; integer columns with missing values become
+    float columns with NaN in their place.  Any other value turns the column
+    into a plain list.
+    """
+
+    __slots__ = ("data", "missing", "integral")
+
+    def __init__(self):
+        self.data = None
+
+        # missing values seen before the column's type was known
+        self.missing = 0
+
+        # whether every value seen so far was an int
+        self.integral = True
+
+    def append(self, value):
+        data = self.data
+
+        if isinstance(data, list):
+            data.append(value)
+            return
+
+        if value is None:
+            if data is None:
+                self.missing += 1
+                return
+
+            if data.typecode == "q":
+                data = self.data = array("d", data)
+
+            data.append(math.nan)
+            return
+
+        # bools are ints, but aren't kept as numbers
+        typecode = {int: "q", float: "d"}.get(type(value))
+        if typecode is None:
+            self._to_list()
+            self.data.append(value)
+            return
+
+        if typecode == "d":
+            self.integral = False
+
+        if data is None:
+            if self.missing:
+                typecode = "d"
+            data = self.data = array(typecode, [math.nan] * self.missing)
+        elif typecode == "d" and data.typecode == "q":
+            data = self.data = array("d", data)
+
+        try:
+            data.append(value)
+        except OverflowError:
+            self._to_list()
+            self.data.append(value)
+
+    def _to_list(self):
+        if self.data is None:
+            self.data = [None] * self.missing
+            return
+
+        convert = int if self.integral else float
+        self.data = [None if math.isnan(v) else convert(v) for v in self.data]
+
+    def result(self) -> Union[array, list]:
+        if self.data is None:
+            return [None] * self.missing
+
+        return self.data
+
+
+def _field_name(field: Union[str, FilterableAttribute]) -> str:
+    if isinstance(field, FilterableAttribute):
+        return field.name
+
+    return field
+
+
+def build_columns(
+    pages: Iterable[Sequence[Any]],
+    fields: Sequence[Union[str, FilterableAttribute]],
+) -> Dict[str, Union[array, list]]:
+    """
+    Returns the values of the given fields of every object in the given pages,
+    by field.  Objects may be models or their JSON; models are read from the
+    JSON they were populated with, and nothing is loaded from the API.
+    """
+    names = [_field_name(f) for f in fields]
+    columns = [_Column() for _ in names]
+
+    for page in pages:
+        for obj in page:
+            for name, column in zip(names, columns):
+                column.append(_field_value(obj, name))
+
+    return {name: column.result() for name, column in zip(names, columns)}
+
+
+def _import(module: str, fmt: str):
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(
+            'Columns in the "{}" format require {} to be installed'.format(
+                fmt, module
+            )
+        ) from e
+
+
+def _to_numpy(np, column: Union[array, list]):
+    if isinstance(column, array):
+        return np.frombuffer(column, dtype=column.typecode)
+
+    result = np.empty(len(column), dtype=object)
+    result[:] = column
+    return result
+
+
+def _to_arrow(pa, column: Union[array, list]):
+    if isinstance(column, array):
+        return pa.Array.from_buffers(
+            pa.int64() if column.typecode == "q" else pa.float64(),
+            len(column),
+            [None, pa.py_buffer(column)],
+        )
+
+    return pa.array(column)
+
+
+def column_converter(
+    fmt: str,
+) -> Callable[[Dict[str, Union[array, list]]], Any]:
+    """
+    Returns a function converting columns built by :func:`build_columns` to the
+    given format; see :meth:`PaginatedList.to_columns`.  Libraries the format
+    needs are imported here, so that missing ones are found before any columns
+    are built.
+    """
+    if fmt == "array":
+        return lambda columns: columns
+
+    if fmt == "numpy":
+        np = _import("numpy", fmt)
+        return lambda columns: {n: _to_numpy(np, c) for n, c in columns.items()}
+
+    if fmt == "pandas":
+        np = _import("numpy", fmt)
+        pd = _import("pandas", fmt)
+        return lambda columns: pd.DataFrame(
+            {n: _to_numpy(np, c) for n, c in columns.items()}
+        )
+
+    if fmt == "arrow":
+        pa = _import("pyarrow", fmt)
+        return lambda columns: pa.table(
+            [_to_arrow(pa, c) for c in columns.values()], names=list(columns)
+        )
+
+    raise ValueError(
+        "Unknown column format {}; expected one of {}".format(
+            fmt, ", ".join(COLUMN_FORMATS)
+        )
+    )
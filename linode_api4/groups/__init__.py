@@ -1,28 +1,67 @@
-# Group needs to be imported first
-from .group import *  # isort: skip
+"""
+Groups are imported the first time they are accessed; see :any:`LinodeClient`.
+"""
 
-from .account import *
-from .beta import *
-from .database import *
-from .domain import *
-from .image import *
-from .image_share_group import *
-from .linode import *
-from .lke import *
-from .lke_tier import *
-from .lock import *
-from .longview import *
-from .maintenance import *
-from .monitor import *
-from .monitor_api import *
-from .networking import *
-from .nodebalancer import *
-from .object_storage import *
-from .placement import *
-from .polling import *
-from .profile import *
-from .region import *
-from .support import *
-from .tag import *
-from .volume import *
-from .vpc import *
+from linode_api4.util import lazy_exports
+
+_SUBMODULES = (
+    "group",
+    "account",
+    "beta",
+    "database",
+    "domain",
+    "image",
+    "image_share_group",
+    "linode",
+    "lke",
+    "lke_tier",
+    "lock",
+    "longview",
+    "maintenance",
+    "monitor",
+    "monitor_api",
+    "networking",
+    "nodebalancer",
+    "object_storage",
+    "placement",
+    "polling",
+    "profile",
+    "region",
+    "support",
+    "tag",
+    "volume",
+    "vpc",
+)
+
+_EXPORTS = {
+    ".group": ("Group",),
+    ".account": ("AccountGroup",),
+    ".beta": ("BetaProgramGroup",),
+    ".database": ("DatabaseGroup",),
+    ".domain": ("DomainGroup",),
+    ".image": ("ImageGroup",),
+    ".image_share_group": ("ImageShareGroupAPIGroup",),
+    ".linode": ("LinodeGroup",),
+    ".lke": ("LKEGroup",),
+    ".lke_tier": ("LKETierGroup",),
+    ".lock": ("LockGroup",),
+    ".longview": ("LongviewGroup",),
+    ".maintenance": ("MaintenanceGroup",),
+    ".monitor": ("MonitorGroup",),
+    ".monitor_api": ("MetricsGroup",),
+    ".networking": ("NetworkingGroup",),
+    ".nodebalancer": ("NodeBalancerGroup",),
+    ".object_storage": ("ObjectStorageGroup",),
+    ".placement": ("PlacementAPIGroup",),
+    ".polling": ("PollingGroup",),
+    ".profile": ("ProfileGroup",),
+    ".region": ("RegionGroup",),
+    ".support": ("SupportGroup",),
+    ".tag": ("TagGroup",),
+    ".volume": ("VolumeGroup",),
+    ".vpc": ("VPCGroup",),
+}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS, _SUBMODULES)
@@ -24,6 +24,52 @@ class DomainGroup(Group):
         """
         return self.client._get_and_filter(Domain, *filters)
 
+    def changed_since(self, since, *filters):
+        """
+        Returns the Domains that changed at or after the given time, oldest
+        first, along with the newest `updated` timestamp among them; see
+        :any:`ChangedSince`.
+
+        :param since: The time to return changes since, as a datetime or an
+                      API timestamp string.
+        :type since: Union[datetime, str]
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The changed Domains and the new high-water mark.
+        :rtype: ChangedSince
+        """
+        return self.client._get_changed_since(Domain, since, *filters)
+
+    def count(self, *filters):
+        """
+        Returns the number of Domains on your account matching the given
+        filters, without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The number of matching Domains.
+        :rtype: int
+        """
+        return self.client._count(Domain, *filters)
+
+    def exists(self, *filters):
+        """
+        Returns whether any Domains on your account match the given filters,
+        without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: True if any Domains match.
+        :rtype: bool
+        """
+        return self.client._exists(Domain, *filters)
+
     def create(self, domain, master=True, **kwargs):
         """
         Registers a new Domain on the acting user's account.  Make sure to point
@@ -1,7 +1,5 @@
 from typing import BinaryIO, List, Optional, Tuple, Union
 
-import requests
-
 from linode_api4.errors import UnexpectedResponseError
 from linode_api4.groups import Group
 from linode_api4.objects import Disk, Image
@@ -162,7 +160,7 @@ class ImageGroup(Group):
             label, region, description=description, tags=tags
         )
 
-        requests.put(
+        self.client.session.put(
             url,
             headers={"Content-Type": "application/octet-stream"},
             data=file,
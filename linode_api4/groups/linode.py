@@ -76,6 +76,52 @@ class LinodeGroup(Group):
         """
         return self.client._get_and_filter(Instance, *filters)
 
+    def changed_since(self, since, *filters):
+        """
+        Returns the Instances that changed at or after the given time, oldest
+        first, along with the newest `updated` timestamp among them; see
+        :any:`ChangedSince`.
+
+        :param since: The time to return changes since, as a datetime or an
+                      API timestamp string.
+        :type since: Union[datetime, str]
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The changed Instances and the new high-water mark.
+        :rtype: ChangedSince
+        """
+        return self.client._get_changed_since(Instance, since, *filters)
+
+    def count(self, *filters):
+        """
+        Returns the number of Instances on your account matching the given
+        filters, without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The number of matching Instances.
+        :rtype: int
+        """
+        return self.client._count(Instance, *filters)
+
+    def exists(self, *filters):
+        """
+        Returns whether any Instances on your account match the given filters,
+        without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: True if any Instances match.
+        :rtype: bool
+        """
+        return self.client._exists(Instance, *filters)
+
     def stackscripts(self, *filters, **kwargs):
         """
         Returns a list of :any:`StackScripts<StackScript>`, both public and
@@ -58,6 +58,52 @@ class LKEGroup(Group):
         """
         return self.client._get_and_filter(LKECluster, *filters)
 
+    def clusters_changed_since(self, since, *filters):
+        """
+        Returns the LKE clusters that changed at or after the given time, oldest
+        first, along with the newest `updated` timestamp among them; see
+        :any:`ChangedSince`.
+
+        :param since: The time to return changes since, as a datetime or an
+                      API timestamp string.
+        :type since: Union[datetime, str]
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The changed LKE clusters and the new high-water mark.
+        :rtype: ChangedSince
+        """
+        return self.client._get_changed_since(LKECluster, since, *filters)
+
+    def clusters_count(self, *filters):
+        """
+        Returns the number of LKE Clusters on your account matching the given
+        filters, without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The number of matching LKE Clusters.
+        :rtype: int
+        """
+        return self.client._count(LKECluster, *filters)
+
+    def clusters_exist(self, *filters):
+        """
+        Returns whether any LKE Clusters on your account match the given
+        filters, without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: True if any LKE Clusters match.
+        :rtype: bool
+        """
+        return self.client._exists(LKECluster, *filters)
+
     def cluster_create(
         self,
         region,
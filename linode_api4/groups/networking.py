@@ -40,6 +40,52 @@ class NetworkingGroup(Group):
         """
         return self.client._get_and_filter(Firewall, *filters)
 
+    def firewalls_changed_since(self, since, *filters):
+        """
+        Returns the Firewalls that changed at or after the given time, oldest
+        first, along with the newest `updated` timestamp among them; see
+        :any:`ChangedSince`.
+
+        :param since: The time to return changes since, as a datetime or an
+                      API timestamp string.
+        :type since: Union[datetime, str]
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The changed Firewalls and the new high-water mark.
+        :rtype: ChangedSince
+        """
+        return self.client._get_changed_since(Firewall, since, *filters)
+
+    def firewalls_count(self, *filters):
+        """
+        Returns the number of Firewalls on your account matching the given
+        filters, without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The number of matching Firewalls.
+        :rtype: int
+        """
+        return self.client._count(Firewall, *filters)
+
+    def firewalls_exist(self, *filters):
+        """
+        Returns whether any Firewalls on your account match the given filters,
+        without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: True if any Firewalls match.
+        :rtype: bool
+        """
+        return self.client._exists(Firewall, *filters)
+
     def firewall_create(
         self,
         label: str,
@@ -24,6 +24,34 @@ class NodeBalancerGroup(Group):
         """
         return self.client._get_and_filter(NodeBalancer, *filters)
 
+    def count(self, *filters):
+        """
+        Returns the number of NodeBalancers on your account matching the given
+        filters, without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The number of matching NodeBalancers.
+        :rtype: int
+        """
+        return self.client._count(NodeBalancer, *filters)
+
+    def exists(self, *filters):
+        """
+        Returns whether any NodeBalancers on your account match the given
+        filters, without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: True if any NodeBalancers match.
+        :rtype: bool
+        """
+        return self.client._exists(NodeBalancer, *filters)
+
     def create(self, region, **kwargs):
         """
         Creates a new NodeBalancer in the given Region.
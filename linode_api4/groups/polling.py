@@ -1,9 +1,43 @@
-from typing import Optional
+import asyncio
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import polling
 
 from linode_api4.groups import Group
-from linode_api4.polling import EventPoller, TimeoutContext
+from linode_api4.linode_client import MAX_FILTER_TERMS
+from linode_api4.objects import Event
+from linode_api4.objects.filtering import _split
+from linode_api4.polling import (
+    BUSY_EVENT_STATUSES,
+    EventError,
+    EventHub,
+    EventPoller,
+    EventSubscription,
+    EventWaitResult,
+    PollSchedule,
+    TimeoutContext,
+    _event_stream_filter,
+    _fetch_events,
+    _latest_event_id,
+    _poll,
+    _poll_async,
+    _resolve_interval,
+)
+from linode_api4.util import normalize_as_list
 
 
 class PollingGroup(Group):
@@ -11,11 +45,40 @@ class PollingGroup(Group):
     This group contains various helper functions for polling on Linode events.
     """
 
+    def __init__(self, client):
+        super().__init__(client)
+
+        #: The shared event hub used by this client's pollers, if enabled.
+        #: See :meth:`enable_event_hub`.
+        self.event_hub: Optional[EventHub] = None
+        self._hub_lock = threading.Lock()
+
+    def enable_event_hub(self) -> EventHub:
+        """
+        Makes all pollers created through this group share a single
+        :any:`EventHub`.  Once enabled, :meth:`EventPoller.wait_for_next_event`,
+        :meth:`EventPoller.wait_for_next_event_finished` and
+        :meth:`wait_for_entity_free` poll the account event feed once per
+        interval between them, no matter how many are waiting at once.
+
+        This is useful when waiting on many operations concurrently, such as
+        when provisioning many Linodes from separate threads.
+
+        :returns: The client's event hub.
+        :rtype: EventHub
+        """
+        with self._hub_lock:
+            if self.event_hub is None:
+                self.event_hub = EventHub(self.client)
+
+            return self.event_hub
+
     def event_poller_create(
         self,
         entity_type: str,
         action: str,
         entity_id: Optional[int] = None,
+        checkpoint: Optional[str] = None,
     ) -> EventPoller:
         """
         Creates a new instance of the EventPoller class.
@@ -30,6 +93,10 @@ class PollingGroup(Group):
         :type entity_id: int
         :param poll_interval: The interval in seconds to wait between polls.
         :type poll_interval: int
+        :param checkpoint: The path of a file to save the poller's position to,
+                           allowing a later poller to resume from it.  See
+                           :any:`EventPoller`.
+        :type checkpoint: str
 
         :returns: The new EventPoller object.
         :rtype: EventPoller
@@ -40,6 +107,8 @@ class PollingGroup(Group):
             entity_type,
             action,
             entity_id=entity_id,
+            hub=self.event_hub,
+            checkpoint=checkpoint,
         )
 
     def wait_for_entity_free(
@@ -47,7 +116,7 @@ class PollingGroup(Group):
         entity_type: str,
         entity_id: int,
         timeout: int = 240,
-        interval: int = 5,
+        interval: Optional[float] = None,
     ):
         """
         Waits for all events relevant events to not be scheduled or in-progress.
@@ -59,33 +128,518 @@ class PollingGroup(Group):
         :type entity_id: int
         :param timeout: The timeout in seconds for this polling operation.
         :type timeout: int
-        :param interval: The interval in seconds to wait between polls.
-        :type interval: int
+        :param interval: The interval in seconds to wait between polls.  If not
+                         given, polls are spaced out by a :any:`PollSchedule`
+                         using the progress of the running event.
+        :type interval: float
         """
 
         timeout_ctx = TimeoutContext(timeout_seconds=timeout)
+        interval = _resolve_interval(interval)
+        api_filter = self._entity_events_filter(entity_type, entity_id)
 
-        api_filter = {
+        if self.event_hub is not None:
+            # Events created after this point are delivered by the hub
+            after_id = self.event_hub.cursor()
+            self._wait_for_entity_free_hub(
+                entity_type,
+                entity_id,
+                self.client.get("/account/events", filters=api_filter)["data"],
+                after_id,
+                timeout_ctx,
+                interval,
+            )
+            return
+
+        def poll_func():
+            return self._poll_entity_free(api_filter, interval)
+
+        if poll_func():
+            return
+
+        _poll(poll_func, timeout_ctx.seconds_remaining, interval)
+
+    async def async_wait_for_entity_free(
+        self,
+        entity_type: str,
+        entity_id: int,
+        timeout: float = 240,
+        interval: Optional[float] = None,
+    ):
+        """
+        An awaitable version of :meth:`wait_for_entity_free`.  This waits between
+        polls with `asyncio.sleep`, and only uses a thread for the duration of
+        each request, so any number of waits may run concurrently.
+
+        :param entity_type: The type of the entity to poll for events on.
+        :type entity_type: str
+        :param entity_id: The ID of the entity to poll for.
+        :type entity_id: int
+        :param timeout: The timeout in seconds for this polling operation.
+        :type timeout: float
+        :param interval: The interval in seconds to wait between polls.  If not
+                         given, polls are spaced out by a :any:`PollSchedule`
+                         using the progress of the running event.
+        :type interval: float
+        """
+        interval = _resolve_interval(interval)
+        api_filter = self._entity_events_filter(entity_type, entity_id)
+
+        if self.event_hub is not None:
+            # Events created after this point are delivered by the hub
+            after_id = await asyncio.to_thread(self.event_hub.cursor)
+            events = await asyncio.to_thread(
+                self.client.get, "/account/events", filters=api_filter
+            )
+
+            waiting = self._entity_free_check(
+                entity_type, entity_id, events["data"], interval
+            )
+            if waiting is not None:
+                check, busy = waiting
+                await self.event_hub.async_wait_for(
+                    check,
+                    timeout=timeout,
+                    interval=interval,
+                    watch=busy,
+                    after_id=after_id,
+                )
+            return
+
+        await _poll_async(
+            lambda: self._poll_entity_free(api_filter, interval) or None,
+            timeout,
+            interval,
+        )
+
+    async def async_subscribe(
+        self,
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        action: Optional[str] = None,
+        interval: float = 5,
+        after_id: Optional[int] = None,
+    ) -> AsyncIterator[Event]:
+        """
+        Yields new events on this account as they appear, optionally limited to
+        one entity type, entity, or action.  For example::
+
+            async for event in client.polling.async_subscribe(entity_type="linode"):
+                print("{} on Linode {}".format(event.action, event.entity.id))
+
+        Polls are made in a worker thread and spaced out with `asyncio.sleep`.
+        This never finishes on its own; stop iterating when done.
+
+        :param entity_type: If given, only events for this type of entity are
+                            yielded.
+        :type entity_type: str
+        :param entity_id: If given, only events for the entity with this ID are
+                          yielded.
+        :type entity_id: int
+        :param action: If given, only events with this action are yielded.
+        :type action: str
+        :param interval: The interval in seconds to wait between polls.
+        :type interval: float
+        :param after_id: Only yield events newer than the event with this ID.
+                         Defaults to the newest event when iteration starts.
+        :type after_id: int
+
+        :returns: An asynchronous iterator of new events.
+        :rtype: AsyncIterator[Event]
+        """
+        if after_id is None:
+            after_id = await asyncio.to_thread(_latest_event_id, self.client)
+
+        while True:
+            api_filter = _event_stream_filter(
+                after_id, entity_type, entity_id, action
+            )
+            events = await asyncio.to_thread(
+                _fetch_events, self.client, api_filter
+            )
+
+            for event in events:
+                after_id = max(after_id, event["id"])
+                yield Event(self.client, event["id"], json=event)
+
+            await asyncio.sleep(interval)
+
+    def subscribe(
+        self,
+        callback: Callable[[Event], Any],
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        action: Optional[str] = None,
+        status: Optional[Union[str, List[str]]] = None,
+        interval: float = 5,
+        workers: int = 4,
+        max_pending: int = 100,
+        overflow: str = "block",
+        retries: int = 3,
+        after_id: Optional[int] = None,
+    ) -> EventSubscription:
+        """
+        Calls the given function with each new event on this account, from
+        background threads, until the returned subscription is stopped.  For
+        example::
+
+            def on_boot(event):
+                print("Linode {} booted".format(event.entity.id))
+
+            subscription = client.polling.subscribe(
+                on_boot, action="linode_boot", status="finished"
+            )
+
+            ...
+
+            subscription.stop()
+
+        See :any:`EventSubscription` for delivery guarantees and backpressure.
+
+        :param callback: The function to call with each event.
+        :type callback: Callable[[Event], Any]
+        :param entity_type: If given, only events for this type of entity are
+                            delivered.
+        :type entity_type: str
+        :param entity_id: If given, only events for the entity with this ID are
+                          delivered.
+        :type entity_id: int
+        :param action: If given, only events with this action are delivered.
+        :type action: str
+        :param status: If given, events are delivered once they reach one of these
+                       statuses, rather than when they first appear.
+        :type status: str or List[str]
+        :param interval: The interval in seconds to wait between polls.
+        :type interval: float
+        :param workers: The number of threads calling the callback.
+        :type workers: int
+        :param max_pending: The most events to hold while waiting for a worker.
+        :type max_pending: int
+        :param overflow: What to do with new events when `max_pending` events are
+                         waiting: "block" to delay polling until there is room,
+                         or "drop" to discard them.
+        :type overflow: str
+        :param retries: The number of times to call the callback again for an
+                        event when it raises.
+        :type retries: int
+        :param after_id: Only deliver events newer than the event with this ID.
+                         Defaults to the newest event at the time of the call.
+        :type after_id: int
+
+        :returns: The started subscription.
+        :rtype: EventSubscription
+        """
+        subscription = EventSubscription(
+            self.client,
+            callback,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            action=action,
+            status=normalize_as_list(status) if status is not None else None,
+            interval=interval,
+            workers=workers,
+            max_pending=max_pending,
+            overflow=overflow,
+            retries=retries,
+            after_id=after_id,
+        )
+        subscription.start()
+
+        return subscription
+
+    @staticmethod
+    def _entity_events_filter(
+        entity_type: str, entity_id: int
+    ) -> Dict[str, Any]:
+        """
+        Returns the filter for the most recent events on an entity.
+        """
+        return {
             "+order": "desc",
             "+order_by": "created",
             "entity.id": entity_id,
             "entity.type": entity_type,
         }
 
-        def poll_func():
-            events = self.client.get("/account/events", filters=api_filter)[
-                "data"
-            ]
-            return all(
-                event["status"] not in ("scheduled", "started")
-                for event in events
+    def _poll_entity_free(
+        self,
+        api_filter: Dict[str, Any],
+        interval: Union[float, PollSchedule],
+    ) -> bool:
+        """
+        Returns whether none of the events matching the given filter are
+        scheduled or in progress.
+        """
+        events = self.client.get("/account/events", filters=api_filter)["data"]
+
+        running = next((e for e in events if e["status"] == "started"), None)
+        if running is not None and isinstance(interval, PollSchedule):
+            interval.observe(running)
+
+        return all(
+            event["status"] not in BUSY_EVENT_STATUSES for event in events
+        )
+
+    def wait_for_many(
+        self,
+        entities: Iterable[Tuple[str, int]],
+        action: Optional[str] = None,
+        status: Union[str, List[str]] = ("finished", "notification"),
+        timeout: float = 240,
+        entity_timeout: Optional[float] = None,
+        interval: Optional[float] = None,
+        after_id: Optional[int] = None,
+    ) -> Iterator[EventWaitResult]:
+        """
+        Waits for the next event on each of many entities to complete, yielding
+        a result for each entity as soon as its event completes.  Each poll is a
+        single request covering every entity still being waited on, no matter
+        how many there are.  For example::
+
+            results = client.polling.wait_for_many(
+                [("linode", instance.id) for instance in instances],
+                action="linode_reboot",
             )
 
-        if poll_func():
+            for instance in instances:
+                instance.reboot()
+
+            for result in results:
+                if not result.ok:
+                    print("Linode {} failed: {}".format(result.entity_id, result.error))
+
+        Like an :any:`EventPoller`, this should be called *before* triggering the
+        operations to wait on; only events created after the call are
+        considered unless `after_id` is given.
+
+        :param entities: The entities to wait on, as (entity type, entity ID) pairs.
+        :type entities: Iterable[Tuple[str, int]]
+        :param action: If given, only events with this action are waited on.
+        :type action: str
+        :param status: The event statuses that count as complete.  Failed events
+                       are always reported, with an :any:`EventError`.
+        :type status: str or List[str]
+        :param timeout: The timeout in seconds for the whole operation.  Entities
+                        that haven't completed by then are reported as timed out.
+        :type timeout: float
+        :param entity_timeout: If given, the time in seconds each entity's event
+                               may run for once it has appeared before it is
+                               reported as timed out.
+        :type entity_timeout: float
+        :param interval: The interval in seconds to wait between polls.  If not
+                         given, polls are spaced out by a :any:`PollSchedule`.
+        :type interval: float
+        :param after_id: Only consider events newer than the event with this ID.
+                         Defaults to the newest event at the time of the call.
+        :type after_id: int
+
+        :returns: An iterator of results, in the order the entities completed.
+        :rtype: Iterator[EventWaitResult]
+        """
+        pending = {(t, i): None for t, i in entities}
+        statuses = normalize_as_list(status)
+        timeout_ctx = TimeoutContext(timeout_seconds=timeout)
+
+        if after_id is None:
+            after_id = _latest_event_id(self.client)
+
+        return self._wait_for_many(
+            pending,
+            action,
+            statuses,
+            timeout_ctx,
+            entity_timeout,
+            _resolve_interval(interval, action),
+            after_id,
+        )
+
+    def _wait_for_many(
+        self,
+        pending: Dict[Tuple[str, int], Optional[float]],
+        action: Optional[str],
+        statuses: List[str],
+        timeout_ctx: TimeoutContext,
+        entity_timeout: Optional[float],
+        interval: Union[float, PollSchedule],
+        after_id: int,
+    ) -> Iterator[EventWaitResult]:
+        """
+        Polls for the given entities until all of them have completed.  The
+        values of `pending` are the times each entity's event first appeared.
+        Each poll asks for events after the newest one seen so far, and for the
+        incomplete events being watched; entity conditions too many to send at
+        once are split over several requests.
+        """
+        # the IDs of incomplete events, by the entity they're on
+        watched: Dict[int, Tuple[str, int]] = {}
+
+        while pending:
+            api_filter = {
+                "+order": "asc",
+                "+order_by": "id",
+                "+and": [
+                    {
+                        "+or": [{"id": {"+gt": after_id}}]
+                        + [{"id": v} for v in sorted(watched)]
+                    },
+                    {
+                        "+or": [
+                            {"entity.type": t, "entity.id": i}
+                            for t, i in pending
+                        ]
+                    },
+                ],
+            }
+            if action is not None:
+                api_filter["action"] = action
+
+            events = {}
+            for chunk in _split(api_filter, MAX_FILTER_TERMS):
+                events.update(
+                    (e["id"], e) for e in _fetch_events(self.client, chunk)
+                )
+
+            now = time.monotonic()
+
+            for event_id in sorted(events):
+                event = events[event_id]
+                after_id = max(after_id, event_id)
+
+                entity = event.get("entity") or {}
+                key = (entity.get("type"), entity.get("id"))
+
+                if key not in pending:
+                    continue
+
+                if pending[key] is None:
+                    pending[key] = now
+
+                result = EventWaitResult(
+                    key[0],
+                    key[1],
+                    event=Event(self.client, event["id"], json=event),
+                )
+
+                if event["status"] in statuses:
+                    del pending[key]
+                    yield result
+                elif event["status"] == "failed":
+                    result.error = EventError(event["id"], event.get("message"))
+                    del pending[key]
+                    yield result
+                else:
+                    if event["status"] in BUSY_EVENT_STATUSES:
+                        watched[event_id] = key
+                    else:
+                        watched.pop(event_id, None)
+
+                    if isinstance(interval, PollSchedule):
+                        interval.observe(event)
+
+            for key, seen in list(pending.items()):
+                if (
+                    entity_timeout is not None
+                    and seen is not None
+                    and now - seen >= entity_timeout
+                ):
+                    del pending[key]
+                    yield self._timed_out(key)
+
+            watched = {i: k for i, k in watched.items() if k in pending}
+
+            if not pending:
+                return
+
+            if timeout_ctx.expired:
+                for key in list(pending):
+                    del pending[key]
+                    yield self._timed_out(key)
+                return
+
+            step = (
+                interval.current
+                if isinstance(interval, PollSchedule)
+                else interval
+            )
+            time.sleep(max(min(step, timeout_ctx.seconds_remaining), 0))
+
+            if isinstance(interval, PollSchedule):
+                interval.advance()
+
+    @staticmethod
+    def _timed_out(key: Tuple[str, int]) -> EventWaitResult:
+        return EventWaitResult(
+            key[0],
+            key[1],
+            error=polling.TimeoutException(
+                [], "Timed out waiting on {} {}".format(*key)
+            ),
+        )
+
+    def _wait_for_entity_free_hub(
+        self,
+        entity_type: str,
+        entity_id: int,
+        events: List[Dict[str, Any]],
+        after_id: int,
+        timeout_ctx: TimeoutContext,
+        interval: Union[float, PollSchedule],
+    ):
+        """
+        Waits for the given busy events, and any that follow them on the same
+        entity, to complete by watching them through the event hub.
+        """
+        waiting = self._entity_free_check(
+            entity_type, entity_id, events, interval
+        )
+        if waiting is None:
             return
 
-        polling.poll(
-            poll_func,
-            step=interval,
+        check, busy = waiting
+        self.event_hub.wait_for(
+            check,
             timeout=timeout_ctx.seconds_remaining,
+            interval=interval,
+            watch=busy,
+            after_id=after_id,
         )
+
+    @staticmethod
+    def _entity_free_check(
+        entity_type: str,
+        entity_id: int,
+        events: List[Dict[str, Any]],
+        interval: Union[float, PollSchedule],
+    ) -> Optional[Tuple[Callable[[List[Dict[str, Any]]], Any], Set[int]]]:
+        """
+        Returns a check for :meth:`EventHub.wait_for` that passes once the
+        given busy events, and any that follow them on the same entity, have
+        completed, along with the set of events it watches.  Returns None if
+        none of the given events are busy.
+        """
+        busy = {e["id"] for e in events if e["status"] in BUSY_EVENT_STATUSES}
+
+        if not busy:
+            return None
+
+        def check(events: List[Dict[str, Any]]) -> Optional[bool]:
+            for event in events:
+                entity = event.get("entity") or {}
+
+                if (
+                    entity.get("type") != entity_type
+                    or entity.get("id") != entity_id
+                ):
+                    continue
+
+                if event["status"] in BUSY_EVENT_STATUSES:
+                    busy.add(event["id"])
+
+                    if isinstance(interval, PollSchedule):
+                        interval.observe(event)
+                else:
+                    busy.discard(event["id"])
+
+            return True if not busy else None
+
+        return check, busy
@@ -25,6 +25,52 @@ class VolumeGroup(Group):
         """
         return self.client._get_and_filter(Volume, *filters)
 
+    def changed_since(self, since, *filters):
+        """
+        Returns the Volumes that changed at or after the given time, oldest
+        first, along with the newest `updated` timestamp among them; see
+        :any:`ChangedSince`.
+
+        :param since: The time to return changes since, as a datetime or an
+                      API timestamp string.
+        :type since: Union[datetime, str]
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The changed Volumes and the new high-water mark.
+        :rtype: ChangedSince
+        """
+        return self.client._get_changed_since(Volume, since, *filters)
+
+    def count(self, *filters):
+        """
+        Returns the number of Volumes on your account matching the given
+        filters, without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The number of matching Volumes.
+        :rtype: int
+        """
+        return self.client._count(Volume, *filters)
+
+    def exists(self, *filters):
+        """
+        Returns whether any Volumes on your account match the given filters,
+        without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: True if any Volumes match.
+        :rtype: bool
+        """
+        return self.client._exists(Volume, *filters)
+
     def create(self, label, region=None, linode=None, size=20, **kwargs):
         """
         Creates a new Block Storage Volume, either in the given Region or
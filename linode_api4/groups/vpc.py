@@ -29,6 +29,52 @@ class VPCGroup(Group):
         """
         return self.client._get_and_filter(VPC, *filters)
 
+    def changed_since(self, since, *filters):
+        """
+        Returns the VPCs that changed at or after the given time, oldest first,
+        along with the newest `updated` timestamp among them; see
+        :any:`ChangedSince`.
+
+        :param since: The time to return changes since, as a datetime or an
+                      API timestamp string.
+        :type since: Union[datetime, str]
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The changed VPCs and the new high-water mark.
+        :rtype: ChangedSince
+        """
+        return self.client._get_changed_since(VPC, since, *filters)
+
+    def count(self, *filters):
+        """
+        Returns the number of VPCs on your account matching the given filters,
+        without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: The number of matching VPCs.
+        :rtype: int
+        """
+        return self.client._count(VPC, *filters)
+
+    def exists(self, *filters):
+        """
+        Returns whether any VPCs on your account match the given filters,
+        without loading any of them.
+
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+
+        :returns: True if any VPCs match.
+        :rtype: bool
+        """
+        return self.client._exists(VPC, *filters)
+
     def create(
         self,
         label: str,
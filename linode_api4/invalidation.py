@@ -0,0 +1,220 @@
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from linode_api4 import objects
+
+if TYPE_CHECKING:
+    from linode_api4.linode_client import LinodeClient
+    from linode_api4.objects import Base, Event
+    from linode_api4.polling import EventSubscription
+
+#: Maps the entity types found in events to the names of the models they
+#: refer to.
+ENTITY_MODELS: Dict[str, Tuple[str, ...]] = {
+    "linode": ("Instance",),
+    "disk": ("Disk",),
+    "volume": ("Volume",),
+    "image": ("Image",),
+    "domain": ("Domain",),
+    "nodebalancer": ("NodeBalancer",),
+    "lkecluster": ("LKECluster",),
+    "firewall": ("Firewall",),
+    "vpc": ("VPC",),
+    "placement_group": ("PlacementGroup",),
+    "database": ("Database", "MySQLDatabase", "PostgreSQLDatabase"),
+    "stackscript": ("StackScript",),
+    "longviewclient": ("LongviewClient",),
+    "ticket": ("SupportTicket",),
+    "user": ("User",),
+    "tag": ("Tag",),
+}
+
+#: Maps event action prefixes to the names of the derived models an event's
+#: secondary entity refers to, for actions on objects that belong to another.
+#: The entity of these events is the parent object, which they don't change;
+#: its collections of derived objects, such as :any:`Instance.disks`, are
+#: listed again whenever they're read.
+ACTION_MODELS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("disk_", ("Disk",)),
+    ("linode_config_", ("Config",)),
+    ("domain_record_", ("DomainRecord",)),
+    ("nodebalancer_config_", ("NodeBalancerConfig",)),
+    ("nodebalancer_node_", ("NodeBalancerNode",)),
+    ("lke_pool_", ("LKENodePool",)),
+    ("subnet_", ("VPCSubnet",)),
+    ("firewall_device_", ("FirewallDevice",)),
+)
+
+
+def _changed_entities(
+    event: Dict[str, Any],
+) -> List[Tuple[Tuple[str, ...], Optional[Dict[str, Any]]]]:
+    """
+    Returns the names of the models each entity the given event changed may
+    be, along with the entity.  For actions on derived objects, only the
+    derived object is changed, and the entity is None if the event doesn't
+    name it.
+    """
+    action = event.get("action") or ""
+    entity = event.get("entity")
+    secondary = event.get("secondary_entity")
+
+    derived = next(
+        (names for prefix, names in ACTION_MODELS if action.startswith(prefix)),
+        None,
+    )
+
+    if derived is not None:
+        if secondary:
+            derived = ENTITY_MODELS.get(secondary.get("type"), ()) + derived
+        return [(derived, secondary or None)]
+
+    return [
+        (ENTITY_MODELS.get(e.get("type"), ()), e)
+        for e in (entity, secondary)
+        if e
+    ]
+
+
+def _entity_key(entity_id: Any) -> str:
+    """
+    Returns the key objects with the given ID are tracked by.  Events refer to
+    private Images by the numeric part of their ID, so only that is used.
+    """
+    return str(entity_id).split("/")[-1]
+
+
+class Invalidator:
+    """
+    Invalidator keeps models an application holds on to up to date by
+    invalidating them as events on the account report changes to them, so that
+    their next access re-fetches them.  Models that haven't changed are never
+    re-fetched, however long they're held.
+
+    Models must be tracked to be invalidated::
+
+        invalidator = Invalidator(client)
+        instances = invalidator.track(*client.linode.instances())
+
+        with invalidator.subscribe():
+            ...
+
+    Each event invalidates the tracked models it changed, as decided by
+    :any:`ENTITY_MODELS` and :any:`ACTION_MODELS`.  Events on derived objects
+    only invalidate those objects; for example, a ``disk_create`` event
+    invalidates the new :any:`Disk` if it's tracked, but not the
+    :any:`Instance` it names, whose own fields haven't changed.  Invalidated
+    models also forget the related objects they've loaded, such as a
+    :any:`Volume`'s ``linode``, in case the relationship changed.
+
+    Models are tracked by weak reference, and are forgotten once the
+    application no longer uses them.
+    """
+
+    def __init__(self, client: "LinodeClient"):
+        self._client = client
+        self._objects: Dict[str, "weakref.WeakSet[Base]"] = {}
+        self._lock = threading.Lock()
+
+    def track(self, *models: "Base") -> List["Base"]:
+        """
+        Invalidates the given models when events report changes to them.
+
+        :param models: The models to track.
+        :type models: Base
+
+        :returns: The given models.
+        :rtype: List[Base]
+        """
+        with self._lock:
+            for model in models:
+                self._objects.setdefault(
+                    _entity_key(model.id), weakref.WeakSet()
+                ).add(model)
+
+        return list(models)
+
+    @property
+    def tracked(self) -> int:
+        """
+        The number of models currently tracked.
+        """
+        with self._lock:
+            return sum(len(s) for s in self._objects.values())
+
+    def apply(self, event: Union["Event", Dict[str, Any]]) -> List["Base"]:
+        """
+        Invalidates the tracked models referred to by the given event.  This
+        is called for each completed event by a subscription from
+        :meth:`subscribe`, but may also be called with events obtained
+        elsewhere.
+
+        :param event: The event, or its JSON.
+        :type event: Union[Event, Dict[str, Any]]
+
+        :returns: The models that were invalidated.
+        :rtype: List[Base]
+        """
+        if isinstance(event, objects.Base):
+            event = event._raw_json
+
+        invalidated = []
+
+        for names, entity in _changed_entities(event):
+            if entity is None:
+                continue
+
+            classes = tuple(
+                cls
+                for cls in (getattr(objects, n, None) for n in names)
+                if cls is not None
+            )
+
+            if not classes or entity.get("id") is None:
+                continue
+
+            with self._lock:
+                models = list(self._objects.get(_entity_key(entity["id"]), ()))
+
+            for model in models:
+                if isinstance(model, classes):
+                    model.invalidate()
+                    self._forget_related(model)
+                    invalidated.append(model)
+
+        return invalidated
+
+    @staticmethod
+    def _forget_related(model: "Base"):
+        """
+        Drops the related objects the given model has loaded through its ID
+        relationships, which are kept apart from its Properties.
+        """
+        for name in [k for k in vars(model) if k.endswith("_relcache")]:
+            object.__delattr__(model, name)
+
+    def subscribe(
+        self, interval: float = 5, after_id: Optional[int] = None
+    ) -> "EventSubscription":
+        """
+        Starts applying the account's events as they complete, from a
+        background thread, until the returned subscription is stopped.
+
+        :param interval: How long to wait in seconds between polls of the
+                         event feed.
+        :type interval: float
+        :param after_id: If given, events after this event ID are applied,
+                         rather than only events created after this is called.
+        :type after_id: int
+
+        :returns: The running subscription.
+        :rtype: EventSubscription
+        """
+        return self._client.polling.subscribe(
+            self.apply,
+            status=["finished", "failed", "notification"],
+            interval=interval,
+            workers=1,
+            after_id=after_id,
+        )
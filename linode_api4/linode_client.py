@@ -1,49 +1,122 @@
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import lru_cache, reduce
 from importlib.metadata import version
-from typing import BinaryIO, List, Optional, Tuple
+from typing import TYPE_CHECKING, BinaryIO, List, Optional, Tuple
 from urllib import parse
 
 import requests
-from requests.adapters import HTTPAdapter, Retry
+from requests.adapters import (
+    DEFAULT_POOLBLOCK,
+    DEFAULT_POOLSIZE,
+    HTTPAdapter,
+    Retry,
+)
 
 from linode_api4.errors import ApiError, UnexpectedResponseError
-from linode_api4.groups import (
-    AccountGroup,
-    BetaProgramGroup,
-    DatabaseGroup,
-    DomainGroup,
-    ImageGroup,
-    ImageShareGroupAPIGroup,
-    LinodeGroup,
-    LKEGroup,
-    LockGroup,
-    LongviewGroup,
-    MaintenanceGroup,
-    MetricsGroup,
-    MonitorGroup,
-    NetworkingGroup,
-    NodeBalancerGroup,
-    ObjectStorageGroup,
-    PollingGroup,
-    ProfileGroup,
-    RegionGroup,
-    SupportGroup,
-    TagGroup,
-    VolumeGroup,
-    VPCGroup,
+from linode_api4.objects.base import DATE_FORMAT
+from linode_api4.objects.filtering import (
+    Filter,
+    _flatten,
+    _pop_ordering,
+    _split,
+    and_,
 )
-from linode_api4.objects import Image, and_
 
-from .groups.placement import PlacementAPIGroup
-from .paginated_list import PaginatedList
+from .batch import BatchExecutor
+from .cache import cache_key
+from .paginated_list import (
+    AdaptivePageSize,
+    ChangedSince,
+    PaginatedList,
+    _current_page_size,
+    _initial_page_size,
+    _observer,
+    _resolve_page_size,
+)
+from .query import Query
+from .scheduler import RequestScheduler, _current_priority
 
-package_version = version("linode_api4")
+if TYPE_CHECKING:
+    from linode_api4.objects import Image
 
 logger = logging.getLogger(__name__)
 
+#: The most objects :meth:`BaseClient.refresh` requests in one filter.
+REFRESH_CHUNK_SIZE = 100
+
+#: The most conditions sent in one "+or" filter.  Collections filtered on a
+#: larger "+or" are requested in several parts, whose results are merged.
+MAX_FILTER_TERMS = 100
+
+#: The most parts of a split filter requested at once.
+FILTER_CHUNK_WORKERS = 4
+
+#: The page size requested when only counting a collection; this is the
+#: smallest the API accepts.
+COUNT_PAGE_SIZE = 25
+
+
+@lru_cache(maxsize=None)
+def _package_version() -> str:
+    """
+    Returns the installed version of this package.  This is looked up the
+    first time a request is made rather than at import time, as reading the
+    package metadata is comparatively slow.
+    """
+    return version("linode_api4")
+
+
+def __getattr__(name):
+    # package_version and the group classes used to be imported eagerly into
+    # this module; they're still importable from here for compatibility.
+    if name == "package_version":
+        return _package_version()
+
+    from linode_api4 import groups
+
+    if not name.startswith("_") and name.endswith("Group"):
+        try:
+            return getattr(groups, name)
+        except AttributeError:
+            pass
+
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name)
+    )
+
+
+class _LazyGroup:
+    """
+    Creates one of a client's groups, such as :any:`LinodeGroup`, the first
+    time it is accessed.  This defers importing the group and the models it
+    uses until they're needed.
+    """
+
+    def __init__(self, group_class: str):
+        self.group_class = group_class
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+
+        from linode_api4 import groups
+
+        group = getattr(groups, self.group_class)(client)
+
+        # this is a non-data descriptor, so the group stored on the client
+        # is found directly on every later access
+        return client.__dict__.setdefault(self.name, group)
+
 
 class LinearRetry(Retry):
     """
@@ -74,8 +147,10 @@ class BaseClient:
     :param page_size: The default size to request pages at.  If not given,
                               the API's default page size is used.  Valid values
                               can be found in the API docs, but at time of writing
-                              are between 25 and 500.
-    :type page_size: int
+                              are between 25 and 500.  An :any:`AdaptivePageSize`
+                              may be given to grow pages as collections are
+                              iterated over.
+    :type page_size: Union[int, AdaptivePageSize]
     :param retry: Whether API requests should automatically be retries on known
                   intermittent responses.
     :type retry: bool
@@ -91,6 +166,42 @@ class BaseClient:
                            responses.
     :param ca_path: The path to a CA file to use for API requests in this client.
     :type ca_path: str
+    :param pool_connections: The number of connection pools to cache, one per
+                             host this client talks to.
+    :type pool_connections: int
+    :param pool_maxsize: The maximum number of connections to keep open to a
+                         single host.  This should be at least the number of
+                         threads sharing this client.
+    :type pool_maxsize: int
+    :param pool_block: Whether requests should wait for a free connection when
+                       the pool is exhausted instead of opening a connection
+                       that is discarded once the request completes.
+    :type pool_block: bool
+    :param max_concurrent_requests: If given, the maximum number of requests this
+                                    client will have in flight at once.  Waiting
+                                    requests are sent in order of their priority
+                                    class; see :meth:`priority`.
+    :type max_concurrent_requests: int
+    :param priority_classes: The priority classes requests may be made in, by
+                             name.  Defaults to an "interactive" class that
+                             requests are made in by default, and a lower
+                             weighted "background" class.  Requires
+                             `max_concurrent_requests`.
+    :type priority_classes: Dict[str, PriorityClass]
+    :param default_priority: The priority class requests are made in outside
+                             of a :meth:`priority` block.  Defaults to
+                             "interactive" if that class is defined, and
+                             otherwise to the class with the highest weight.
+                             Requires `max_concurrent_requests`.
+    :type default_priority: str
+    :param staleness_policy: When the volatile properties of models loaded
+                             through this client are re-fetched, either for
+                             all models or as a dict of policies by model
+                             class.  See :any:`Base.staleness_policy`.
+    :type staleness_policy: Union[StalenessPolicy, Dict[type, StalenessPolicy]]
+    :param query_cache: If given, the results of listing collections are kept
+                        in this cache and reused for identical requests.
+    :type query_cache: QueryCache
     """
 
     def __init__(
@@ -104,12 +215,42 @@ class BaseClient:
         retry_max=5,
         retry_statuses=None,
         ca_path=None,
+        pool_connections=DEFAULT_POOLSIZE,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        pool_block=DEFAULT_POOLBLOCK,
+        max_concurrent_requests=None,
+        priority_classes=None,
+        default_priority=None,
+        staleness_policy=None,
+        query_cache=None,
     ):
         self.base_url = base_url
         self._add_user_agent = user_agent
         self.token = token
         self.page_size = page_size
         self.ca_path = ca_path
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.staleness_policy = staleness_policy
+        self.query_cache = query_cache
+
+        for name, value in (
+            ("priority_classes", priority_classes),
+            ("default_priority", default_priority),
+        ):
+            if value is not None and max_concurrent_requests is None:
+                raise ValueError(
+                    "{} requires max_concurrent_requests to be set".format(name)
+                )
+
+        self.scheduler = None
+        if max_concurrent_requests is not None:
+            self.scheduler = RequestScheduler(
+                max_concurrent_requests,
+                classes=priority_classes,
+                default=default_priority,
+            )
 
         retry_forcelist = [408, 429, 502]
 
@@ -138,7 +279,12 @@ class BaseClient:
             # We should explicitly include it.
             allowed_methods={"DELETE", "GET", "POST", "PUT"},
         )
-        retry_adapter = HTTPAdapter(max_retries=self._retry_config)
+        retry_adapter = HTTPAdapter(
+            max_retries=self._retry_config,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
 
         self.session.mount("http://", retry_adapter)
         self.session.mount("https://", retry_adapter)
@@ -147,10 +293,132 @@ class BaseClient:
     def _user_agent(self):
         return "{}python-linode_api4/{} {}".format(
             "{} ".format(self._add_user_agent) if self._add_user_agent else "",
-            package_version,
+            _package_version(),
             requests.utils.default_user_agent(),
         )
 
+    def preconnect(self, connections=1):
+        """
+        Opens connections to the API ahead of time so that the first requests
+        made by this client don't pay for the TCP and TLS handshakes.  The
+        opened connections are returned to this client's connection pool and
+        are reused by subsequent requests.
+
+        This is useful for short-lived processes and for applications that
+        share this client across many threads::
+
+           client = LinodeClient(token, pool_maxsize=64)
+           client.preconnect(connections=64)
+
+        :param connections: The number of connections to open.  This is capped
+                            at this client's `pool_maxsize`.
+        :type connections: int
+        """
+        connections = max(1, min(connections, self.pool_maxsize))
+
+        def connect(_):
+            self.session.head(
+                self.base_url,
+                headers={"User-Agent": self._user_agent},
+                verify=self.ca_path or self.session.verify,
+            )
+
+        if connections == 1:
+            connect(None)
+            return
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(connect, range(connections)))
+
+    @contextmanager
+    def priority(self, name):
+        """
+        A context manager that makes all requests in its block in the given
+        priority class.  This lets latency-sensitive requests skip ahead of bulk
+        work sharing the same client::
+
+           client = LinodeClient(token, max_concurrent_requests=8)
+
+           with client.priority("background"):
+               for instance in client.linode.instances():
+                   sync(instance)
+
+        Priorities apply to the current thread or asyncio task, and to items run
+        by a :meth:`batch` started within the block.  If this client was created
+        without `max_concurrent_requests`, requests are not queued and this has
+        no effect.
+
+        :param name: The name of the priority class to make requests in.
+        :type name: str
+        """
+        if self.scheduler is not None:
+            self.scheduler.validate(name)
+
+        token = _current_priority.set(name)
+        try:
+            yield
+        finally:
+            _current_priority.reset(token)
+
+    @contextmanager
+    def paging(self, page_size):
+        """
+        A context manager that makes collections listed in its block use the
+        given page size instead of this client's `page_size`.  Collections keep
+        the page size they were listed with when more of their pages are
+        loaded later::
+
+           client = LinodeClient(token, page_size=AdaptivePageSize())
+
+           # only the first few results are needed here
+           with client.paging(25):
+               recent = client.account.events()[:10]
+
+        :param page_size: The page size to use, or an :any:`AdaptivePageSize`.
+        :type page_size: Union[int, AdaptivePageSize]
+        """
+        token = _current_page_size.set(page_size)
+        try:
+            yield
+        finally:
+            _current_page_size.reset(token)
+
+    def batch(
+        self, max_workers=8, rate=None, fail_fast=False, progress=None
+    ) -> BatchExecutor:
+        """
+        Returns a :any:`BatchExecutor` that runs many operations concurrently
+        using this client.  For example, to reboot all Linodes in a group::
+
+           results = client.batch(max_workers=16, rate=10).run(
+               (instance, "reboot")
+               for instance in client.linode.instances(Instance.group == "prod")
+           )
+
+        :param max_workers: The maximum number of items to run at once.  This
+                            should not exceed this client's `pool_maxsize`.
+        :type max_workers: int
+        :param rate: If given, the maximum number of items to start per second.
+        :type rate: float
+        :param fail_fast: If True, items that have not started when an item
+                          fails are skipped and marked as cancelled.
+        :type fail_fast: bool
+        :param progress: A function called with each :any:`BatchResult`, the
+                         number of completed items, and the total number of
+                         items as each item completes.
+        :type progress: Callable[[BatchResult, int, int], None]
+
+        :returns: The new BatchExecutor.
+        :rtype: BatchExecutor
+        """
+        return BatchExecutor(
+            self,
+            max_workers=max_workers,
+            rate=rate,
+            fail_fast=fail_fast,
+            progress=progress,
+        )
+
     def load(self, target_type, target_id, target_parent_id=None):
         """
         Constructs and immediately loads the object, circumventing the
@@ -186,12 +454,99 @@ class BaseClient:
 
         return result
 
+    def query(self, model):
+        """
+        Returns a :any:`Query` for the given type of object, which can be
+        filtered on any of its properties, ordered and limited before it's
+        iterated over::
+
+           for instance in client.query(Instance).where(status="offline"):
+               print(instance.label)
+
+        :param model: The type of object to query.  This must be a top-level
+                      collection, such as :any:`Instance` or :any:`Volume`.
+        :type model: type
+
+        :returns: A query for every object of this type.
+        :rtype: Query
+        """
+        return Query(self, model)
+
+    def refresh(self, objects, stale_only=True):
+        """
+        Re-populates many objects with one list request per type, rather than
+        one request per object.  For example, a status dashboard can refresh
+        every stale Instance before rendering::
+
+           client.refresh(instances)
+
+           for instance in instances:
+               print(instance.label, instance.status)
+
+        :param objects: The objects to refresh.
+        :type objects: Iterable[Base]
+        :param stale_only: If True, only objects that are unpopulated or whose
+                           volatile properties are stale under their
+                           :any:`StalenessPolicy` are refreshed.
+        :type stale_only: bool
+
+        :returns: The objects that were refreshed.
+        :rtype: List[Base]
+        """
+        groups = {}
+
+        for obj in objects:
+            if stale_only and not obj._is_stale():
+                continue
+
+            cls = type(obj)
+            parent_id = vars(obj).get(getattr(cls, "parent_id_name", None))
+            groups.setdefault((cls, parent_id), []).append(obj)
+
+        refreshed = []
+
+        for (cls, _), group in groups.items():
+            id_attribute = getattr(cls, "id_attribute", "id")
+
+            for start in range(0, len(group), REFRESH_CHUNK_SIZE):
+                chunk = group[start : start + REFRESH_CHUNK_SIZE]
+                by_id = {}
+                for obj in chunk:
+                    by_id.setdefault(obj.id, []).append(obj)
+
+                filters = {"+or": [{id_attribute: i} for i in by_id]}
+                page, pages = 1, 1
+
+                while page <= pages:
+                    result = self.get(
+                        "{}?page={}".format(cls.api_list(), page),
+                        model=chunk[0],
+                        filters=filters,
+                    )
+
+                    for item in result["data"]:
+                        for obj in by_id.pop(item.get(id_attribute), []):
+                            obj._populate(item)
+                            refreshed.append(obj)
+
+                    pages = result.get("pages", 1)
+                    page += 1
+
+        return refreshed
+
     def _api_call(
-        self, endpoint, model=None, method=None, data=None, filters=None
+        self,
+        endpoint,
+        model=None,
+        method=None,
+        data=None,
+        filters=None,
+        observe=None,
     ):
         """
         Makes a call to the linode api.  Data should only be given if the method is
-        POST or PUT, and should be a dictionary
+        POST or PUT, and should be a dictionary.  If given, observe is called with
+        the response and its parsed body.
         """
         if not self.token:
             raise RuntimeError("You do not have an API token!")
@@ -218,12 +573,17 @@ class BaseClient:
         if data is not None:
             body = json.dumps(data)
 
-        response = method(
-            url,
-            headers=headers,
-            data=body,
-            verify=self.ca_path or self.session.verify,
-        )
+        with (
+            self.scheduler.slot(_current_priority.get())
+            if self.scheduler is not None
+            else nullcontext()
+        ):
+            response = method(
+                url,
+                headers=headers,
+                data=body,
+                verify=self.ca_path or self.session.verify,
+            )
 
         warning = response.headers.get("Warning", None)
         if warning:
@@ -233,22 +593,84 @@ class BaseClient:
         if api_error is not None:
             raise api_error
 
+        # Anything this client changes is listed again on its next request
+        if self.query_cache is not None and method != self.session.get:
+            self.query_cache.invalidate(endpoint=endpoint.split("?")[0])
+
         if response.status_code != 204:
             j = response.json()
         else:
             j = None  # handle no response body
 
+        if observe is not None:
+            observe(response, j)
+
         return j
 
     def _get_objects(
-        self, endpoint, cls, model=None, parent_id=None, filters=None
+        self,
+        endpoint,
+        cls,
+        model=None,
+        parent_id=None,
+        filters=None,
+        use_cache=True,
     ):
+        formatted_endpoint = endpoint
+        if model:
+            formatted_endpoint = formatted_endpoint.format(**vars(model))
+
         # handle non-default page sizes
+        policy = _resolve_page_size(self)
+        page_size = _initial_page_size(policy)
+
         call_endpoint = endpoint
-        if self.page_size is not None:
-            call_endpoint += "?page_size={}".format(self.page_size)
+        if page_size is not None:
+            call_endpoint += "?page_size={}".format(page_size)
 
-        response_json = self.get(call_endpoint, model=model, filters=filters)
+        cache = self.query_cache if use_cache else None
+        if cache is not None:
+            key = cache_key(
+                "{} {}".format(formatted_endpoint, page_size), filters
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                # callers each get their own list over the cached pages
+                if isinstance(cached, PaginatedList):
+                    return cached._view()
+                return list(cached)
+
+        result = self._list_objects(
+            call_endpoint,
+            formatted_endpoint,
+            cls,
+            model=model,
+            parent_id=parent_id,
+            filters=filters,
+            page_size_policy=policy,
+        )
+
+        if cache is not None:
+            cache.put(key, result, cls, endpoint=formatted_endpoint)
+
+        return result
+
+    def _list_objects(
+        self,
+        call_endpoint,
+        formatted_endpoint,
+        cls,
+        model=None,
+        parent_id=None,
+        filters=None,
+        page_size_policy=None,
+    ):
+        adaptive = isinstance(page_size_policy, AdaptivePageSize)
+        kwargs = {"observe": _observer(page_size_policy)} if adaptive else {}
+
+        response_json = self.get(
+            call_endpoint, model=model, filters=filters, **kwargs
+        )
 
         if not "data" in response_json:
             raise UnexpectedResponseError(
@@ -256,9 +678,6 @@ class BaseClient:
             )
 
         if "pages" in response_json:
-            formatted_endpoint = endpoint
-            if model:
-                formatted_endpoint = formatted_endpoint.format(**vars(model))
             return PaginatedList.make_paginated_list(
                 response_json,
                 self,
@@ -266,6 +685,7 @@ class BaseClient:
                 parent_id=parent_id,
                 page_url=formatted_endpoint[1:],
                 filters=filters,
+                page_size_policy=page_size_policy if adaptive else None,
             )
         return PaginatedList.make_list(
             response_json["data"], self, cls, parent_id=parent_id
@@ -316,28 +736,237 @@ class BaseClient:
     ):
         parsed_filters = None
         if filters:
-            if len(filters) > 1:
-                parsed_filters = and_(
-                    *filters
-                ).dct  # pylint: disable=no-value-for-parameter
-            else:
-                parsed_filters = filters[0].dct
+            parsed_filters = _flatten(reduce(and_, filters).dct)
 
         # Use sepcified endpoint
-        if endpoint:
-            return self._get_objects(
-                endpoint, obj_type, parent_id=parent_id, filters=parsed_filters
+        if not endpoint:
+            endpoint = obj_type.api_list()
+
+        chunks = _split(parsed_filters, MAX_FILTER_TERMS) if filters else []
+        if len(chunks) > 1:
+            return self._get_chunked(
+                endpoint,
+                obj_type,
+                chunks,
+                parent_id=parent_id,
+                filters=parsed_filters,
             )
-        else:
-            return self._get_objects(
+
+        return self._get_objects(
+            endpoint, obj_type, parent_id=parent_id, filters=parsed_filters
+        )
+
+    def _count(self, obj_type, *filters, endpoint=None):
+        """
+        Returns the number of objects of the given type matching the given
+        filters.  Only the smallest page the API allows is requested, and only
+        its envelope is read, so no objects are created.
+        """
+        parsed_filters = None
+        if filters:
+            parsed_filters = _flatten(reduce(and_, filters).dct)
+
+            if len(_split(parsed_filters, MAX_FILTER_TERMS)) > 1:
+                # the parts of a split filter may match the same objects, so
+                # they have to be listed to be counted
+                return len(
+                    self._get_and_filter(obj_type, *filters, endpoint=endpoint)
+                )
+
+        result = self.get(
+            "{}?page=1&page_size={}".format(
+                endpoint or obj_type.api_list(), COUNT_PAGE_SIZE
+            ),
+            filters=parsed_filters,
+        )
+
+        if "results" in result:
+            return result["results"]
+
+        if "data" not in result:
+            raise UnexpectedResponseError("Problem with response!", json=result)
+
+        return len(result["data"])
+
+    def _exists(self, obj_type, *filters, endpoint=None):
+        """
+        Returns whether any objects of the given type match the given filters,
+        as counted by :meth:`_count`.
+        """
+        return self._count(obj_type, *filters, endpoint=endpoint) > 0
+
+    def _get_chunked(
+        self, endpoint, obj_type, chunks, parent_id=None, filters=None
+    ):
+        """
+        Requests every page of each of the given filters at once, and returns
+        their combined results as one list, without duplicates and in the order
+        and up to the limit the filters ask for.  This is used for filters too
+        large to send in one request; see :func:`_split`.  The chunks are kept
+        with the returned list for :meth:`PaginatedList.resumable`.
+        """
+
+        def fetch(chunk):
+            return list(
+                self._get_objects(
+                    endpoint, obj_type, parent_id=parent_id, filters=chunk
+                )
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(chunks), FILTER_CHUNK_WORKERS)
+        ) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, fetch, c)
+                for c in chunks
+            ]
+            results = [f.result() for f in futures]
+
+        merged = []
+        seen = set()
+
+        for obj in (o for result in results for o in result):
+            key = getattr(obj, "id", None)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+
+            merged.append(obj)
+
+        _, ordering = _pop_ordering(chunks[0])
+
+        if ordering:
+            merged = Filter(ordering).apply(merged)
+
+        return PaginatedList(
+            self,
+            endpoint[1:],
+            page=merged,
+            total_items=len(merged),
+            parent_id=parent_id,
+            filters=filters,
+            filter_chunks=chunks,
+        )
+
+    def _get_changed_since(self, obj_type, since, *filters):
+        """
+        Returns the objects of the given type whose `updated` timestamp is at
+        or after the given time, oldest first, along with the newest timestamp
+        among them.  Objects updated at exactly `since` are included because
+        timestamps only have second precision, so something updated in the
+        same second as the previous high-water mark isn't missed.
+        """
+        if isinstance(since, datetime):
+            since = since.strftime(DATE_FORMAT)
+
+        # changes are always listed oldest first, though a limit is kept
+        parsed_filters, ordering = _pop_ordering(
+            _flatten(
+                reduce(
+                    and_, filters + (Filter({"updated": {"+gte": since}}),)
+                ).dct
+            )
+        )
+        parsed_filters.update({"+order_by": "updated", "+order": "asc"})
+        if "+limit" in ordering:
+            parsed_filters["+limit"] = ordering["+limit"]
+
+        changed = list(
+            self._get_objects(
                 obj_type.api_list(),
                 obj_type,
-                parent_id=parent_id,
                 filters=parsed_filters,
+                use_cache=False,
             )
+        )
+
+        high_water_mark = max(
+            [since] + [o._raw_json.get("updated") or since for o in changed]
+        )
+
+        return ChangedSince(
+            changed, datetime.strptime(high_water_mark, DATE_FORMAT)
+        )
 
 
 class LinodeClient(BaseClient):
+    #: Access methods related to Linodes - see :any:`LinodeGroup` for
+    #: more information
+    linode = _LazyGroup("LinodeGroup")
+
+    #: Access methods related to your user - see :any:`ProfileGroup` for
+    #: more information
+    profile = _LazyGroup("ProfileGroup")
+
+    #: Access methods related to your account - see :any:`AccountGroup` for
+    #: more information
+    account = _LazyGroup("AccountGroup")
+
+    #: Access methods related to networking on your account - see
+    #: :any:`NetworkingGroup` for more information
+    networking = _LazyGroup("NetworkingGroup")
+
+    #: Access methods related to maintenance on your account - see
+    #: :any:`MaintenanceGroup` for more information
+    maintenance = _LazyGroup("MaintenanceGroup")
+
+    #: Access methods related to support - see :any:`SupportGroup` for more
+    #: information
+    support = _LazyGroup("SupportGroup")
+
+    #: Access information related to the Longview service - see
+    #: :any:`LongviewGroup` for more information
+    longview = _LazyGroup("LongviewGroup")
+
+    #: Access methods related to Object Storage - see :any:`ObjectStorageGroup`
+    #: for more information
+    object_storage = _LazyGroup("ObjectStorageGroup")
+
+    #: Access methods related to LKE - see :any:`LKEGroup` for more information.
+    lke = _LazyGroup("LKEGroup")
+
+    #: Access methods related to Managed Databases - see :any:`DatabaseGroup` for more information.
+    database = _LazyGroup("DatabaseGroup")
+
+    #: Access methods related to NodeBalancers - see :any:`NodeBalancerGroup` for more information.
+    nodebalancers = _LazyGroup("NodeBalancerGroup")
+
+    #: Access methods related to Domains - see :any:`DomainGroup` for more information.
+    domains = _LazyGroup("DomainGroup")
+
+    #: Access methods related to Tags - See :any:`TagGroup` for more information.
+    tags = _LazyGroup("TagGroup")
+
+    #: Access methods related to Volumes - See :any:`VolumeGroup` for more information.
+    volumes = _LazyGroup("VolumeGroup")
+
+    #: Access methods related to Regions - See :any:`RegionGroup` for more information.
+    regions = _LazyGroup("RegionGroup")
+
+    #: Access methods related to Images - See :any:`ImageGroup` for more information.
+    images = _LazyGroup("ImageGroup")
+
+    #: Access methods related to Image Share Groups - See :any:`ImageShareGroupAPIGroup` for more information.
+    sharegroups = _LazyGroup("ImageShareGroupAPIGroup")
+
+    #: Access methods related to VPCs - See :any:`VPCGroup` for more information.
+    vpcs = _LazyGroup("VPCGroup")
+
+    #: Access methods related to Event polling - See :any:`PollingGroup` for more information.
+    polling = _LazyGroup("PollingGroup")
+
+    #: Access methods related to Beta Program - See :any:`BetaProgramGroup` for more information.
+    beta = _LazyGroup("BetaProgramGroup")
+
+    #: Access methods related to VM placement - See :any:`PlacementAPIGroup` for more information.
+    placement = _LazyGroup("PlacementAPIGroup")
+
+    monitor = _LazyGroup("MonitorGroup")
+
+    #: Access methods related to Resource Locks - See :any:`LockGroup` for more information.
+    locks = _LazyGroup("LockGroup")
+
     def __init__(
         self,
         token,
@@ -349,6 +978,14 @@ class LinodeClient(BaseClient):
         retry_max=5,
         retry_statuses=None,
         ca_path=None,
+        pool_connections=DEFAULT_POOLSIZE,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        pool_block=DEFAULT_POOLBLOCK,
+        max_concurrent_requests=None,
+        priority_classes=None,
+        default_priority=None,
+        staleness_policy=None,
+        query_cache=None,
     ):
         """
         The main interface to the Linode API.
@@ -368,8 +1005,10 @@ class LinodeClient(BaseClient):
         :param page_size: The default size to request pages at.  If not given,
                                   the API's default page size is used.  Valid values
                                   can be found in the API docs, but at time of writing
-                                  are between 25 and 500.
-        :type page_size: int
+                                  are between 25 and 500.  An :any:`AdaptivePageSize`
+                                  may be given to grow pages as collections are
+                                  iterated over.
+        :type page_size: Union[int, AdaptivePageSize]
         :param retry: Whether API requests should automatically be retries on known
                       intermittent responses.
         :type retry: bool
@@ -385,83 +1024,44 @@ class LinodeClient(BaseClient):
                                responses.
         :param ca_path: The path to a CA file to use for API requests in this client.
         :type ca_path: str
+        :param pool_connections: The number of connection pools to cache, one per
+                                 host this client talks to.
+        :type pool_connections: int
+        :param pool_maxsize: The maximum number of connections to keep open to a
+                             single host.  This should be at least the number of
+                             threads sharing this client.
+        :type pool_maxsize: int
+        :param pool_block: Whether requests should wait for a free connection when
+                           the pool is exhausted instead of opening a connection
+                           that is discarded once the request completes.
+        :type pool_block: bool
+        :param max_concurrent_requests: If given, the maximum number of requests this
+                                        client will have in flight at once.  Waiting
+                                        requests are sent in order of their priority
+                                        class; see :meth:`priority`.
+        :type max_concurrent_requests: int
+        :param priority_classes: The priority classes requests may be made in, by
+                                 name.  Defaults to an "interactive" class that
+                                 requests are made in by default, and a lower
+                                 weighted "background" class.  Requires
+                                 `max_concurrent_requests`.
+        :type priority_classes: Dict[str, PriorityClass]
+        :param default_priority: The priority class requests are made in outside
+                                 of a :meth:`priority` block.  Defaults to
+                                 "interactive" if that class is defined, and
+                                 otherwise to the class with the highest weight.
+                                 Requires `max_concurrent_requests`.
+        :type default_priority: str
+        :param staleness_policy: When the volatile properties of models loaded
+                                 through this client are re-fetched, either for
+                                 all models or as a dict of policies by model
+                                 class.  See :any:`Base.staleness_policy`.
+        :type staleness_policy: Union[StalenessPolicy, Dict[type, StalenessPolicy]]
+        :param query_cache: If given, the results of listing collections are
+                            kept in this cache and reused for identical
+                            requests.  See :any:`QueryCache`.
+        :type query_cache: QueryCache
         """
-        #: Access methods related to Linodes - see :any:`LinodeGroup` for
-        #: more information
-        self.linode = LinodeGroup(self)
-
-        #: Access methods related to your user - see :any:`ProfileGroup` for
-        #: more information
-        self.profile = ProfileGroup(self)
-
-        #: Access methods related to your account - see :any:`AccountGroup` for
-        #: more information
-        self.account = AccountGroup(self)
-
-        #: Access methods related to networking on your account - see
-        #: :any:`NetworkingGroup` for more information
-        self.networking = NetworkingGroup(self)
-
-        #: Access methods related to maintenance on your account - see
-        #: :any:`MaintenanceGroup` for more information
-        self.maintenance = MaintenanceGroup(self)
-
-        #: Access methods related to support - see :any:`SupportGroup` for more
-        #: information
-        self.support = SupportGroup(self)
-
-        #: Access information related to the Longview service - see
-        #: :any:`LongviewGroup` for more information
-        self.longview = LongviewGroup(self)
-
-        #: Access methods related to Object Storage - see :any:`ObjectStorageGroup`
-        #: for more information
-        self.object_storage = ObjectStorageGroup(self)
-
-        #: Access methods related to LKE - see :any:`LKEGroup` for more information.
-        self.lke = LKEGroup(self)
-
-        #: Access methods related to Managed Databases - see :any:`DatabaseGroup` for more information.
-        self.database = DatabaseGroup(self)
-
-        #: Access methods related to NodeBalancers - see :any:`NodeBalancerGroup` for more information.
-        self.nodebalancers = NodeBalancerGroup(self)
-
-        #: Access methods related to Domains - see :any:`DomainGroup` for more information.
-        self.domains = DomainGroup(self)
-
-        #: Access methods related to Tags - See :any:`TagGroup` for more information.
-        self.tags = TagGroup(self)
-
-        #: Access methods related to Volumes - See :any:`VolumeGroup` for more information.
-        self.volumes = VolumeGroup(self)
-
-        #: Access methods related to Regions - See :any:`RegionGroup` for more information.
-        self.regions = RegionGroup(self)
-
-        #: Access methods related to Images - See :any:`ImageGroup` for more information.
-        self.images = ImageGroup(self)
-
-        #: Access methods related to Image Share Groups - See :any:`ImageShareGroupAPIGroup` for more information.
-        self.sharegroups = ImageShareGroupAPIGroup(self)
-
-        #: Access methods related to VPCs - See :any:`VPCGroup` for more information.
-        self.vpcs = VPCGroup(self)
-
-        #: Access methods related to Event polling - See :any:`PollingGroup` for more information.
-        self.polling = PollingGroup(self)
-
-        #: Access methods related to Beta Program - See :any:`BetaProgramGroup` for more information.
-        self.beta = BetaProgramGroup(self)
-
-        #: Access methods related to VM placement - See :any:`PlacementAPIGroup` for more information.
-        self.placement = PlacementAPIGroup(self)
-
-        self.monitor = MonitorGroup(self)
-
-        #: Access methods related to Resource Locks - See :any:`LockGroup` for more information.
-        self.locks = LockGroup(self)
-
         super().__init__(
             token=token,
             base_url=base_url,
@@ -472,6 +1072,14 @@ class LinodeClient(BaseClient):
             retry_max=retry_max,
             retry_statuses=retry_statuses,
             ca_path=ca_path,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_concurrent_requests=max_concurrent_requests,
+            priority_classes=priority_classes,
+            default_priority=default_priority,
+            staleness_policy=staleness_policy,
+            query_cache=query_cache,
         )
 
     def image_create(self, disk, label=None, description=None, tags=None):
@@ -591,8 +1199,33 @@ class MonitorClient(BaseClient):
     :type page_size: int
     :param ca_path: The path to a CA file to use for API requests in this client.
         :type ca_path: str
+    :param pool_connections: The number of connection pools to cache, one per
+                             host this client talks to.
+    :type pool_connections: int
+    :param pool_maxsize: The maximum number of connections to keep open to a
+                         single host.
+    :type pool_maxsize: int
+    :param pool_block: Whether requests should wait for a free connection when
+                       the pool is exhausted.
+    :type pool_block: bool
+    :param max_concurrent_requests: If given, the maximum number of requests this
+                                    client will have in flight at once.
+    :type max_concurrent_requests: int
+    :param priority_classes: The priority classes requests may be made in, by
+                             name.  Requires `max_concurrent_requests`.
+    :type priority_classes: Dict[str, PriorityClass]
+    :param default_priority: The priority class requests are made in outside
+                             of a :meth:`priority` block.  Defaults to
+                             "interactive" if that class is defined, and
+                             otherwise to the class with the highest weight.
+                             Requires `max_concurrent_requests`.
+    :type default_priority: str
     """
 
+    #: Access methods related to your monitor metrics - see :any:`MetricsGroup` for
+    #: more information
+    metrics = _LazyGroup("MetricsGroup")
+
     def __init__(
         self,
         token,
@@ -604,11 +1237,13 @@ class MonitorClient(BaseClient):
         retry_rate_limit_interval=1.0,
         retry_max=5,
         retry_statuses=None,
+        pool_connections=DEFAULT_POOLSIZE,
+        pool_maxsize=DEFAULT_POOLSIZE,
+        pool_block=DEFAULT_POOLBLOCK,
+        max_concurrent_requests=None,
+        priority_classes=None,
+        default_priority=None,
     ):
-        #: Access methods related to your monitor metrics - see :any:`MetricsGroup` for
-        #: more information
-        self.metrics = MetricsGroup(self)
-
         super().__init__(
             token=token,
             base_url=base_url,
@@ -619,4 +1254,10 @@ class MonitorClient(BaseClient):
             retry_max=retry_max,
             retry_statuses=retry_statuses,
             ca_path=ca_path,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_concurrent_requests=max_concurrent_requests,
+            priority_classes=priority_classes,
+            default_priority=default_priority,
         )
@@ -0,0 +1,455 @@
+import datetime
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from linode_api4 import objects
+from linode_api4.errors import ApiError
+from linode_api4.objects.base import DATE_FORMAT
+from linode_api4.objects.filtering import Filter
+from linode_api4.objects.staleness import NeverRefresh
+from linode_api4.polling import (
+    BUSY_EVENT_STATUSES,
+    _event_stream_filter,
+    _fetch_events,
+    _latest_event_id,
+)
+
+if TYPE_CHECKING:
+    from linode_api4.linode_client import LinodeClient
+    from linode_api4.objects import Base
+
+
+@dataclass(frozen=True)
+class MirrorCollection:
+    """
+    A top-level collection kept in a :any:`Mirror`.
+    """
+
+    #: The name rows of this collection are stored under.
+    name: str
+
+    #: The name of the model class this collection holds.
+    model: str
+
+    #: The entity type events on this collection's objects have.
+    entity_type: str
+
+    #: The action of events deleting this collection's objects.  Defaults to
+    #: the entity type followed by "_delete".  Other actions ending in
+    #: "_delete", such as "disk_delete", name the parent of what they deleted.
+    delete_action: Optional[str] = None
+
+    def __post_init__(self):
+        if self.delete_action is None:
+            object.__setattr__(
+                self, "delete_action", "{}_delete".format(self.entity_type)
+            )
+
+    @property
+    def model_class(self) -> Type["Base"]:
+        """
+        The model class this collection holds.
+        """
+        return getattr(objects, self.model)
+
+
+#: The collections mirrored by default.
+DEFAULT_COLLECTIONS = (
+    MirrorCollection("instances", "Instance", "linode"),
+    MirrorCollection("volumes", "Volume", "volume"),
+    MirrorCollection("nodebalancers", "NodeBalancer", "nodebalancer"),
+    MirrorCollection("domains", "Domain", "domain"),
+    MirrorCollection("firewalls", "Firewall", "firewall"),
+    MirrorCollection("vpcs", "VPC", "vpc"),
+    MirrorCollection(
+        "lke_clusters", "LKECluster", "lkecluster", "lke_cluster_delete"
+    ),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    updated TEXT,
+    json TEXT NOT NULL,
+    PRIMARY KEY (collection, id)
+);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class Mirror:
+    """
+    Mirror keeps a local copy of an account's main collections in a SQLite
+    database, so that reporting and inventory jobs can read them without
+    making any API calls::
+
+       mirror = Mirror(client, "inventory.db")
+       mirror.sync()
+
+       for instance in mirror.query(Instance, region="us-east"):
+           print(instance.label, instance.status)
+
+    The first :meth:`sync` lists every collection, in parallel.  Later syncs
+    are incremental: they fetch the objects named by events created since the
+    last sync, and list only the objects whose `updated` timestamp has moved
+    since then, removing any that were deleted.
+
+    Models returned by a mirror are populated from the database, and are
+    otherwise ordinary models bound to the client; reading a property that
+    isn't stored, or saving a change, makes API calls as usual.
+
+    :param client: The client to sync with.
+    :type client: LinodeClient
+    :param path: The path of the SQLite database to keep the mirror in.  If
+                 not given, the mirror is kept in memory.
+    :type path: str
+    :param collections: The collections to mirror.  Defaults to
+                        :any:`DEFAULT_COLLECTIONS`.
+    :type collections: Iterable[MirrorCollection]
+    :param workers: The most collections listed at once during a full sync.
+    :type workers: int
+    """
+
+    #: How far in seconds before the previous sync the `updated` timestamps of
+    #: objects are checked from, allowing for clock skew.
+    UPDATED_MARGIN = 300
+
+    def __init__(
+        self,
+        client: "LinodeClient",
+        path: str = ":memory:",
+        collections: Optional[Iterable[MirrorCollection]] = None,
+        workers: int = 4,
+    ):
+        self._client = client
+        self.collections = tuple(
+            collections if collections is not None else DEFAULT_COLLECTIONS
+        )
+        self.workers = workers
+
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        """
+        Closes this mirror's database.
+        """
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def last_synced(self) -> Optional[datetime.datetime]:
+        """
+        When this mirror last synced, in UTC, or None if it never has.
+        """
+        value = self._get_state("synced_at")
+        if value is None:
+            return None
+
+        return datetime.datetime.strptime(value, DATE_FORMAT)
+
+    def sync(self, full: bool = False) -> Dict[str, int]:
+        """
+        Brings this mirror up to date with the API.
+
+        :param full: If True, every collection is listed in full, even if this
+                     mirror has synced before.
+        :type full: bool
+
+        :returns: The number of objects stored or removed in each collection.
+        :rtype: Dict[str, int]
+        """
+        # Anything changing from here on is caught by the next sync
+        started = datetime.datetime.now(datetime.timezone.utc).replace(
+            tzinfo=None
+        )
+        after_id = self._get_state("event_id")
+
+        if full or after_id is None:
+            latest_id = _latest_event_id(self._client)
+            changes = self._sync_full()
+            watched: Set[int] = set()
+        else:
+            latest_id, watched, changes = self._sync_incremental(
+                int(after_id), started
+            )
+
+        with self._lock, self._db:
+            self._set_state("event_id", str(latest_id))
+            self._set_state("watched", json.dumps(sorted(watched)))
+            self._set_state("synced_at", started.strftime(DATE_FORMAT))
+
+        return changes
+
+    def get(self, model: Type["Base"], id: Any) -> Optional["Base"]:
+        """
+        Returns the mirrored object of the given type with the given ID, or
+        None if it isn't in this mirror.
+
+        :param model: The model class to return.
+        :type model: type
+        :param id: The ID of the object.
+        :type id: Any
+        """
+        collection = self._collection_for(model)
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT json FROM objects WHERE collection = ? AND id = ?",
+                (collection.name, str(id)),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return self._make(model, json.loads(row[0]))
+
+    def query(
+        self, model: Type["Base"], *filters: Filter, **where: Any
+    ) -> List["Base"]:
+        """
+        Returns the mirrored objects of the given type, optionally only those
+        whose top-level fields have the given values, or that match the given
+        filters::
+
+           mirror.query(Volume, region="us-east", linode_id=None)
+           mirror.query(Instance, Instance.group == "prod", limit(10))
+
+        Filters are evaluated locally with :meth:`Filter.apply`, while field
+        values are matched by the database.
+
+        :param model: The model class to return.
+        :type model: type
+        :param filters: Any number of filters to apply to this query.
+                        See :doc:`Filtering Collections</linode_api4/objects/filtering>`
+                        for more details on filtering.
+        :param where: The values fields of the returned objects must have.
+
+        :returns: The matching objects, ordered by ID.
+        :rtype: List[Base]
+        """
+        collection = self._collection_for(model)
+        sql = "SELECT json FROM objects WHERE collection = ?"
+        params: List[Any] = [collection.name]
+
+        for field, value in where.items():
+            if value is None:
+                sql += " AND json_extract(json, ?) IS NULL"
+                params.append("$.{}".format(field))
+            else:
+                sql += " AND json_extract(json, ?) = ?"
+                params.extend(["$.{}".format(field), value])
+
+        sql += " ORDER BY CAST(id AS INTEGER), id"
+
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+
+        result = [self._make(model, json.loads(row[0])) for row in rows]
+
+        for f in filters:
+            result = f.apply(result)
+
+        return result
+
+    def count(self, model: Type["Base"]) -> int:
+        """
+        Returns the number of mirrored objects of the given type.
+
+        :param model: The model class to count.
+        :type model: type
+        """
+        collection = self._collection_for(model)
+
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM objects WHERE collection = ?",
+                (collection.name,),
+            ).fetchone()[0]
+
+    def _collection_for(self, model: Type["Base"]) -> MirrorCollection:
+        for collection in self.collections:
+            if issubclass(model, collection.model_class):
+                return collection
+
+        raise ValueError(
+            "{} is not mirrored; expected one of {}".format(
+                model.__name__, ", ".join(c.model for c in self.collections)
+            )
+        )
+
+    def _make(self, model: Type["Base"], data: Dict[str, Any]) -> "Base":
+        result = model.make_instance(data["id"], self._client, json=data)
+
+        # mirrored objects are kept current by syncing, not by re-fetching
+        # their volatile fields on access
+        result._set("staleness_policy", NeverRefresh())
+
+        return result
+
+    def _get_state(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM state WHERE key = ?", (key,)
+            ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def _set_state(self, key: str, value: str):
+        self._db.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
+    def _list(
+        self, collection: MirrorCollection, filters: Optional[Dict] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Returns the JSON of every object in the given collection matching the
+        given filters, across all pages.
+        """
+        endpoint = collection.model_class.api_list()
+        result = self._client.get(endpoint, filters=filters)
+        data = list(result["data"])
+
+        for page in range(2, result.get("pages", 1) + 1):
+            result = self._client.get(
+                "{}?page={}".format(endpoint, page), filters=filters
+            )
+            data.extend(result["data"])
+
+        return data
+
+    def _store(self, collection: MirrorCollection, data: List[Dict[str, Any]]):
+        self._db.executemany(
+            "INSERT OR REPLACE INTO objects (collection, id, updated, json) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (collection.name, str(d["id"]), d.get("updated"), json.dumps(d))
+                for d in data
+            ],
+        )
+
+    def _sync_full(self) -> Dict[str, int]:
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            listed = list(executor.map(self._list, self.collections))
+
+        with self._lock, self._db:
+            for collection, data in zip(self.collections, listed):
+                self._db.execute(
+                    "DELETE FROM objects WHERE collection = ?",
+                    (collection.name,),
+                )
+                self._store(collection, data)
+
+        return {c.name: len(d) for c, d in zip(self.collections, listed)}
+
+    def _sync_incremental(
+        self, after_id: int, started: datetime.datetime
+    ) -> Tuple[int, Set[int], Dict[str, int]]:
+        by_type = {c.entity_type: c for c in self.collections}
+        watched = set(json.loads(self._get_state("watched") or "[]"))
+
+        # Objects named by events since the last sync are re-fetched, unless
+        # the event deleted them
+        changed: Dict[str, Set[str]] = {c.name: set() for c in self.collections}
+        deleted: Dict[str, Set[str]] = {c.name: set() for c in self.collections}
+
+        events = _fetch_events(
+            self._client, _event_stream_filter(after_id, watched=watched)
+        )
+
+        for event in events:
+            after_id = max(after_id, event["id"])
+
+            if event["status"] in BUSY_EVENT_STATUSES:
+                watched.add(event["id"])
+            else:
+                watched.discard(event["id"])
+
+            entity = event.get("entity") or {}
+            collection = by_type.get(entity.get("type"))
+            if collection is None or entity.get("id") is None:
+                continue
+
+            entity_id = str(entity["id"])
+
+            if event["action"] == collection.delete_action:
+                deleted[collection.name].add(entity_id)
+            else:
+                changed[collection.name].add(entity_id)
+
+        synced_at = self.last_synced or started
+        since = synced_at - datetime.timedelta(seconds=self.UPDATED_MARGIN)
+        updated_filter = {"updated": {"+gte": since.strftime(DATE_FORMAT)}}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            listed = list(
+                executor.map(
+                    lambda c: self._list(c, filters=updated_filter),
+                    self.collections,
+                )
+            )
+
+        fetched: Dict[str, List[Dict[str, Any]]] = {}
+
+        for collection, data in zip(self.collections, listed):
+            fetched[collection.name] = data
+            seen = {str(d["id"]) for d in data}
+
+            for entity_id in changed[collection.name] - seen:
+                if entity_id in deleted[collection.name]:
+                    continue
+
+                try:
+                    fetched[collection.name].append(
+                        self._client.get(
+                            collection.model_class.api_endpoint.format(
+                                id=entity_id
+                            )
+                        )
+                    )
+                except ApiError as e:
+                    if e.status != 404:
+                        raise
+                    deleted[collection.name].add(entity_id)
+
+        with self._lock, self._db:
+            for collection in self.collections:
+                self._store(collection, fetched[collection.name])
+                self._db.executemany(
+                    "DELETE FROM objects WHERE collection = ? AND id = ?",
+                    [(collection.name, i) for i in deleted[collection.name]],
+                )
+
+        changes = {
+            c.name: len(fetched[c.name]) + len(deleted[c.name])
+            for c in self.collections
+        }
+
+        return after_id, watched, changes
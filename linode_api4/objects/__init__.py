@@ -1,28 +1,290 @@
 # isort: skip_file
-from .base import Base, Property, MappedObject, DATE_FORMAT, ExplicitNullValue
-from .dbase import DerivedBase
-from .serializable import JSONObject
-from .filtering import and_, or_
-from .region import Region, Capability
-from .image import Image
-from .linode import *
-from .linode_interfaces import *
-from .volume import *
-from .domain import *
-from .account import *
-from .networking import *
-from .nodebalancer import *
-from .support import *
-from .profile import *
-from .longview import *
-from .tag import Tag
-from .object_storage import *
-from .lke import *
-from .database import *
-from .vpc import *
-from .beta import *
-from .placement import *
-from .monitor import *
-from .monitor_api import *
-from .image_share_group import *
-from .lock import *
+"""
+Model classes are imported the first time they are accessed, so that
+``import linode_api4`` stays cheap for applications that only use a few of
+them.
+"""
+
+from linode_api4.util import lazy_exports
+
+# Submodules in import order.  A module only depends on modules before it.
+_SUBMODULES = (
+    "staleness",
+    "base",
+    "dbase",
+    "serializable",
+    "filtering",
+    "region",
+    "image",
+    "linode",
+    "linode_interfaces",
+    "volume",
+    "domain",
+    "account",
+    "networking",
+    "nodebalancer",
+    "support",
+    "profile",
+    "longview",
+    "tag",
+    "object_storage",
+    "lke",
+    "database",
+    "vpc",
+    "beta",
+    "placement",
+    "monitor",
+    "monitor_api",
+    "image_share_group",
+    "lock",
+)
+
+_EXPORTS = {
+    ".staleness": (
+        "StalenessPolicy",
+        "TTLPolicy",
+        "NeverRefresh",
+        "StaleWhileRevalidate",
+    ),
+    ".base": (
+        "Base",
+        "Property",
+        "MappedObject",
+        "DATE_FORMAT",
+        "ExplicitNullValue",
+    ),
+    ".dbase": ("DerivedBase",),
+    ".serializable": ("JSONObject", "StrEnum"),
+    ".filtering": ("and_", "or_", "FilterableAttribute"),
+    ".region": ("Region", "Capability"),
+    ".image": ("Image",),
+    ".linode": (
+        "PASSWORD_CHARS",
+        "MIN_DEVICE_LIMIT",
+        "MB_PER_GB",
+        "MAX_DEVICE_LIMIT",
+        "InstanceDiskEncryptionType",
+        "Backup",
+        "Disk",
+        "Kernel",
+        "Type",
+        "ConfigInterfaceIPv4",
+        "ConfigInterfaceIPv6SLAACOptions",
+        "ConfigInterfaceIPv6RangeOptions",
+        "ConfigInterfaceIPv6Options",
+        "ConfigInterfaceIPv6SLAAC",
+        "ConfigInterfaceIPv6Range",
+        "ConfigInterfaceIPv6",
+        "NetworkInterface",
+        "InstancePlacementGroupAssignment",
+        "ConfigInterface",
+        "Config",
+        "MigrationType",
+        "InterfaceGeneration",
+        "UpgradeInterfacesResult",
+        "Instance",
+        "UserDefinedFieldType",
+        "UserDefinedField",
+        "StackScript",
+    ),
+    ".linode_interfaces": (
+        "LinodeInterface",
+        "LinodeInterfaceDefaultRouteOptions",
+        "LinodeInterfacePublicOptions",
+        "LinodeInterfacesSettings",
+        "LinodeInterfaceVLANOptions",
+        "LinodeInterfaceVPCOptions",
+        "LinodeInterfacesSettingsDefaultRouteOptions",
+        "LinodeInterfacesSettingsDefaultRoute",
+        "LinodeInterfaceVPCIPv4AddressOptions",
+        "LinodeInterfaceVPCIPv4RangeOptions",
+        "LinodeInterfaceVPCIPv4Options",
+        "LinodeInterfaceVPCIPv6SLAACOptions",
+        "LinodeInterfaceVPCIPv6RangeOptions",
+        "LinodeInterfaceVPCIPv6Options",
+        "LinodeInterfacePublicIPv4AddressOptions",
+        "LinodeInterfacePublicIPv4Options",
+        "LinodeInterfacePublicIPv6RangeOptions",
+        "LinodeInterfacePublicIPv6Options",
+        "LinodeInterfaceOptions",
+        "LinodeInterfaceDefaultRoute",
+        "LinodeInterfaceVPCIPv4Address",
+        "LinodeInterfaceVPCIPv4Range",
+        "LinodeInterfaceVPCIPv4",
+        "LinodeInterfaceVPCIPv6SLAAC",
+        "LinodeInterfaceVPCIPv6Range",
+        "LinodeInterfaceVPCIPv6",
+        "LinodeInterfaceVPC",
+        "LinodeInterfacePublicIPv4Address",
+        "LinodeInterfacePublicIPv4Shared",
+        "LinodeInterfacePublicIPv4",
+        "LinodeInterfacePublicIPv6SLAAC",
+        "LinodeInterfacePublicIPv6Shared",
+        "LinodeInterfacePublicIPv6Range",
+        "LinodeInterfacePublicIPv6",
+        "LinodeInterfacePublic",
+        "LinodeInterfaceVLAN",
+    ),
+    ".volume": ("VolumeType", "Volume"),
+    ".domain": ("DomainRecord", "Domain"),
+    ".account": (
+        "Account",
+        "ChildAccount",
+        "ServiceTransfer",
+        "PaymentMethod",
+        "Login",
+        "AccountSettingsInterfacesForNewLinodes",
+        "AccountSettings",
+        "Event",
+        "InvoiceItem",
+        "Invoice",
+        "OAuthClient",
+        "Payment",
+        "User",
+        "get_obj_grants",
+        "Grant",
+        "UserGrants",
+        "AccountBetaProgram",
+        "AccountAvailability",
+    ),
+    ".networking": (
+        "Firewall",
+        "IPAddress",
+        "IPv6Range",
+        "VPCIPAddress",
+        "IPv6Pool",
+        "InstanceIPNAT1To1",
+        "VPCIPAddressIPv6",
+        "VLAN",
+        "FirewallCreateDevicesOptions",
+        "FirewallSettingsDefaultFirewallIDs",
+        "FirewallSettings",
+        "FirewallDevice",
+        "FirewallTemplate",
+        "NetworkTransferPrice",
+    ),
+    ".nodebalancer": (
+        "NodeBalancer",
+        "NodeBalancerType",
+        "NodeBalancerNode",
+        "NodeBalancerConfig",
+    ),
+    ".support": ("SupportTicket", "TicketReply"),
+    ".profile": (
+        "PersonalAccessToken",
+        "AuthorizedApp",
+        "WhitelistEntry",
+        "Profile",
+        "SSHKey",
+        "TrustedDevice",
+        "ProfileLogin",
+    ),
+    ".longview": ("LongviewClient", "LongviewSubscription", "LongviewPlan"),
+    ".tag": ("Tag",),
+    ".object_storage": (
+        "ObjectStorageACL",
+        "ObjectStorageKeyPermission",
+        "ObjectStorageEndpointType",
+        "ObjectStorageEndpoint",
+        "ObjectStorageQuotaUsage",
+        "ObjectStorageType",
+        "ObjectStorageBucket",
+        "ObjectStorageCluster",
+        "ObjectStorageKeys",
+        "ObjectStorageQuota",
+        "ObjectStorageGlobalQuota",
+    ),
+    ".lke": (
+        "LKEType",
+        "KubeVersion",
+        "TieredKubeVersion",
+        "LKENodePoolTaint",
+        "LKEClusterControlPlaneACLAddressesOptions",
+        "LKEClusterControlPlaneACLOptions",
+        "LKEClusterControlPlaneOptions",
+        "LKEClusterControlPlaneACLAddresses",
+        "LKEClusterControlPlaneACL",
+        "LKENodePoolNode",
+        "LKENodePool",
+        "LKECluster",
+    ),
+    ".database": (
+        "Database",
+        "DatabaseType",
+        "DatabaseEngine",
+        "DatabasePrivateNetwork",
+        "MySQLDatabaseConfigMySQLOptions",
+        "MySQLDatabaseConfigOptions",
+        "PostgreSQLDatabaseConfigPGLookoutOptions",
+        "PostgreSQLDatabaseConfigPGOptions",
+        "PostgreSQLDatabaseConfigOptions",
+        "MySQLDatabase",
+        "PostgreSQLDatabase",
+        "ENGINE_TYPE_TRANSLATION",
+    ),
+    ".vpc": (
+        "VPC",
+        "VPCSubnet",
+        "VPCIPv6RangeOptions",
+        "VPCIPv6Range",
+        "VPCSubnetIPv6RangeOptions",
+        "VPCSubnetIPv6Range",
+        "VPCSubnetLinodeInterface",
+        "VPCSubnetLinode",
+        "VPCSubnetDatabase",
+    ),
+    ".beta": ("BetaProgram",),
+    ".placement": (
+        "PlacementGroupType",
+        "PlacementGroupPolicy",
+        "PlacementGroupMember",
+        "MigratedInstance",
+        "PlacementGroupMigrations",
+        "PlacementGroup",
+    ),
+    ".monitor": (
+        "AggregateFunction",
+        "AlertChannel",
+        "AlertDefinition",
+        "AlertDefinitionChannel",
+        "AlertDefinitionEntity",
+        "AlertEntities",
+        "AlertScope",
+        "AlertType",
+        "MonitorDashboard",
+        "MonitorMetricsDefinition",
+        "MonitorService",
+        "MonitorServiceToken",
+        "RuleCriteria",
+        "TriggerConditions",
+    ),
+    ".monitor_api": (
+        "EntityMetrics",
+        "EntityMetricsData",
+        "EntityMetricsDataResult",
+        "EntityMetricsStats",
+        "EntityMetricOptions",
+    ),
+    ".image_share_group": (
+        "ImageShareGroupImageToAdd",
+        "ImageShareGroupImagesToAdd",
+        "ImageShareGroupImageToUpdate",
+        "ImageShareGroupMemberToAdd",
+        "ImageShareGroupMemberToUpdate",
+        "ImageShareGroup",
+        "ImageShareGroupToken",
+    ),
+    ".lock": ("LockType", "LockEntity", "Lock"),
+    "linode_api4.common": ("Price", "RegionPrice", "load_and_validate_keys"),
+    "linode_api4.errors": ("ApiError", "UnexpectedResponseError"),
+    "linode_api4.paginated_list": ("PaginatedList",),
+    "linode_api4.util": (
+        "drop_null_keys",
+        "generate_device_suffixes",
+        "normalize_as_list",
+    ),
+}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS, _SUBMODULES)
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from datetime import datetime
 
-import requests
 from deprecated import deprecated
 
 from linode_api4.errors import ApiError, UnexpectedResponseError
@@ -461,12 +460,13 @@ class OAuthClient(Base):
         """
         headers = {"Authorization": "token {}".format(self._client.token)}
 
-        result = requests.get(
+        result = self._client.session.get(
             "{}/{}/thumbnail".format(
                 self._client.base_url,
                 OAuthClient.api_endpoint.format(id=self.id),
             ),
             headers=headers,
+            verify=self._client.ca_path or self._client.session.verify,
         )
 
         if not result.status_code == 200:
@@ -499,13 +499,14 @@ class OAuthClient(Base):
             with open(thumbnail, "rb") as f:
                 thumbnail = f.read()
 
-        result = requests.put(
+        result = self._client.session.put(
             "{}/{}/thumbnail".format(
                 self._client.base_url,
                 OAuthClient.api_endpoint.format(id=self.id),
             ),
             headers=headers,
             data=thumbnail,
+            verify=self._client.ca_path or self._client.session.verify,
         )
 
         api_exc = ApiError.from_response(result)
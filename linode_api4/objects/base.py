@@ -1,18 +1,33 @@
+import logging
+import math
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import cached_property
 from typing import Any, Dict, Optional
 
 from linode_api4.objects.serializable import JSONObject
+from linode_api4.objects.staleness import StalenessPolicy, TTLPolicy
 
 from .filtering import FilterableMetaclass
 
 DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
+logger = logging.getLogger(__name__)
 
-# The interval to reload volatile properties
+# The interval to reload volatile properties under the default staleness policy
 volatile_refresh_timeout = timedelta(seconds=15)
 
+#: The most objects re-fetched in the background at once.
+REVALIDATION_WORKERS = 8
+
+# Shared by every object, so that reading many stale objects queues their
+# re-fetches rather than starting a thread for each
+_revalidation_executor = ThreadPoolExecutor(
+    max_workers=REVALIDATION_WORKERS, thread_name_prefix="linode-revalidate"
+)
+
 
 class ExplicitNullValue:
     """
@@ -37,6 +52,7 @@ class Property:
         unordered=False,
         json_object=None,
         alias_of: Optional[str] = None,
+        filterable: Optional[bool] = None,
     ):
         """
         A Property is an attribute returned from the API, and defines metadata
@@ -47,8 +63,8 @@ class Property:
         :type mutable: bool
         :param identifier: This Property identifies the object in the API
         :type identifier: bool
-        :param volatile: Re-query for this Property if the local value is older than the
-                         volatile refresh timeout
+        :param volatile: Re-query for this Property if the local value is stale under
+                         the object's :any:`StalenessPolicy`
         :type volatile: bool
         :param relationship: The API Object this Property represents
         :type relationship: type or None
@@ -73,6 +89,12 @@ class Property:
                          This is useful when the API attribute name is a Python reserved word,
                          allowing you to use a different key while preserving the original name.
         :type alias_of: str or None
+        :param filterable: Whether the API accepts filters on this Property,
+                           or None if that isn't known.  Queries built with
+                           :any:`Query` only send conditions on filterable
+                           Properties to the API, and evaluate the rest
+                           locally.  Identifiers are filterable by default.
+        :type filterable: bool or None
         """
         self.mutable = mutable
         self.identifier = identifier
@@ -86,6 +108,7 @@ class Property:
         self.unordered = unordered
         self.json_class = json_object
         self.alias_of = alias_of
+        self.filterable = identifier if filterable is None else filterable
 
 
 class MappedObject:
@@ -165,13 +188,30 @@ class MappedObject:
 class Base(object, metaclass=FilterableMetaclass):
     """
     The Base class knows how to look up api properties of a model, and lazy-load them.
+
+    Instances of Base may be shared between threads.  Lazy-loading is guarded by
+    a per-object lock so that concurrent accesses result in a single request, and
+    populated values are published all at once so that readers never observe a
+    partially-populated object.
     """
 
     properties = {}
 
+    #: The :any:`StalenessPolicy` deciding when this class' volatile properties
+    #: are re-fetched.  For each class in this object's MRO, from most to least
+    #: specific, a policy configured for that class on the client is used, then
+    #: one set on that class itself.  Failing those, the client's policy for all
+    #: models is used, and then a 15 second TTL.  A policy set on the object
+    #: itself, as :any:`Mirror` does, takes precedence over all of these.
+    staleness_policy = None
+
     def __init__(self, client: object, id: object, json: object = {}) -> object:
+        #: Guards lazy-loading of this object and its cached related objects.
+        self._set("_lock", threading.RLock())
         self._set("_populated", False)
         self._set("_last_updated", datetime.min)
+        self._set("_loaded_at", None)
+        self._set("_revalidating", False)
         self._set("_client", client)
         self._set("_changed", False)
 
@@ -202,19 +242,9 @@ class Base(object, metaclass=FilterableMetaclass):
             # We are accessing a Property
             if type(self).properties[name].identifier:
                 pass  # don't load identifiers from the server, we have those
-            elif (
-                object.__getattribute__(self, name) is None
-                and not self._populated
-                or type(self).properties[name].derived_class
-            ) or (
-                type(self).properties[name].volatile
-                and object.__getattribute__(self, "_last_updated")
-                + volatile_refresh_timeout
-                < datetime.now()
-            ):
-                # needs to be loaded from the server
-                if type(self).properties[name].derived_class:
-                    # load derived object(s)
+            elif type(self).properties[name].derived_class:
+                # load derived object(s)
+                with object.__getattribute__(self, "_lock"):
                     self._set(
                         name,
                         type(self)
@@ -223,8 +253,11 @@ class Base(object, metaclass=FilterableMetaclass):
                             self, getattr(self, "_client")
                         ),
                     )
-                else:
-                    self._api_get()
+            elif self._needs_load(name):
+                with object.__getattribute__(self, "_lock"):
+                    # another thread may have loaded this while we waited
+                    if self._needs_load(name):
+                        self._api_get()
         elif "{}_id".format(name) in type(self).properties.keys():
             # possible id-based relationship
             related_type = (
@@ -237,16 +270,111 @@ class Base(object, metaclass=FilterableMetaclass):
                 # it is a relationship
                 relcache_name = "_{}_relcache".format(name)
                 if not hasattr(self, relcache_name):
-                    self._set(
-                        relcache_name,
-                        related_type(
-                            self._client, getattr(self, "{}_id".format(name))
-                        ),
-                    )
+                    with object.__getattribute__(self, "_lock"):
+                        if not hasattr(self, relcache_name):
+                            self._set(
+                                relcache_name,
+                                related_type(
+                                    self._client,
+                                    getattr(self, "{}_id".format(name)),
+                                ),
+                            )
                 return object.__getattribute__(self, relcache_name)
 
         return object.__getattribute__(self, name)
 
+    def _needs_load(self, name):
+        """
+        Returns whether the given non-identifier Property must be (re)loaded
+        from the server before it is returned.
+        """
+        if object.__getattribute__(self, name) is None and not self._populated:
+            return True
+
+        if not type(self).properties[name].volatile:
+            return False
+
+        policy = self._staleness_policy()
+        age = self._age()
+
+        if not policy.is_stale(age):
+            return False
+
+        if policy.in_background(age):
+            self._revalidate()
+            return False
+
+        return True
+
+    def _staleness_policy(self) -> StalenessPolicy:
+        """
+        Returns the policy deciding when this object's volatile properties are
+        re-fetched, as described in :any:`staleness_policy`.
+        """
+        own = vars(self).get("staleness_policy")
+        if own is not None:
+            return own
+
+        configured = getattr(self._client, "staleness_policy", None)
+        overrides = configured if isinstance(configured, dict) else {}
+
+        for cls in type(self).__mro__:
+            policy = overrides.get(cls) or vars(cls).get("staleness_policy")
+            if policy is not None:
+                return policy
+
+        if isinstance(configured, StalenessPolicy):
+            return configured
+
+        return TTLPolicy(volatile_refresh_timeout.total_seconds())
+
+    def _age(self) -> float:
+        """
+        Returns the seconds since this object was last populated.
+        """
+        loaded_at = object.__getattribute__(self, "_loaded_at")
+        if loaded_at is None:
+            return math.inf
+
+        return time.monotonic() - loaded_at
+
+    def _is_stale(self) -> bool:
+        """
+        Whether this object's volatile properties are due to be re-fetched.
+        """
+        return not self._populated or self._staleness_policy().is_stale(
+            self._age()
+        )
+
+    def _revalidate(self):
+        """
+        Re-fetches this object in the background, unless that's already
+        underway or queued.  Until it completes, readers see the current
+        values.
+        """
+        with object.__getattribute__(self, "_lock"):
+            if self._revalidating:
+                return
+
+            self._set("_revalidating", True)
+
+        def run():
+            # unlike _api_get, this doesn't hold the lock during the request
+            # so that readers aren't held up by it
+            try:
+                json = self._client.get(type(self).api_endpoint, model=self)
+                self._populate(json)
+            except Exception:
+                logger.warning(
+                    "Failed to refresh %r in the background",
+                    self,
+                    exc_info=True,
+                )
+            finally:
+                self._set("_revalidating", False)
+
+        _revalidation_executor.submit(run)
+
     def __repr__(self):
         """
         Returns a safe representation of this object without accessing the server
@@ -344,14 +472,17 @@ class Base(object, metaclass=FilterableMetaclass):
         Invalidates all non-identifier Properties this object has locally,
         causing the next access to re-fetch them from the server
         """
-        for key in [
-            k
-            for k in type(self).properties.keys()
-            if not type(self).properties[k].identifier
-        ]:
-            self._set(key, None)
-
-        self._set("_populated", False)
+        with object.__getattribute__(self, "_lock"):
+            # mark this object unpopulated first so that concurrent readers
+            # re-fetch rather than returning the cleared values
+            self._set("_populated", False)
+
+            for key in [
+                k
+                for k in type(self).properties.keys()
+                if not type(self).properties[k].identifier
+            ]:
+                self._set(key, None)
 
     def _serialize(self, is_put: bool = False):
         """
@@ -391,8 +522,40 @@ class Base(object, metaclass=FilterableMetaclass):
         """
         A helper method to GET this object from the server
         """
-        json = self._client.get(type(self).api_endpoint, model=self)
-        self._populate(json)
+        with object.__getattribute__(self, "_lock"):
+            json = self._client.get(type(self).api_endpoint, model=self)
+            self._populate(json)
+
+    def _wait_for_state(
+        self, entities, is_ready, timeout, interval=None, reload=True
+    ):
+        """
+        A helper method to wait until is_ready returns True, checking it only
+        when an event on one of the given entities completes rather than
+        re-fetching this object on a timer.
+
+        :param entities: The (entity type, entity ID) pairs whose events may
+                         change the state being waited for, or a function
+                         returning them after each check.
+        :param is_ready: Checks whether the wanted state has been reached.
+        :param reload: If True, this object is re-fetched before each check.
+
+        :returns: This object.
+        """
+        from linode_api4.polling import (  # pylint: disable-all
+            _wait_for_entity_state,
+        )
+
+        def refresh():
+            if reload:
+                self._api_get()
+            return is_ready()
+
+        _wait_for_entity_state(
+            self._client, entities, refresh, timeout=timeout, interval=interval
+        )
+
+        return self
 
     def _populate(self, json):
         """
@@ -403,9 +566,13 @@ class Base(object, metaclass=FilterableMetaclass):
         if not json:
             return
 
-        # hide the raw JSON away in case someone needs it
-        self._set("_raw_json", json)
-        self._set("_updated", False)
+        # Values are collected here and published all at once below so that
+        # threads reading this object never observe a partial population.
+        values = {
+            # hide the raw JSON away in case someone needs it
+            "_raw_json": json,
+            "_updated": False,
+        }
 
         valid_keys = set(
             k
@@ -434,7 +601,7 @@ class Base(object, metaclass=FilterableMetaclass):
                             if obj:
                                 obj._populate(d)
                             objs.append(obj)
-                        self._set(prop_key, objs)
+                        values[prop_key] = objs
                     else:
                         if isinstance(json[api_key], dict):
                             related_id = json[api_key]["id"]
@@ -446,12 +613,11 @@ class Base(object, metaclass=FilterableMetaclass):
                         )
                         if obj and isinstance(json[api_key], dict):
                             obj._populate(json[api_key])
-                        self._set(prop_key, obj)
+                        values[prop_key] = obj
                 elif prop.slug_relationship and json[api_key] is not None:
                     # create an object of the expected type with the given slug
-                    self._set(
-                        prop_key,
-                        prop.slug_relationship(self._client, json[api_key]),
+                    values[prop_key] = prop.slug_relationship(
+                        self._client, json[api_key]
                     )
                 elif prop.json_class:
                     json_class = prop.json_class
@@ -464,32 +630,35 @@ class Base(object, metaclass=FilterableMetaclass):
                     else:
                         value = json_class.from_json(json_value)
 
-                    self._set(prop_key, value)
+                    values[prop_key] = value
                 elif type(json[api_key]) is dict:
-                    self._set(prop_key, MappedObject(**json[api_key]))
+                    values[prop_key] = MappedObject(**json[api_key])
                 elif type(json[api_key]) is list:
                     # we're going to use MappedObject's behavior with lists to
                     # expand these, then grab the resulting value to set
                     mapping = MappedObject(_list=json[api_key])
-                    self._set(
-                        prop_key, mapping._list
+                    values[prop_key] = (
+                        mapping._list
                     )  # pylint: disable=no-member
                 elif prop.is_datetime:
                     try:
                         t = time.strptime(json[api_key], DATE_FORMAT)
-                        self._set(
-                            prop_key, datetime.fromtimestamp(time.mktime(t))
+                        values[prop_key] = datetime.fromtimestamp(
+                            time.mktime(t)
                         )
                     except:
                         # if this came back, there's probably an issue with the
                         # python library; a field was marked as a datetime but
                         # wasn't in the expected format.
-                        self._set(prop_key, json[api_key])
+                        values[prop_key] = json[api_key]
                 else:
-                    self._set(prop_key, json[api_key])
+                    values[prop_key] = json[api_key]
+
+        values["_populated"] = True
+        values["_last_updated"] = datetime.now()
+        values["_loaded_at"] = time.monotonic()
 
-        self._set("_populated", True)
-        self._set("_last_updated", datetime.now())
+        vars(self).update(values)
 
     def _set(self, name, value):
         """
@@ -45,8 +45,258 @@ this relationship::
                                    and_(Instance.group == "prod",
                                         Instance.region == "us-east-1a"))
 
+Filters can also be evaluated locally, against models that have already been
+loaded or collections kept elsewhere, using the same semantics as the API::
+
+   prod = (Instance.group == "prod").apply(cached_instances)
+
+   if (Instance.status != "running").matches(instance):
+       ...
+
 """
 
+import operator
+from datetime import datetime
+
+# The format of timestamps in the API; see DATE_FORMAT in objects/base.py
+_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+_COMPARISONS = {
+    "+gt": operator.gt,
+    "+lt": operator.lt,
+    "+gte": operator.ge,
+    "+lte": operator.le,
+}
+
+
+def _field_value(obj, name):
+    """
+    Returns the value of the named field of the given model or JSON dict as the
+    API would see it, without loading anything from the API.  Dotted names
+    refer to nested fields.
+    """
+    for part in name.split("."):
+        if obj is None:
+            return None
+
+        if isinstance(obj, dict):
+            obj = obj.get(part)
+            continue
+
+        raw = getattr(obj, "_raw_json", None)
+        if isinstance(raw, dict):
+            prop = getattr(type(obj), "properties", {}).get(part)
+            key = prop.alias_of if prop is not None and prop.alias_of else part
+
+            if key in raw:
+                obj = raw[key]
+                continue
+
+        obj = vars(obj).get(part) if hasattr(obj, "__dict__") else None
+
+    return _normalize(obj)
+
+
+def _normalize(value):
+    """
+    Converts models and timestamps to the form they take in API responses.
+    """
+    if isinstance(value, datetime):
+        return value.strftime(_DATE_FORMAT)
+
+    if hasattr(value, "_raw_json") and hasattr(value, "id"):
+        return value.id
+
+    return value
+
+
+def _compare(op, actual, expected):
+    try:
+        return actual is not None and op(actual, expected)
+    except TypeError:
+        return False
+
+
+def _contains(actual, expected):
+    if isinstance(actual, str):
+        return isinstance(expected, str) and expected in actual
+
+    if isinstance(actual, (list, tuple)):
+        return expected in [_normalize(v) for v in actual]
+
+    return False
+
+
+def _equals(actual, expected):
+    # Filtering a list field on a single value matches lists containing it,
+    # as the API does for tags
+    if isinstance(actual, (list, tuple)) and not isinstance(
+        expected, (list, tuple)
+    ):
+        return expected in [_normalize(v) for v in actual]
+
+    return actual == expected
+
+
+def _compile(dct):
+    """
+    Builds a predicate for the given X-Filter dict.  The dict is walked once
+    here, so the predicate itself does no parsing.
+    """
+    checks = []
+
+    for key, value in dct.items():
+        if key in ("+order_by", "+order", "+limit"):
+            continue
+
+        if key == "+and":
+            parts = [_compile(d) for d in value]
+            checks.append(lambda o, parts=parts: all(p(o) for p in parts))
+        elif key == "+or":
+            parts = [_compile(d) for d in value]
+            checks.append(lambda o, parts=parts: any(p(o) for p in parts))
+        elif isinstance(value, dict):
+            for op_name, operand in value.items():
+                checks.append(_compile_operator(key, op_name, operand))
+        else:
+            expected = _normalize(value)
+            checks.append(
+                lambda o, key=key, expected=expected: _equals(
+                    _field_value(o, key), expected
+                )
+            )
+
+    if len(checks) == 1:
+        return checks[0]
+
+    return lambda o: all(c(o) for c in checks)
+
+
+def _compile_operator(key, op_name, operand):
+    operand = _normalize(operand)
+
+    if op_name == "+neq":
+        return lambda o: not _equals(_field_value(o, key), operand)
+
+    if op_name == "+contains":
+        return lambda o: _contains(_field_value(o, key), operand)
+
+    if op_name in _COMPARISONS:
+        op = _COMPARISONS[op_name]
+        return lambda o: _compare(op, _field_value(o, key), operand)
+
+    raise ValueError("Unsupported filter operator {}".format(op_name))
+
+
+def _flatten(dct):
+    """
+    Returns the given X-Filter dict with nested "+and" and "+or" conditions
+    merged into their parents where that doesn't change their meaning, as in
+    ``{"+or": [{"+or": [a, b]}, c]}`` becoming ``{"+or": [a, b, c]}``.  Each
+    condition is visited once.
+    """
+    if not isinstance(dct, dict):
+        return dct
+
+    result = {}
+
+    for key, value in dct.items():
+        if key not in ("+and", "+or") or not isinstance(value, list):
+            result[key] = value
+            continue
+
+        terms = []
+        for term in value:
+            term = _flatten(term)
+            if isinstance(term, dict) and list(term) == [key]:
+                terms.extend(term[key])
+            else:
+                terms.append(term)
+
+        result[key] = terms
+
+    return result
+
+
+#: The X-Filter keys that order or limit results rather than match them.
+_ORDERING_KEYS = ("+order_by", "+order", "+limit")
+
+
+def _pop_ordering(dct):
+    """
+    Returns a copy of the given X-Filter dict without the keys ordering or
+    limiting its results, which may be given at its top level or directly
+    within a top-level "+and", along with those keys.
+    """
+    ordering = {}
+
+    def strip(term):
+        if not isinstance(term, dict):
+            return term
+
+        ordering.update((k, term[k]) for k in _ORDERING_KEYS if k in term)
+        return {k: v for k, v in term.items() if k not in _ORDERING_KEYS}
+
+    result = strip(dct)
+
+    if isinstance(result.get("+and"), list):
+        # terms made by order_by() or limit() alone are left empty
+        terms = [t for t in map(strip, result.pop("+and")) if t != {}]
+
+        if len(terms) > 1:
+            result["+and"] = terms
+        elif terms:
+            result.update(terms[0])
+
+    return result, ordering
+
+
+def _split(dct, max_terms):
+    """
+    Splits the given X-Filter dict into several whose results together are the
+    same as its own, such that none has an "+or" of more than max_terms
+    conditions.  Only the largest "+or", at the top level or directly within a
+    top-level "+and", is split, as "+and" distributes over it.
+
+    :returns: The dicts to request, which is only the given dict if it needn't
+              be split.
+    :rtype: List[dict]
+    """
+    candidates = [dct] + [
+        term for term in dct.get("+and", ()) if isinstance(term, dict)
+    ]
+
+    largest = max(
+        (c for c in candidates if isinstance(c.get("+or"), list)),
+        key=lambda c: len(c["+or"]),
+        default=None,
+    )
+
+    if largest is None or len(largest["+or"]) <= max_terms:
+        return [dct]
+
+    terms = largest["+or"]
+    result = []
+
+    for start in range(0, len(terms), max_terms):
+        chunk = dict(largest, **{"+or": terms[start : start + max_terms]})
+
+        if largest is dct:
+            result.append(chunk)
+        else:
+            result.append(
+                dict(
+                    dct,
+                    **{
+                        "+and": [
+                            chunk if t is largest else t for t in dct["+and"]
+                        ]
+                    },
+                )
+            )
+
+    return result
+
 
 def or_(a, b):
     """
@@ -128,23 +378,58 @@ class Filter:
     """
 
     def __init__(self, dct):
-        self.dct = dct
+        self._dct = dct
+
+        # (operator, left Filter, right dict) for combined filters whose dict
+        # hasn't been built yet
+        self._pending = None
+
+    @property
+    def dct(self):
+        if self._dct is None:
+            self._dct = self._build()
+        return self._dct
+
+    @dct.setter
+    def dct(self, value):
+        self._dct = value
+        self._pending = None
+
+    def _combine(self, op, other):
+        # Building the combined dict is deferred so that chaining many filters
+        # together, as in a | b | c | ..., takes linear rather than quadratic
+        # time; each step would otherwise copy the list of every step before.
+        result = Filter(None)
+        result._pending = (op, self, other.dct)
+        return result
+
+    def _build(self):
+        op = self._pending[0]
+        terms = []
+        node = self
+
+        while node._dct is None and node._pending[0] == op:
+            terms.append(node._pending[2])
+            node = node._pending[1]
+
+        head = node.dct
+        terms.reverse()
+        self._pending = None
+
+        if op in head:
+            return {op: head[op] + terms}
+
+        return {op: [head] + terms}
 
     def __or__(self, other):
         if not isinstance(other, Filter):
             raise TypeError("You can only or Filter types!")
-        if "+or" in self.dct:
-            return Filter({"+or": self.dct["+or"] + [other.dct]})
-        else:
-            return Filter({"+or": [self.dct, other.dct]})
+        return self._combine("+or", other)
 
     def __and__(self, other):
         if not isinstance(other, Filter):
             raise TypeError("You can only and Filter types!")
-        if "+and" in self.dct:
-            return Filter({"+and": self.dct["+and"] + [other.dct]})
-        else:
-            return Filter({"+and": [self.dct, other.dct]})
+        return self._combine("+and", other)
 
     def order_by(self, field, desc=False):
         # we can't include two order_bys
@@ -172,6 +457,67 @@ class Filter:
 
         return self
 
+    def compile(self):
+        """
+        Returns a function that checks whether a model, or the JSON of one,
+        matches this filter's conditions, using the same semantics as the API.
+        Compiling once and reusing the function avoids re-reading the filter
+        for every object checked.  Ordering and limits are not considered; see
+        :meth:`apply`.
+
+        :returns: A predicate for this filter's conditions.
+        :rtype: Callable[[Any], bool]
+        """
+        return _compile(self.dct)
+
+    def matches(self, obj):
+        """
+        Whether the given model, or the JSON of one, matches this filter's
+        conditions.  Values are read from what the model was populated with,
+        so this never makes an API call.
+
+        :param obj: The model or JSON dict to check.
+        :type obj: Union[Base, dict]
+
+        :returns: True if the object matches.
+        :rtype: bool
+        """
+        return self.compile()(obj)
+
+    def apply(self, objects):
+        """
+        Returns the given models, or JSON dicts, that match this filter, in
+        the order and up to the limit it asks for, as the API would return
+        them from a collection.
+
+        :param objects: The models or JSON dicts to filter.
+        :type objects: Iterable[Union[Base, dict]]
+
+        :returns: The matching objects.
+        :rtype: list
+        """
+        predicate = self.compile()
+        result = [o for o in objects if predicate(o)]
+
+        order_by = self.dct.get("+order_by")
+        if order_by is not None:
+            keyed = [(_field_value(o, order_by), o) for o in result]
+
+            # Objects missing the field go last, as None can't be compared
+            present = [k for k in keyed if k[0] is not None]
+            present.sort(
+                key=lambda k: k[0], reverse=self.dct.get("+order") == "desc"
+            )
+            result = [o for _, o in present] + [
+                o for v, o in keyed if v is None
+            ]
+
+        limit = self.dct.get("+limit")
+        if limit is not None:
+            result = result[:limit]
+
+        return result
+
 
 class FilterableAttribute:
     def __init__(self, name):
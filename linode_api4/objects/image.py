@@ -3,6 +3,7 @@ from typing import List, Optional, Union
 
 from linode_api4.objects import Base, Property, Region
 from linode_api4.objects.serializable import JSONObject, StrEnum
+from linode_api4.util import normalize_as_list
 
 
 class ReplicationStatus(StrEnum):
@@ -121,3 +122,44 @@ class Image(Base):
         # The replicate endpoint returns the updated Image, so we can use this
         # as an opportunity to refresh the object
         self._populate(result)
+
+    def wait_for(
+        self,
+        status: Union[str, List[str]] = "available",
+        timeout: int = 600,
+        interval: Optional[float] = None,
+    ) -> "Image":
+        """
+        Waits until this Image's status is one of the given statuses, e.g. for
+        a newly created or uploaded Image to become available.  Rather than
+        re-fetching this Image on a timer, this watches the account's event
+        feed and only re-fetches it when one of its events completes.
+
+        :param status: The status or statuses to wait for.
+        :type status: Union[str, List[str]]
+        :param timeout: How long to wait in seconds before giving up.
+        :type timeout: int
+        :param interval: How long to wait in seconds between polls of the
+                         event feed.  If not given, the interval adapts to the
+                         progress of the Image's in-flight events.
+        :type interval: Optional[float]
+
+        :raises TimeoutException: If the status isn't reached before the
+                                  timeout.
+
+        :returns: This Image, with its properties re-fetched.
+        :rtype: Image
+        """
+        statuses = normalize_as_list(status)
+
+        # Image events refer to private images by the numeric part of their ID
+        entity_id = self.id.split("/")[-1]
+        if entity_id.isdigit():
+            entity_id = int(entity_id)
+
+        return self._wait_for_state(
+            [("image", entity_id)],
+            lambda: self.status in statuses,
+            timeout,
+            interval=interval,
+        )
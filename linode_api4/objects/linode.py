@@ -41,7 +41,7 @@ from linode_api4.objects.nodebalancer import NodeBalancer
 from linode_api4.objects.region import Region
 from linode_api4.objects.serializable import JSONObject, StrEnum
 from linode_api4.objects.vpc import VPC, VPCSubnet
-from linode_api4.paginated_list import PaginatedList
+from linode_api4.paginated_list import PaginatedList, PaginatedListSlice
 from linode_api4.util import (
     drop_null_keys,
     generate_device_suffixes,
@@ -800,32 +800,32 @@ class Instance(Base):
     api_endpoint = "/linode/instances/{id}"
     properties = {
         "id": Property(identifier=True),
-        "label": Property(mutable=True),
-        "group": Property(mutable=True),
-        "status": Property(volatile=True),
-        "created": Property(is_datetime=True),
-        "updated": Property(volatile=True, is_datetime=True),
-        "region": Property(slug_relationship=Region),
-        "alerts": Property(mutable=True),
-        "image": Property(slug_relationship=Image),
+        "label": Property(mutable=True, filterable=True),
+        "group": Property(mutable=True, filterable=True),
+        "status": Property(volatile=True, filterable=False),
+        "created": Property(is_datetime=True, filterable=True),
+        "updated": Property(volatile=True, is_datetime=True, filterable=True),
+        "region": Property(slug_relationship=Region, filterable=True),
+        "alerts": Property(mutable=True, filterable=False),
+        "image": Property(slug_relationship=Image, filterable=True),
         "disks": Property(derived_class=Disk),
         "configs": Property(derived_class=Config),
-        "type": Property(slug_relationship=Type),
-        "backups": Property(mutable=True),
-        "ipv4": Property(unordered=True),
-        "ipv6": Property(),
-        "hypervisor": Property(),
-        "specs": Property(),
-        "tags": Property(mutable=True, unordered=True),
-        "host_uuid": Property(),
-        "watchdog_enabled": Property(mutable=True),
+        "type": Property(slug_relationship=Type, filterable=True),
+        "backups": Property(mutable=True, filterable=False),
+        "ipv4": Property(unordered=True, filterable=False),
+        "ipv6": Property(filterable=False),
+        "hypervisor": Property(filterable=False),
+        "specs": Property(filterable=False),
+        "tags": Property(mutable=True, unordered=True, filterable=True),
+        "host_uuid": Property(filterable=False),
+        "watchdog_enabled": Property(mutable=True, filterable=False),
         "has_user_data": Property(),
         "disk_encryption": Property(),
         "lke_cluster_id": Property(),
-        "capabilities": Property(unordered=True),
+        "capabilities": Property(unordered=True, filterable=False),
         "interface_generation": Property(),
         "maintenance_policy": Property(mutable=True),
-        "locks": Property(unordered=True),
+        "locks": Property(unordered=True, filterable=False),
     }
 
     @property
@@ -840,73 +840,77 @@ class Instance(Base):
         :rtype: MappedObject
         """
         if not hasattr(self, "_ips"):
-            result = self._client.get(
-                "{}/ips".format(Instance.api_endpoint), model=self
-            )
-
-            if not "ipv4" in result:
-                raise UnexpectedResponseError(
-                    "Unexpected response loading IPs", json=result
-                )
-
-            v4pub = []
-            for c in result["ipv4"]["public"]:
-                i = IPAddress(self._client, c["address"], c)
-                v4pub.append(i)
-
-            v4pri = []
-            for c in result["ipv4"]["private"]:
-                i = IPAddress(self._client, c["address"], c)
-                v4pri.append(i)
-
-            shared_ips = []
-            for c in result["ipv4"]["shared"]:
-                i = IPAddress(self._client, c["address"], c)
-                shared_ips.append(i)
-
-            reserved = []
-            for c in result["ipv4"]["reserved"]:
-                i = IPAddress(self._client, c["address"], c)
-                reserved.append(i)
-
-            vpc = [
-                VPCIPAddress.from_json(v) for v in result["ipv4"].get("vpc", [])
-            ]
-
-            slaac = IPAddress(
-                self._client,
-                result["ipv6"]["slaac"]["address"],
-                result["ipv6"]["slaac"],
-            )
-            link_local = IPAddress(
-                self._client,
-                result["ipv6"]["link_local"]["address"],
-                result["ipv6"]["link_local"],
-            )
+            with self._lock:
+                # another thread may have loaded these while we waited
+                if not hasattr(self, "_ips"):
+                    result = self._client.get(
+                        "{}/ips".format(Instance.api_endpoint), model=self
+                    )
 
-            ranges = [
-                IPv6Range(self._client, r["range"])
-                for r in result["ipv6"]["global"]
-            ]
+                    if not "ipv4" in result:
+                        raise UnexpectedResponseError(
+                            "Unexpected response loading IPs", json=result
+                        )
+
+                    v4pub = []
+                    for c in result["ipv4"]["public"]:
+                        i = IPAddress(self._client, c["address"], c)
+                        v4pub.append(i)
+
+                    v4pri = []
+                    for c in result["ipv4"]["private"]:
+                        i = IPAddress(self._client, c["address"], c)
+                        v4pri.append(i)
+
+                    shared_ips = []
+                    for c in result["ipv4"]["shared"]:
+                        i = IPAddress(self._client, c["address"], c)
+                        shared_ips.append(i)
+
+                    reserved = []
+                    for c in result["ipv4"]["reserved"]:
+                        i = IPAddress(self._client, c["address"], c)
+                        reserved.append(i)
+
+                    vpc = [
+                        VPCIPAddress.from_json(v)
+                        for v in result["ipv4"].get("vpc", [])
+                    ]
+
+                    slaac = IPAddress(
+                        self._client,
+                        result["ipv6"]["slaac"]["address"],
+                        result["ipv6"]["slaac"],
+                    )
+                    link_local = IPAddress(
+                        self._client,
+                        result["ipv6"]["link_local"]["address"],
+                        result["ipv6"]["link_local"],
+                    )
 
-            ips = MappedObject(
-                **{
-                    "ipv4": {
-                        "public": v4pub,
-                        "private": v4pri,
-                        "shared": shared_ips,
-                        "reserved": reserved,
-                        "vpc": vpc,
-                    },
-                    "ipv6": {
-                        "slaac": slaac,
-                        "link_local": link_local,
-                        "ranges": ranges,
-                    },
-                }
-            )
+                    ranges = [
+                        IPv6Range(self._client, r["range"])
+                        for r in result["ipv6"]["global"]
+                    ]
+
+                    ips = MappedObject(
+                        **{
+                            "ipv4": {
+                                "public": v4pub,
+                                "private": v4pri,
+                                "shared": shared_ips,
+                                "reserved": reserved,
+                                "vpc": vpc,
+                            },
+                            "ipv6": {
+                                "slaac": slaac,
+                                "link_local": link_local,
+                                "ranges": ranges,
+                            },
+                        }
+                    )
 
-            self._set("_ips", ips)
+                    self._set("_ips", ips)
 
         return self._ips
 
@@ -1176,6 +1180,36 @@ class Instance(Base):
             return False
         return True
 
+    def wait_for(self, status="running", timeout=240, interval=None):
+        """
+        Waits until this Instance's status is one of the given statuses.  Rather
+        than re-fetching this Instance on a timer, this watches the account's
+        event feed and only re-fetches it when one of its events completes.
+
+        :param status: The status or statuses to wait for.
+        :type status: Union[str, List[str]]
+        :param timeout: How long to wait in seconds before giving up.
+        :type timeout: int
+        :param interval: How long to wait in seconds between polls of the
+                         event feed.  If not given, the interval adapts to the
+                         progress of the Instance's in-flight events.
+        :type interval: Optional[float]
+
+        :raises TimeoutException: If the status isn't reached before the
+                                  timeout.
+
+        :returns: This Instance, with its properties re-fetched.
+        :rtype: Instance
+        """
+        statuses = normalize_as_list(status)
+
+        return self._wait_for_state(
+            [("linode", self.id)],
+            lambda: self.status in statuses,
+            timeout,
+            interval=interval,
+        )
+
     def resize(
         self,
         new_type,
@@ -1956,11 +1990,13 @@ class Instance(Base):
         if region and not instance_type:
             raise ValueError('Specifying a region requires a "service" as well')
 
-        if not isinstance(configs, list) and not isinstance(
-            configs, PaginatedList
-        ):
+        if isinstance(configs, (PaginatedList, PaginatedListSlice)):
+            configs = list(configs)
+        elif not isinstance(configs, list):
             configs = [configs]
-        if not isinstance(disks, list) and not isinstance(disks, PaginatedList):
+        if isinstance(disks, (PaginatedList, PaginatedListSlice)):
+            disks = list(disks)
+        elif not isinstance(disks, list):
             disks = [disks]
 
         params = {
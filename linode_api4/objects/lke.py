@@ -171,6 +171,18 @@ class LKENodePoolNode:
         self.status = json.get("status")
 
 
+def _pool_ready(pool: "LKENodePool") -> bool:
+    """
+    Whether the given Node Pool has all of the Nodes it asks for, and every
+    one of them is ready.
+    """
+    nodes = pool.nodes
+
+    return len(nodes) >= (pool.count or 0) and all(
+        node.status == "ready" for node in nodes
+    )
+
+
 class LKENodePool(DerivedBase):
     """
     An LKE Node Pool describes a pool of Linode Instances that exist within an
@@ -266,6 +278,36 @@ class LKENodePool(DerivedBase):
         )
         self.invalidate()
 
+    def wait_for_ready(self, timeout=900, interval=None):
+        """
+        Waits until this Node Pool has as many Nodes as its `count` and every
+        one of them is ready, e.g. after the pool is created, resized or
+        recycled.  Rather than re-fetching this pool on
+        a timer, this watches the account's event feed and only re-fetches it
+        when an event on the cluster or one of its Nodes completes.
+
+        :param timeout: How long to wait in seconds before giving up.
+        :type timeout: int
+        :param interval: How long to wait in seconds between polls of the
+                         event feed.  If not given, the interval adapts to the
+                         progress of in-flight events.
+        :type interval: Optional[float]
+
+        :raises TimeoutException: If the pool isn't ready before the timeout.
+
+        :returns: This Node Pool, with its properties re-fetched.
+        :rtype: LKENodePool
+        """
+        # Nodes may be added while waiting, so the pool's current Nodes are
+        # watched after each check
+        return self._wait_for_state(
+            lambda: [("lkecluster", self.cluster_id)]
+            + [("linode", node.instance_id) for node in self.nodes],
+            lambda: _pool_ready(self),
+            timeout,
+            interval=interval,
+        )
+
 
 class LKECluster(Base):
     """
@@ -305,6 +347,42 @@ class LKECluster(Base):
 
         Base.invalidate(self)
 
+    def wait_for_ready(self, timeout=900, interval=None):
+        """
+        Waits until every Node in every Node Pool of this cluster is ready.
+        Rather than re-fetching the pools on a timer, this watches the
+        account's event feed and only re-fetches them when an event on the
+        cluster or one of its Nodes completes.
+
+        :param timeout: How long to wait in seconds before giving up.
+        :type timeout: int
+        :param interval: How long to wait in seconds between polls of the
+                         event feed.  If not given, the interval adapts to the
+                         progress of in-flight events.
+        :type interval: Optional[float]
+
+        :raises TimeoutException: If the cluster isn't ready before the
+                                  timeout.
+
+        :returns: This cluster.
+        :rtype: LKECluster
+        """
+        entities = [("lkecluster", self.id)] + [
+            ("linode", node.instance_id)
+            for pool in self.pools
+            for node in pool.nodes
+        ]
+
+        # The pools are listed fresh on every access, so the cluster itself
+        # doesn't need to be re-fetched
+        return self._wait_for_state(
+            entities,
+            lambda: all(_pool_ready(pool) for pool in self.pools),
+            timeout,
+            interval=interval,
+            reload=False,
+        )
+
     @property
     def api_endpoints(self):
         """
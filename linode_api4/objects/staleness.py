@@ -0,0 +1,94 @@
+from typing import Optional
+
+
+class StalenessPolicy:
+    """
+    Decides when the volatile properties of a model, such as an Instance's
+    status, are re-fetched from the API as they're accessed.  Ages are
+    measured in seconds on a monotonic clock, from when the object was last
+    populated.
+
+    A policy can be given for all models on a client, for some models on a
+    client, or for a model class itself::
+
+       client = LinodeClient(
+           token,
+           staleness_policy={
+               Base: TTLPolicy(60),
+               Instance: StaleWhileRevalidate(15),
+           },
+       )
+
+       class MyInstance(Instance):
+           staleness_policy = NeverRefresh()
+
+    See :any:`Base.staleness_policy` for how these are resolved.
+    """
+
+    def is_stale(self, age: float) -> bool:
+        """
+        Whether values of the given age should be refreshed.
+
+        :param age: The seconds since the object was last populated.
+        :type age: float
+        """
+        raise NotImplementedError()
+
+    def in_background(self, age: float) -> bool:
+        """
+        Whether stale values of the given age may be returned while they are
+        refreshed in the background, rather than refreshed before returning.
+
+        :param age: The seconds since the object was last populated.
+        :type age: float
+        """
+        return False
+
+
+class TTLPolicy(StalenessPolicy):
+    """
+    Refreshes volatile values before returning them once they're older than a
+    fixed time to live.  This is the default, with a TTL of 15 seconds.
+
+    :param ttl: The seconds after which values are refreshed.
+    :type ttl: float
+    """
+
+    def __init__(self, ttl: float = 15):
+        self.ttl = ttl
+
+    def is_stale(self, age: float) -> bool:
+        return age >= self.ttl
+
+
+class NeverRefresh(StalenessPolicy):
+    """
+    Never refreshes volatile values once an object is populated.  Values are
+    only updated by explicitly re-loading or invalidating the object.
+    """
+
+    def is_stale(self, age: float) -> bool:
+        return False
+
+
+class StaleWhileRevalidate(TTLPolicy):
+    """
+    Returns volatile values immediately, even once they're older than the
+    TTL, and refreshes the object in a background thread so that later reads
+    see fresh values.  Reads never wait on a request unless values are older
+    than `max_age`.
+
+    :param ttl: The seconds after which values are refreshed in the
+                background.
+    :type ttl: float
+    :param max_age: If given, the seconds after which values are too old to
+                    return, and are refreshed before returning instead.
+    :type max_age: Optional[float]
+    """
+
+    def __init__(self, ttl: float = 15, max_age: Optional[float] = None):
+        super().__init__(ttl)
+        self.max_age = max_age
+
+    def in_background(self, age: float) -> bool:
+        return self.max_age is None or age < self.max_age
@@ -1,8 +1,6 @@
 from pathlib import Path
 from typing import Union
 
-import requests
-
 from linode_api4.errors import ApiError, UnexpectedResponseError
 from linode_api4.objects import (
     Base,
@@ -165,13 +163,14 @@ class SupportTicket(Base):
         }
 
         with open(attachment, "rb") as f:
-            result = requests.post(
+            result = self._client.session.post(
                 "{}{}/attachments".format(
                     self._client.base_url,
                     SupportTicket.api_endpoint.format(id=self.id),
                 ),
                 headers=headers,
                 files={"file": f},
+                verify=self._client.ca_path or self._client.session.verify,
             )
 
         api_exc = ApiError.from_response(result)
@@ -38,11 +38,15 @@ class Tag(Base):
         this object.
         """
         if not hasattr(self, "_raw_objects"):
-            result = self._client.get(type(self).api_endpoint, model=self)
-
-            # I want to cache this to avoid making duplicate requests, but I don't
-            # want it in the __init__
-            self._raw_objects = result
+            with self._lock:
+                if not hasattr(self, "_raw_objects"):
+                    result = self._client.get(
+                        type(self).api_endpoint, model=self
+                    )
+
+                    # I want to cache this to avoid making duplicate requests,
+                    # but I don't want it in the __init__
+                    self._raw_objects = result
 
         return self._raw_objects
 
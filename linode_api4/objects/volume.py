@@ -7,7 +7,7 @@ from linode_api4.objects.base import (
 )
 from linode_api4.objects.linode import Instance, Region
 from linode_api4.objects.region import Region
-from linode_api4.util import drop_null_keys
+from linode_api4.util import drop_null_keys, normalize_as_list
 
 
 class VolumeType(Base):
@@ -40,18 +40,18 @@ class Volume(Base):
 
     properties = {
         "id": Property(identifier=True),
-        "created": Property(is_datetime=True),
-        "updated": Property(is_datetime=True),
-        "linode_id": Property(id_relationship=Instance),
-        "label": Property(mutable=True),
-        "size": Property(),
-        "status": Property(),
-        "region": Property(slug_relationship=Region),
-        "tags": Property(mutable=True, unordered=True),
-        "filesystem_path": Property(),
-        "hardware_type": Property(),
-        "linode_label": Property(),
-        "encryption": Property(),
+        "created": Property(is_datetime=True, filterable=True),
+        "updated": Property(is_datetime=True, filterable=True),
+        "linode_id": Property(id_relationship=Instance, filterable=True),
+        "label": Property(mutable=True, filterable=True),
+        "size": Property(filterable=True),
+        "status": Property(filterable=False),
+        "region": Property(slug_relationship=Region, filterable=True),
+        "tags": Property(mutable=True, unordered=True, filterable=True),
+        "filesystem_path": Property(filterable=False),
+        "hardware_type": Property(filterable=False),
+        "linode_label": Property(filterable=False),
+        "encryption": Property(filterable=False),
     }
 
     def attach(self, to_linode, config=None):
@@ -123,6 +123,36 @@ class Volume(Base):
 
         return True
 
+    def wait_for(self, status="active", timeout=240, interval=None):
+        """
+        Waits until this Volume's status is one of the given statuses.  Rather
+        than re-fetching this Volume on a timer, this watches the account's
+        event feed and only re-fetches it when one of its events completes.
+
+        :param status: The status or statuses to wait for.
+        :type status: Union[str, List[str]]
+        :param timeout: How long to wait in seconds before giving up.
+        :type timeout: int
+        :param interval: How long to wait in seconds between polls of the
+                         event feed.  If not given, the interval adapts to the
+                         progress of the Volume's in-flight events.
+        :type interval: Optional[float]
+
+        :raises TimeoutException: If the status isn't reached before the
+                                  timeout.
+
+        :returns: This Volume, with its properties re-fetched.
+        :rtype: Volume
+        """
+        statuses = normalize_as_list(status)
+
+        return self._wait_for_state(
+            [("volume", self.id)],
+            lambda: self.status in statuses,
+            timeout,
+            interval=interval,
+        )
+
     def clone(self, label):
         """
         Clones this volume to a new volume in the same region with the given label
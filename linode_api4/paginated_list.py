@@ -1,8 +1,169 @@
+import base64
+import contextvars
+import copy
+import heapq
+import json
 import math
-
+import operator
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterator, List
+
+from linode_api4.columns import build_columns, column_converter
 from linode_api4.objects.serializable import JSONObject
 
 
+class AdaptivePageSize:
+    """
+    A page size that starts small, so the first results of a collection arrive
+    quickly, and grows as more of the collection is loaded, so full scans take
+    fewer requests.  Pages grow as large as can be loaded in about
+    `target_seconds`, judged by the time and size of the pages loaded so far,
+    and never beyond `maximum`::
+
+       client = LinodeClient(token, page_size=AdaptivePageSize())
+
+    One policy may be shared by every collection of a client, and learns from
+    all of them.
+
+    :param initial: The size of the first page of each collection.
+    :type initial: int
+    :param maximum: The largest page requested.  The API allows at most 500.
+    :type maximum: int
+    :param target_seconds: How long loading a page should take.
+    :type target_seconds: float
+    """
+
+    #: How much each observed page counts towards the estimates, against all
+    #: earlier pages.
+    SMOOTHING = 0.5
+
+    def __init__(self, initial=25, maximum=500, target_seconds=1.0):
+        if not 0 < initial <= maximum:
+            raise ValueError("initial must be positive and at most maximum")
+
+        self.initial = initial
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+
+        self._seconds_per_byte = None
+        self._bytes_per_item = None
+        self._lock = threading.Lock()
+
+    def observe(self, elapsed, size, items):
+        """
+        Records that a page of the given number of items and bytes took the
+        given number of seconds to load.
+
+        :param elapsed: How long the page took to load, in seconds.
+        :type elapsed: float
+        :param size: The size of the response, in bytes.
+        :type size: int
+        :param items: The number of items on the page.
+        :type items: int
+        """
+        if size <= 0 or items <= 0:
+            return
+
+        with self._lock:
+            seconds_per_byte = elapsed / size
+            bytes_per_item = size / items
+
+            if self._seconds_per_byte is None:
+                self._seconds_per_byte = seconds_per_byte
+                self._bytes_per_item = bytes_per_item
+                return
+
+            a = self.SMOOTHING
+            self._seconds_per_byte = (
+                a * seconds_per_byte + (1 - a) * self._seconds_per_byte
+            )
+            self._bytes_per_item = (
+                a * bytes_per_item + (1 - a) * self._bytes_per_item
+            )
+
+    def preferred(self):
+        """
+        Returns the page size expected to load in about `target_seconds`.
+
+        :rtype: int
+        """
+        with self._lock:
+            if self._seconds_per_byte is None:
+                return self.initial
+
+            seconds_per_item = self._seconds_per_byte * self._bytes_per_item
+
+        if seconds_per_item <= 0:
+            return self.maximum
+
+        return max(
+            self.initial,
+            min(self.maximum, int(self.target_seconds / seconds_per_item)),
+        )
+
+    def block_size(self, unit):
+        """
+        Returns the preferred page size rounded down to the given unit times a
+        power of two, so that pages of that size cover whole pages of the unit.
+
+        :rtype: int
+        """
+        preferred = self.preferred()
+        size = unit
+
+        while size * 2 <= min(preferred, self.maximum):
+            size *= 2
+
+        return size
+
+
+#: The page size set by :meth:`BaseClient.paging` for the current context.
+_current_page_size: ContextVar = ContextVar("page_size", default=None)
+
+
+def _resolve_page_size(client):
+    """
+    Returns the page size, or :any:`AdaptivePageSize`, requests made by the
+    given client in this context should use.
+    """
+    override = _current_page_size.get()
+    return override if override is not None else client.page_size
+
+
+def _initial_page_size(policy):
+    if isinstance(policy, AdaptivePageSize):
+        return policy.initial
+    return policy
+
+
+def _observer(policy):
+    """
+    Returns a callback for :meth:`BaseClient._api_call` that reports the time
+    and size of each page loaded to the given policy, or None if the policy
+    isn't adaptive.
+    """
+    if not isinstance(policy, AdaptivePageSize):
+        return None
+
+    def observe(response, j):
+        elapsed = getattr(response, "elapsed", None)
+        content = getattr(response, "content", None)
+
+        if elapsed is None or not isinstance(content, bytes):
+            return
+        if not isinstance(j, dict) or not isinstance(j.get("data"), list):
+            return
+
+        policy.observe(elapsed.total_seconds(), len(content), len(j["data"]))
+
+    return observe
+
+
 class PaginatedList(object):
     """
     The PaginatedList encapsulates the API V4's pagination in an easily
@@ -30,8 +191,21 @@ class PaginatedList(object):
        num_linodes = len(linodes)
 
     This will _not_ emit another API request.
+
+    Slicing a PaginatedList returns a view of the items in the slice.  The
+    pages the view covers are loaded together, concurrently, when it is first
+    iterated over, and pages outside of it are never loaded::
+
+       # loads the last two pages at once, and no others
+       newest = list(linodes[-150:])
+
+    PaginatedLists may be shared between threads.  Each page is loaded at most
+    once, even if several threads request items from it at the same time.
     """
 
+    #: The most pages loaded at once when iterating over a slice.
+    max_concurrent_pages = 4
+
     def __init__(
         self,
         client,
@@ -41,10 +215,16 @@ class PaginatedList(object):
         total_items=None,
         parent_id=None,
         filters=None,
+        page_size_policy=None,
+        filter_chunks=None,
     ):
         self.client = client
         self.page_endpoint = page_endpoint
         self.query_filters = filters
+        # the parts of filters too large to send at once, which this list's
+        # contents were fetched with
+        self.query_filter_chunks = filter_chunks
+        self.page_size_policy = page_size_policy
         self.page_size = len(page)
         self.max_pages = max_pages
         self.lists = [None for _ in range(0, self.max_pages)]
@@ -55,6 +235,8 @@ class PaginatedList(object):
         )  # TODO if this is None that's bad
         self.objects_parent_id = parent_id
         self.cur = 0  # for being a generator
+        self._lock = threading.Lock()
+        self._page_locks = {}
 
         self.total_items = total_items
         if not total_items:
@@ -98,25 +280,203 @@ class PaginatedList(object):
         return "PaginatedList ({} items)".format(self.total_items)
 
     def _load_page(self, page_number):
-        j = self.client.get(
-            "/{}?page={}&page_size={}".format(
-                self.page_endpoint, page_number + 1, self.page_size
-            ),
-            filters=self.query_filters,
+        # With an adaptive page size, neighbouring pages are loaded along with
+        # this one in a single larger page, as long as they aren't loaded or
+        # being loaded already
+        size, first, claimed = self.page_size, page_number, []
+
+        if isinstance(self.page_size_policy, AdaptivePageSize):
+            size = self.page_size_policy.block_size(self.page_size)
+
+            while size > self.page_size:
+                per_block = size // self.page_size
+                first = page_number // per_block * per_block
+                others = [
+                    p
+                    for p in range(
+                        first, min(first + per_block, self.max_pages)
+                    )
+                    if p != page_number
+                ]
+
+                claimed = self._claim_pages(others)
+                if claimed is not None:
+                    break
+
+                size //= 2
+            else:
+                first, claimed = page_number, []
+
+        try:
+            j = self.client.get(
+                "/{}?page={}&page_size={}".format(
+                    self.page_endpoint,
+                    first * self.page_size // size + 1,
+                    size,
+                ),
+                filters=self.query_filters,
+                **self._observe_kwargs(),
+            )
+
+            self._check_page(j, size)
+
+            for offset in range(0, len(j["data"]), self.page_size):
+                l = PaginatedList.make_list(
+                    j["data"][offset : offset + self.page_size],
+                    self.client,
+                    self.list_cls,
+                    parent_id=self.objects_parent_id,
+                )
+                self.lists[first + offset // self.page_size] = l
+        finally:
+            for page_lock in claimed:
+                page_lock.release()
+
+    def _view(self):
+        """
+        Returns a new list over the same pages as this one, with its own
+        position for :func:`next`.  Pages loaded through either list are
+        loaded for both.
+        """
+        result = copy.copy(self)
+        result.cur = 0
+        return result
+
+    def _check_page(self, j, size):
+        """
+        Raises if the given page, requested with the given page size, shows
+        that this list has changed since it was created.
+        """
+        expected_pages = (
+            self.max_pages
+            if size == self.page_size
+            else math.ceil(len(self) / size)
         )
 
-        if j["pages"] != self.max_pages or j["results"] != len(self):
+        if j["pages"] != expected_pages or j["results"] != len(self):
             raise RuntimeError(
-                "List {} has changed since creation!".format(self)
+                "List {} has changed since creation!  Use resumable() to "
+                "iterate over lists that may change.".format(self)
             )
 
-        l = PaginatedList.make_list(
-            j["data"],
-            self.client,
-            self.list_cls,
-            parent_id=self.objects_parent_id,
-        )
-        self.lists[page_number] = l
+    def _raw_pages(self):
+        """
+        Yields every page of this list in order, as the models of pages that
+        are loaded and as the JSON of those that aren't.  Pages fetched here
+        aren't kept, and no models are made from them.
+        """
+        if not len(self):
+            return
+
+        page_number = 0
+
+        while page_number < self.max_pages:
+            if self.lists[page_number]:
+                yield self.lists[page_number]
+                page_number += 1
+                continue
+
+            # With an adaptive page size, pages are fetched in blocks as in
+            # _load_page, except that blocks never cover loaded pages
+            size = self.page_size
+
+            if isinstance(self.page_size_policy, AdaptivePageSize):
+                size = self.page_size_policy.block_size(self.page_size)
+
+                while size > self.page_size:
+                    per_block = size // self.page_size
+                    block = range(
+                        page_number,
+                        min(page_number + per_block, self.max_pages),
+                    )
+
+                    if page_number % per_block == 0 and not any(
+                        self.lists[p] for p in block
+                    ):
+                        break
+
+                    size //= 2
+
+            j = self.client.get(
+                "/{}?page={}&page_size={}".format(
+                    self.page_endpoint,
+                    page_number * self.page_size // size + 1,
+                    size,
+                ),
+                filters=self.query_filters,
+                **self._observe_kwargs(),
+            )
+
+            self._check_page(j, size)
+
+            yield j["data"]
+            page_number += size // self.page_size
+
+    def to_columns(self, fields, format="array"):
+        """
+        Returns the given fields of every item in this list as columns, for
+        analysis::
+
+           columns = client.linode.instances().to_columns(
+               ["id", "region", Instance.type, "specs.memory", "specs.vcpus"]
+           )
+
+           total_memory = sum(columns["specs.memory"])
+
+        Pages are read straight from their JSON one at a time, so no models are
+        made for pages that aren't already loaded, and those pages aren't kept.
+        Numeric fields are kept in compact ``array.array`` columns: integers as
+        ``"q"`` and floats as ``"d"``, with NaN in place of missing values in
+        which case integers become floats.  Other fields are kept as lists of
+        their values as found in the JSON, with nested objects as dicts and
+        timestamps as strings.
+
+        Columns may also be returned as NumPy arrays, a pandas DataFrame or an
+        Arrow table, if the library in question is installed.  Numeric columns
+        are converted without copying where the library allows it.
+
+        :param fields: The fields to return, by name or as model properties
+                       such as ``Instance.label``.  Dotted names refer to
+                       nested fields.
+        :type fields: List[Union[str, FilterableAttribute]]
+        :param format: The form to return columns in: "array" for a dict of
+                       arrays and lists by field, "numpy" for a dict of NumPy
+                       arrays by field, "pandas" for a DataFrame, or "arrow"
+                       for a ``pyarrow.Table``.
+        :type format: str
+
+        :returns: The columns, by field name.
+
+        :raises ImportError: If the library the format needs isn't installed.
+        :raises ValueError: If the format isn't known.
+        """
+        convert = column_converter(format)
+
+        return convert(build_columns(self._raw_pages(), fields))
+
+    def _claim_pages(self, pages):
+        """
+        Locks the given pages for loading, without waiting.  Returns their
+        locks, or None if any of them is loaded or being loaded.
+        """
+        claimed = []
+
+        with self._lock:
+            for p in pages:
+                page_lock = self._page_locks.setdefault(p, threading.Lock())
+
+                if self.lists[p] or not page_lock.acquire(blocking=False):
+                    for l in claimed:
+                        l.release()
+                    return None
+
+                claimed.append(page_lock)
+
+        return claimed
+
+    def _observe_kwargs(self):
+        observe = _observer(self.page_size_policy)
+        return {"observe": observe} if observe is not None else {}
 
     def __getitem__(self, index):
         # this comes in here now, but we're hadling it elsewhere
@@ -135,46 +495,111 @@ class PaginatedList(object):
         target_page = math.ceil((index + 1.0) / self.page_size) - 1
         target_page = int(target_page)
 
-        if not self.lists[target_page]:
-            self._load_page(target_page)
+        self._ensure_page(target_page)
 
         return self.lists[target_page][normalized_index]
 
+    def _ensure_page(self, page_number):
+        """
+        Loads the given page if it hasn't been already.  Different pages may be
+        loaded at the same time, but each is only loaded once.
+        """
+        if self.lists[page_number]:
+            return
+
+        with self._lock:
+            page_lock = self._page_locks.setdefault(
+                page_number, threading.Lock()
+            )
+
+        with page_lock:
+            # another thread may have loaded this page while we waited
+            if not self.lists[page_number]:
+                self._load_page(page_number)
+
+    def _load_pages(self, indices):
+        """
+        Loads every page holding one of the given indices, concurrently.
+        """
+        if not self.page_size:
+            return
+
+        if isinstance(indices, range) and indices.step == 1:
+            pages = range(
+                indices.start // self.page_size,
+                (indices.stop - 1) // self.page_size + 1,
+            )
+        else:
+            pages = {i // self.page_size for i in indices}
+
+        cold = [p for p in sorted(pages) if not self.lists[p]]
+
+        if len(cold) <= 1:
+            for p in cold:
+                self._ensure_page(p)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(cold), self.max_concurrent_pages)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, self._ensure_page, p
+                )
+                for p in cold
+            ]
+            for f in futures:
+                f.result()
+
     def __len__(self):
         return self.total_items
 
     def _get_slice(self, s):
-        # get range
-        i = s.start if s.start is not None else 0
-        j = s.stop if s.stop is not None else self.total_items
-
-        # we do not support steps outside of 1 yet
-        if s.step is not None and s.step != 1:
-            raise NotImplementedError(
-                "Only step sizes of 1 are currently supported."
-            )
+        # negative bounds past the start of the list are errors, as they always
+        # have been for PaginatedLists
+        for bound in (s.start, s.stop):
+            if bound is not None and bound < 0 and self.total_items + bound < 0:
+                raise IndexError("list index out of range")
 
-        # if i or j are negative, normalize them
-        if i < 0:
-            i = self.total_items + i
+        return PaginatedListSlice(self, range(self.total_items)[s])
 
-        if j < 0:
-            j = self.total_items + j
+    def resumable(self, cursor=None):
+        """
+        Returns an iterator over this collection that tolerates it changing
+        while it's iterated over.  Rather than loading numbered pages, which
+        fails if objects are added or removed between pages, the iterator
+        requests the objects following the last one it returned, in order of
+        ID::
 
-        # if i or j are still negative, that's an IndexError
-        if i < 0 or j < 0:
-            raise IndexError("list index out of range")
+           scan = client.account.events().resumable()
 
-        # if we're going nowhere or backward, return nothing
-        if j <= i:
-            return []
+           for event in scan:
+               handle(event)
+               checkpoint(scan.cursor)
 
-        result = []
+        Objects are returned at most once, and objects that exist for the whole
+        iteration are never skipped.  The iterator's :any:`cursor` may be
+        saved and passed here later to carry on where it left off.
 
-        for c in range(i, j):
-            result.append(self[c])
+        This is only supported for collections with numeric IDs, and the
+        collection's filters must not order it.
 
-        return result
+        :param cursor: A cursor from an earlier iteration over this collection
+                       to continue from.
+        :type cursor: str
+
+        :returns: An iterator over this collection.
+        :rtype: KeysetIterator
+        """
+        return KeysetIterator(
+            self.client,
+            "/" + self.page_endpoint,
+            self.list_cls,
+            filters=self.query_filters,
+            parent_id=self.objects_parent_id,
+            cursor=cursor,
+            chunks=self.query_filter_chunks,
+        )
 
     def __setitem__(self, index, value):
         raise AttributeError(
@@ -185,11 +610,14 @@ class PaginatedList(object):
         raise AttributeError("Deleting from paginated lists is not supported")
 
     def __next__(self):
-        if self.cur < len(self):
+        with self._lock:
+            if self.cur >= len(self):
+                raise StopIteration()
+
+            index = self.cur
             self.cur += 1
-            return self[self.cur - 1]
-        else:
-            raise StopIteration()
+
+        return self[index]
 
     @staticmethod
     def make_list(json_arr, client, cls, parent_id=None):
@@ -228,7 +656,13 @@ class PaginatedList(object):
 
     @staticmethod
     def make_paginated_list(
-        json, client, cls, parent_id=None, page_url=None, filters=None
+        json,
+        client,
+        cls,
+        parent_id=None,
+        page_url=None,
+        filters=None,
+        page_size_policy=None,
     ):
         """
         Returns a PaginatedList populated with the first page of data provided,
@@ -243,6 +677,8 @@ class PaginatedList(object):
         :param filters: The filters used when making the call that generated
                         this list.  If not provided, this will fail when
                         loading additional pages.
+        :param page_size_policy: If given, the adaptive page size additional
+                                 pages are loaded with.
 
         :returns: An instance of PaginatedList that will represent the entire
                   collection whose first page is json
@@ -258,5 +694,218 @@ class PaginatedList(object):
             total_items=json["results"],
             parent_id=parent_id,
             filters=filters,
+            page_size_policy=page_size_policy,
         )
         return p
+
+
+@dataclass
+class ChangedSince:
+    """
+    The objects in a collection that changed after a given time, as returned
+    by methods like :meth:`LinodeGroup.changed_since`.  Periodic syncs can pass
+    the high-water mark to the next call to fetch only what has changed since::
+
+       changes = client.linode.changed_since(last_sync)
+       for instance in changes:
+           store(instance)
+       last_sync = changes.high_water_mark
+
+    Objects updated in the same second as the high-water mark are returned
+    again, since timestamps only have second precision.
+    """
+
+    #: The changed objects, in the order they were last updated.
+    objects: List[Any]
+
+    #: The newest `updated` timestamp among the changed objects, or the time
+    #: that was asked about if none changed.  Passing this to the next call
+    #: returns only objects changed since this one.
+    high_water_mark: datetime
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def __len__(self):
+        return len(self.objects)
+
+
+class PaginatedListSlice(Sequence):
+    """
+    A view of some of the items in a :any:`PaginatedList`, as returned by
+    slicing it.  Indexing a view loads only the page holding that item, while
+    iterating over it loads every page it covers first, concurrently.  Views
+    compare equal to lists and tuples of the same items.
+    """
+
+    def __init__(self, paginated_list, indices):
+        self.paginated_list = paginated_list
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PaginatedListSlice(self.paginated_list, self.indices[index])
+
+        return self.paginated_list[self.indices[index]]
+
+    def __iter__(self):
+        self.paginated_list._load_pages(self.indices)
+
+        for i in self.indices:
+            yield self.paginated_list[i]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, PaginatedListSlice)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self):
+        return "PaginatedListSlice ({} items)".format(len(self))
+
+
+class KeysetIterator:
+    """
+    Iterates over a collection in order of ID, requesting the objects following
+    the last one returned rather than numbered pages.  These are returned by
+    :meth:`PaginatedList.resumable`, and should not be constructed manually.
+
+    Collections listed with a filter too large to send at once are iterated
+    over with each part of the filter, merging their results in order of ID.
+    """
+
+    def __init__(
+        self,
+        client,
+        endpoint,
+        cls,
+        filters=None,
+        parent_id=None,
+        cursor=None,
+        chunks=None,
+    ):
+        self.client = client
+        self.endpoint = endpoint
+        self.cls = cls
+        self.parent_id = parent_id
+        self.id_attribute = getattr(cls, "id_attribute", "id")
+        self.filters = self._unordered(filters)
+
+        # the parts of a split filter, each requested separately
+        self._chunks = [self._unordered(c) for c in chunks or [filters]]
+
+        self.last_id = None
+        if cursor is not None:
+            self.last_id = self._decode(cursor)
+
+    def _unordered(self, filters):
+        filters = dict(filters or {})
+        if filters.get("+order_by", self.id_attribute) != self.id_attribute:
+            raise ValueError("Lists iterated over by ID can't be ordered!")
+
+        filters.pop("+order_by", None)
+        filters.pop("+order", None)
+        return filters
+
+    def _decode(self, cursor):
+        try:
+            state = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            endpoint, last_id = state["endpoint"], state["after"]
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError("Invalid cursor {}".format(cursor)) from e
+
+        if endpoint != self.endpoint:
+            raise ValueError(
+                "Cursor is for {}, not {}".format(endpoint, self.endpoint)
+            )
+
+        return last_id
+
+    @property
+    def cursor(self) -> str:
+        """
+        An opaque token recording how far this iterator has got, which can be
+        passed to :meth:`PaginatedList.resumable` to continue from here.
+        """
+        state = {"endpoint": self.endpoint, "after": self.last_id}
+        return base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+
+    def _page_filters(self, filters, after) -> dict:
+        conditions = [filters] if filters else []
+        if after is not None:
+            conditions.append({self.id_attribute: {"+gt": after}})
+
+        if len(conditions) > 1:
+            result = {"+and": conditions}
+        elif conditions:
+            result = dict(conditions[0])
+        else:
+            result = {}
+
+        result.update({"+order_by": self.id_attribute, "+order": "asc"})
+        return result
+
+    def _stream(self, filters, after) -> Iterator[Any]:
+        """
+        Yields the objects matching the given filters with IDs after the given
+        ID, in order of ID.
+        """
+        policy = _resolve_page_size(self.client)
+        observe = _observer(policy)
+
+        while True:
+            # pages aren't numbered, so an adaptive size may change freely
+            page_size = (
+                policy.preferred()
+                if isinstance(policy, AdaptivePageSize)
+                else policy
+            )
+
+            url = self.endpoint
+            if page_size is not None:
+                url += "?page_size={}".format(page_size)
+
+            kwargs = {"observe": observe} if observe is not None else {}
+            result = self.client.get(
+                url, filters=self._page_filters(filters, after), **kwargs
+            )
+            page = PaginatedList.make_list(
+                result["data"], self.client, self.cls, parent_id=self.parent_id
+            )
+
+            for obj in page:
+                after = getattr(obj, self.id_attribute)
+                yield obj
+
+            if not page or result.get("pages", 1) <= 1:
+                return
+
+    def __iter__(self) -> Iterator[Any]:
+        # an empty collection has no class to make objects with
+        if self.cls is None:
+            return
+
+        streams = [self._stream(f, self.last_id) for f in self._chunks]
+        merged = (
+            streams[0]
+            if len(streams) == 1
+            else heapq.merge(
+                *streams, key=operator.attrgetter(self.id_attribute)
+            )
+        )
+
+        for obj in merged:
+            obj_id = getattr(obj, self.id_attribute)
+
+            # objects matching several parts of a split filter are returned
+            # once
+            if obj_id == self.last_id:
+                continue
+
+            # recorded first, so the cursor read while handling an object
+            # continues after it
+            self.last_id = obj_id
+            yield obj
@@ -1,10 +1,35 @@
+import asyncio
 import datetime
-from typing import Any, Dict, List, Optional
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import polling
 
 from linode_api4.objects import Event
 
+logger = logging.getLogger(__name__)
+
+#: Event statuses that mean an operation is still queued or running.
+BUSY_EVENT_STATUSES = ("scheduled", "started")
+
 
 class EventError(Exception):
     """
@@ -29,20 +54,29 @@ class EventError(Exception):
 class TimeoutContext:
     """
     TimeoutContext should be used by polling resources to track their provisioning time.
+
+    Time is measured with a monotonic clock, so changes to the system clock
+    don't affect how long a context lasts.
     """
 
     def __init__(self, timeout_seconds=120):
-        self._start_time = datetime.datetime.now()
+        self._start_time = time.monotonic()
         self._timeout_seconds = timeout_seconds
 
-    def start(self, start_time=datetime.datetime.now()):
+    def start(self, start_time: Optional[datetime.datetime] = None):
         """
         Sets the timeout start time to the current time.
 
-        :param start_time: The moment when the context started.
+        :param start_time: The moment when the context started.  Defaults to
+                           the current time.
         :type start_time: datetime
         """
-        self._start_time = start_time
+        self._start_time = time.monotonic()
+
+        if start_time is not None:
+            self._start_time -= (
+                datetime.datetime.now(tz=start_time.tzinfo) - start_time
+            ).total_seconds()
 
     def extend(self, seconds: int):
         """
@@ -79,7 +113,7 @@ class TimeoutContext:
         The number of seconds until the timeout period has expired.
 
         :returns: The number of seconds remaining in this context.
-        :rtype: int
+        :rtype: float
         """
         return self._timeout_seconds - self.seconds_since_started
 
@@ -89,14 +123,597 @@ class TimeoutContext:
         The number of seconds since the timeout period started.
 
         :returns: The number of seconds since the context started.
+        :rtype: float
+        """
+        return time.monotonic() - self._start_time
+
+
+class _DurationHistory:
+    """
+    Tracks how long each type of event has recently taken to complete, as a
+    moving average of the durations reported by finished events.
+    """
+
+    def __init__(self, weight: float = 0.3):
+        self._weight = weight
+        self._durations: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, action: str, duration: float):
+        with self._lock:
+            previous = self._durations.get(action)
+
+            self._durations[action] = (
+                duration
+                if previous is None
+                else previous + self._weight * (duration - previous)
+            )
+
+    def expected(self, action: str) -> Optional[float]:
+        with self._lock:
+            return self._durations.get(action)
+
+
+#: Recent event durations by action, shared by all poll schedules.
+_action_durations = _DurationHistory()
+
+
+def _parse_time_remaining(value: Any) -> Optional[float]:
+    """
+    Returns an event's time_remaining in seconds.  This is given either as a
+    number of seconds or as an "H:MM:SS" string.
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    try:
+        seconds = 0.0
+        for part in str(value).split(":"):
+            seconds = seconds * 60 + float(part)
+        return seconds
+    except ValueError:
+        return None
+
+
+class PollSchedule:
+    """
+    PollSchedule decides how long to wait between polls for a long-running
+    operation.  It polls quickly at first, so that short operations are noticed
+    promptly, and backs off while an operation runs so that long operations
+    don't cost hundreds of requests.
+
+    When an event reports its progress through `time_remaining` or
+    `percent_complete`, the next poll is timed around the estimated completion.
+    Otherwise, the recent durations of events with the same action are used.
+    Each interval is randomly jittered so that many waiters don't poll in step.
+
+    :param action: The action of the event being waited on, if known.
+    :type action: str
+    :param initial: The shortest interval in seconds, used for the first poll.
+    :type initial: float
+    :param maximum: The longest interval in seconds.
+    :type maximum: float
+    :param backoff: The factor to grow the interval by after each poll when the
+                    operation's progress is unknown.
+    :type backoff: float
+    :param jitter: The fraction by which each interval is randomly varied.
+    :type jitter: float
+    """
+
+    def __init__(
+        self,
+        action: Optional[str] = None,
+        initial: float = 1,
+        maximum: float = 30,
+        backoff: float = 1.5,
+        jitter: float = 0.1,
+    ):
+        if not 0 < initial <= maximum:
+            raise ValueError("initial must be between 0 and maximum")
+
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+        self.action = action
+        self.initial = initial
+        self.maximum = maximum
+        self.backoff = backoff
+        self.jitter = jitter
+
+        self._step = initial
+        self._remaining: Optional[float] = None
+
+        # The event being observed, when it was first seen, and the first
+        # progress it reported
+        self._event_id = None
+        self._first_seen = 0.0
+        self._progress = None
+
+        #: The number of seconds to wait before the next poll.
+        self.current = self._jittered(initial)
+
+    def _jittered(self, step: float) -> float:
+        return step * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def observe(self, event: Dict[str, Any]):
+        """
+        Updates this schedule with the latest state of the event being waited
+        on.  Durations of finished events are remembered for future schedules
+        waiting on the same action.
+
+        :param event: The JSON of the event.
+        :type event: Dict[str, Any]
+        """
+        now = time.monotonic()
+        action = event.get("action") or self.action
+
+        if event["id"] != self._event_id:
+            self._event_id = event["id"]
+            self._first_seen = now
+            self._progress = None
+
+        if event.get("duration") is not None and action is not None:
+            if event.get("status") in ("finished", "notification"):
+                _action_durations.record(action, float(event["duration"]))
+
+        remaining = _parse_time_remaining(event.get("time_remaining"))
+        percent = event.get("percent_complete")
+
+        if remaining is None and percent:
+            if self._progress is None or percent < self._progress[1]:
+                self._progress = (now, percent)
+            elif percent > self._progress[1] and now > self._progress[0]:
+                start, start_percent = self._progress
+                rate = (percent - start_percent) / (now - start)
+                remaining = (100 - percent) / rate
+
+        if remaining is None and action is not None:
+            expected = _action_durations.expected(action)
+            if expected is not None:
+                remaining = max(expected - (now - self._first_seen), 0)
+
+        self._remaining = remaining
+
+    def advance(self) -> float:
+        """
+        Moves to the next poll and returns the number of seconds to wait
+        before it.
+
+        :returns: The number of seconds to wait before the next poll.
+        :rtype: float
+        """
+        if self._remaining is not None:
+            # Poll again halfway to the estimated completion
+            step = self._remaining / 2
+            self._remaining = None
+        else:
+            step = self._step
+            self._step = min(self._step * self.backoff, self.maximum)
+
+        self.current = self._jittered(
+            min(max(step, self.initial), self.maximum)
+        )
+        return self.current
+
+
+@dataclass
+class EventWaitResult:
+    """
+    The outcome of waiting on one entity with
+    :meth:`PollingGroup.wait_for_many`.
+    """
+
+    #: The type of the entity that was waited on.
+    entity_type: str
+
+    #: The ID of the entity that was waited on.
+    entity_id: int
+
+    #: The event that completed, if one did.  This is also set for failed
+    #: events.
+    event: Optional[Event] = None
+
+    #: The error for this entity: an :any:`EventError` if its event failed,
+    #: or a TimeoutException if it didn't complete in time.
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the entity's event completed successfully.
+        """
+        return self.error is None
+
+
+def _fetch_events(
+    client: "LinodeClient", filters: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Returns all account events matching the given filters, across all pages.
+    """
+    events = []
+    page, pages = 1, 1
+
+    while page <= pages:
+        result = client.get(
+            "/account/events?page={}".format(page), filters=filters
+        )
+        events.extend(result["data"])
+        pages = result.get("pages", 1)
+        page += 1
+
+    return events
+
+
+def _event_stream_filter(
+    after_id: int,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[int] = None,
+    action: Optional[str] = None,
+    watched: Iterable[int] = (),
+) -> Dict[str, Any]:
+    """
+    Returns the filter for events newer than the given event ID, optionally
+    limited to an entity type, entity, or action.  Events with the given
+    watched IDs are also matched, so that their status can be followed.
+    """
+    result = {"+order_by": "id", "+order": "asc"}
+    new_events = {"id": {"+gt": after_id}}
+
+    if watched:
+        result["+or"] = [new_events] + [{"id": v} for v in sorted(watched)]
+    else:
+        result.update(new_events)
+
+    if entity_type is not None:
+        result["entity.type"] = entity_type
+
+    if entity_id is not None:
+        result["entity.id"] = entity_id
+
+    if action is not None:
+        result["action"] = action
+
+    return result
+
+
+def _latest_event_id(client: "LinodeClient") -> int:
+    """
+    Returns the ID of the newest event on the account, or 0 if there are none.
+    """
+    result = client.get(
+        "/account/events", filters={"+order_by": "id", "+order": "desc"}
+    )
+
+    return max((e["id"] for e in result["data"]), default=0)
+
+
+class EventHub:
+    """
+    EventHub polls a client's account event feed on behalf of any number of
+    waiters, so that waiting on many operations at once costs a single request
+    per interval rather than one per waiter.  EventHubs should not be created
+    manually, and are instead enabled through
+    :meth:`PollingGroup.enable_event_hub`.
+
+    Each poll requests only the events created since the previous poll, along
+    with any events that waiters are watching for status changes.  The events
+    from each poll are offered to every waiter.  There is no background thread;
+    whichever waiter finds a poll due makes the request for all of them.
+
+    The hub remembers the most recent events it has received, so that a
+    waiter that starts waiting after the hub has already polled past its
+    event still receives it.
+
+    :param history_size: The number of recently received events to remember.
+    :type history_size: int
+    """
+
+    #: How often in seconds async waiters check for results while another
+    #: waiter is polling.
+    ASYNC_CHECK_INTERVAL = 0.05
+
+    def __init__(self, client: "LinodeClient", history_size: int = 1000):
+        self._client = client
+        self._cond = threading.Condition()
+
+        self._last_id: Optional[int] = None
+        self._last_poll: Optional[float] = None
+        self._polling = False
+        self._waiters: List["_HubWaiter"] = []
+
+        self._history: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._history_size = history_size
+        # The ID of the newest event dropped from the history
+        self._history_floor = 0
+
+    def cursor(self) -> int:
+        """
+        Returns the ID of the newest event this hub has seen.  This can be
+        passed as `after_id` to :meth:`wait_for` to wait for events created
+        after this point.
+
+        :returns: The ID of the newest event seen.
         :rtype: int
         """
-        return (datetime.datetime.now() - self._start_time).seconds
+        with self._cond:
+            if self._last_id is None:
+                self._last_id = _latest_event_id(self._client)
+
+            return self._last_id
+
+    def _remember(self, events: List[Dict[str, Any]]):
+        """
+        Adds the given events to this hub's history, replacing any older
+        copies of them.  The hub must be locked.
+        """
+        for event in events:
+            self._history.pop(event["id"], None)
+            self._history[event["id"]] = event
+
+        while len(self._history) > self._history_size:
+            dropped, _ = self._history.popitem(last=False)
+            self._history_floor = max(self._history_floor, dropped)
+
+    def poll(self):
+        """
+        Fetches new and watched events and offers them to all current waiters.
+        This is called by waiters as needed, and should not usually be called
+        directly.
+        """
+        last_id = self.cursor()
+
+        with self._cond:
+            watched = set()
+            for waiter in self._waiters:
+                watched |= waiter.watch
+
+        events = _fetch_events(
+            self._client, _event_stream_filter(last_id, watched=watched)
+        )
+
+        with self._cond:
+            self._last_id = max([self._last_id] + [e["id"] for e in events])
+            self._remember(events)
+
+            for waiter in self._waiters:
+                waiter.offer(events)
+
+                if waiter.schedule is not None:
+                    waiter.schedule.advance()
+
+            self._cond.notify_all()
+
+    def wait_for(
+        self,
+        check: Callable[[List[Dict[str, Any]]], Any],
+        timeout: float = 240,
+        interval: Union[float, PollSchedule] = 5,
+        watch: Optional[Set[int]] = None,
+        after_id: Optional[int] = None,
+    ) -> Any:
+        """
+        Waits until the events received by this hub pass the given check.
+
+        :param check: Called with the events returned by each poll, in ID order,
+                      until it returns something other than None.  Exceptions
+                      raised by this function are raised from this method.  This
+                      is called while the hub is locked, so it should be quick
+                      and must not wait on the hub.
+        :type check: Callable[[List[Dict[str, Any]]], Any]
+        :param timeout: The timeout in seconds before this operation will fail.
+        :type timeout: float
+        :param interval: The time in seconds to wait between polls, or a schedule
+                         that decides it.  A schedule is advanced after every
+                         poll, and may be updated by `check`.
+        :type interval: Union[float, PollSchedule]
+        :param watch: The IDs of existing events to receive updates for.  This set
+                      is read on every poll, so `check` may add or remove IDs.
+        :type watch: Set[int]
+        :param after_id: If given, events newer than this that the hub has
+                         already received are offered to `check` first,
+                         along with the latest copies of watched events.
+                         See :meth:`cursor`.
+        :type after_id: int
+
+        :returns: The first value returned by `check` that was not None.
+        """
+        waiter = self._add_waiter(check, interval, watch, after_id)
+        deadline = time.monotonic() + timeout
+
+        try:
+            while True:
+                with self._cond:
+                    while not waiter.done:
+                        wait = self._claim_poll(waiter, deadline, interval)
+                        if wait is None:
+                            break
+
+                        self._cond.wait(wait)
+                    else:
+                        return waiter.result()
+
+                self._run_poll()
+        finally:
+            with self._cond:
+                self._waiters.remove(waiter)
+
+    async def async_wait_for(
+        self,
+        check: Callable[[List[Dict[str, Any]]], Any],
+        timeout: float = 240,
+        interval: Union[float, PollSchedule] = 5,
+        watch: Optional[Set[int]] = None,
+        after_id: Optional[int] = None,
+    ) -> Any:
+        """
+        An awaitable version of :meth:`wait_for`.  Polls are made in a worker
+        thread, and this waits between them with `asyncio.sleep`, so any number
+        of waits may share this hub concurrently, along with waiting threads.
+
+        :returns: The first value returned by `check` that was not None.
+        """
+        waiter = await asyncio.to_thread(
+            self._add_waiter, check, interval, watch, after_id
+        )
+        deadline = time.monotonic() + timeout
+
+        try:
+            while True:
+                with self._cond:
+                    if waiter.done:
+                        return waiter.result()
+
+                    wait = self._claim_poll(waiter, deadline, interval)
+
+                    # the event loop can't wait on the hub, so results of a
+                    # poll made by another waiter are checked for shortly
+                    if wait is not None and self._polling:
+                        wait = min(wait, self.ASYNC_CHECK_INTERVAL)
+
+                if wait is None:
+                    await asyncio.to_thread(self._run_poll)
+                else:
+                    await asyncio.sleep(wait)
+        finally:
+            with self._cond:
+                self._waiters.remove(waiter)
+
+    def _add_waiter(
+        self,
+        check: Callable[[List[Dict[str, Any]]], Any],
+        interval: Union[float, PollSchedule],
+        watch: Optional[Set[int]],
+        after_id: Optional[int],
+    ) -> "_HubWaiter":
+        """
+        Registers a waiter for :meth:`wait_for`, first offering it the events
+        it missed.
+        """
+        self.cursor()
+
+        schedule = interval if isinstance(interval, PollSchedule) else None
+
+        waiter = _HubWaiter(
+            check, watch if watch is not None else set(), schedule
+        )
+
+        # Events the hub no longer remembers must be fetched again
+        missed = []
+        if after_id is not None and after_id < self._history_floor:
+            missed = _fetch_events(self._client, _event_stream_filter(after_id))
+
+        with self._cond:
+            seen = {e["id"]: e for e in missed}
+            seen.update(
+                (k, v)
+                for k, v in self._history.items()
+                if (after_id is not None and k > after_id) or k in waiter.watch
+            )
+
+            if seen:
+                waiter.offer([seen[k] for k in sorted(seen)])
+
+            self._waiters.append(waiter)
+
+        return waiter
+
+    def _claim_poll(
+        self,
+        waiter: "_HubWaiter",
+        deadline: float,
+        interval: Union[float, PollSchedule],
+    ) -> Optional[float]:
+        """
+        Returns None if the given waiter should poll now, having claimed the
+        poll for it, or otherwise how long it should wait.  The hub must be
+        locked.
+        """
+        now = time.monotonic()
+        if now >= deadline:
+            raise polling.TimeoutException([], None)
+
+        step = interval if waiter.schedule is None else waiter.schedule.current
+        due = self._last_poll is None or now - self._last_poll >= step
+
+        if due and not self._polling:
+            self._polling = True
+            return None
+
+        wait = deadline - now
+        if not self._polling:
+            wait = min(wait, self._last_poll + step - now)
+
+        return wait
+
+    def _run_poll(self):
+        """
+        Makes a poll claimed with :meth:`_claim_poll`.
+        """
+        try:
+            self.poll()
+        finally:
+            with self._cond:
+                self._polling = False
+                self._last_poll = time.monotonic()
+                self._cond.notify_all()
+
+
+class _HubWaiter:
+    """
+    A single caller waiting on an :any:`EventHub`.
+    """
+
+    def __init__(
+        self,
+        check: Callable[[List[Dict[str, Any]]], Any],
+        watch: Set[int],
+        schedule: Optional[PollSchedule] = None,
+    ):
+        self.check = check
+        self.watch = watch
+        self.schedule = schedule
+        self.done = False
+
+        self._result = None
+        self._error = None
+
+    def offer(self, events: List[Dict[str, Any]]):
+        if self.done:
+            return
+
+        try:
+            self._result = self.check(events)
+        except Exception as e:
+            self._error = e
+
+        self.done = self._error is not None or self._result is not None
+
+    def result(self) -> Any:
+        if self._error is not None:
+            raise self._error
+
+        return self._result
 
 
 class EventPoller:
     """
     EventPoller allows modules to dynamically poll for Linode events
+
+    Pollers keep track of the newest event they have seen and only request
+    events newer than it.  If a checkpoint file is given, this position is
+    saved whenever a new event is found, and a poller created with the same
+    checkpoint file resumes from it rather than from the current time.
+
+    :param checkpoint: The path of a file to save this poller's position to.
+                       The file is created if it doesn't exist.
+    :type checkpoint: str
     """
 
     def __init__(
@@ -105,32 +722,116 @@ class EventPoller:
         entity_type: str,
         action: str,
         entity_id: Optional[int] = None,
+        hub: Optional[EventHub] = None,
+        checkpoint: Optional[str] = None,
     ):
         self._client = client
         self._entity_type = entity_type
         self._entity_id = entity_id
         self._action = action
+        self._hub = hub
+        self._checkpoint = checkpoint
+
+        # The ID of the newest event seen; only newer events are returned
+        self._after_id: Optional[int] = self._load_checkpoint()
 
-        # Initialize with an empty cache if no entity is specified
+        if self._after_id is not None:
+            return
+
+        # Events the hub had already seen are not new to this poller
+        if hub is not None:
+            self._after_id = hub.cursor()
+            return
+
+        # Every event for an entity that doesn't exist yet is new
         if self._entity_id is None:
-            self._previous_event_cache = {}
             return
 
-        # We only want the first page of this response
-        result = client.get("/account/events", filters=self._build_filter())
+        # Only the newest existing event is needed to know where to start
+        result = client.get(
+            "/account/events", filters=self._build_filter(order="desc")
+        )
 
-        self._previous_event_cache = {v["id"]: v for v in result["data"]}
+        self._after_id = max((v["id"] for v in result["data"]), default=0)
 
-    def _build_filter(self) -> Dict[str, Any]:
+    @property
+    def last_event_id(self) -> Optional[int]:
+        """
+        The ID of the newest event this poller has seen.  Only events newer
+        than this are returned by this poller.
+
+        :returns: The ID of the newest event seen, or None if this poller has
+                  no starting point yet.
+        :rtype: Optional[int]
+        """
+        return self._after_id
+
+    def _build_filter(self, order: str = "asc") -> Dict[str, Any]:
         """Generates a filter dict to use in HTTP requests"""
-        return {
-            "+order": "asc",
-            "+order_by": "created",
+        result = {
+            "+order": order,
+            "+order_by": "id",
             "entity.id": self._entity_id,
             "entity.type": self._entity_type,
             "action": self._action,
         }
 
+        if order == "asc" and self._after_id is not None:
+            result["id"] = {"+gt": self._after_id}
+
+        return result
+
+    def _load_checkpoint(self) -> Optional[int]:
+        """
+        Returns the position saved in this poller's checkpoint file, if it
+        was saved by a poller with the same configuration.
+        """
+        if self._checkpoint is None or not os.path.exists(self._checkpoint):
+            return None
+
+        with open(self._checkpoint, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+
+        if saved.get("poller") != self._checkpoint_key():
+            return None
+
+        return saved.get("last_event_id")
+
+    def _checkpoint_key(self) -> Dict[str, Any]:
+        return {
+            "entity_type": self._entity_type,
+            "entity_id": self._entity_id,
+            "action": self._action,
+        }
+
+    def _save_checkpoint(self):
+        """
+        Saves this poller's position to its checkpoint file.  The file is
+        replaced in one step so that it's never left partially written.
+        """
+        if self._checkpoint is None:
+            return
+
+        tmp_path = "{}.tmp".format(self._checkpoint)
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "poller": self._checkpoint_key(),
+                    "last_event_id": self._after_id,
+                },
+                f,
+            )
+
+        os.replace(tmp_path, self._checkpoint)
+
+    def _advance(self, event: Dict[str, Any]):
+        """
+        Moves this poller's position past the given event.
+        """
+        self._after_id = max(self._after_id or 0, event["id"])
+        self._save_checkpoint()
+
     def set_entity_id(self, entity_id: int) -> None:
         """
         Sets the ID of the entity to filter on.
@@ -142,34 +843,29 @@ class EventPoller:
         """
         self._entity_id = entity_id
 
-    def _attempt_merge_event_into_cache(self, event: Dict[str, Any]):
-        """
-        Attempts to merge the given event into the event cache.
-        """
-
-        if event["id"] in self._previous_event_cache:
-            return
-
-        self._previous_event_cache[event["id"]] = event
-
-    def _check_has_new_event(
+    def _find_new_event(
         self, events: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         """
-        If a new event is found in the given list, return it.
+        Returns the first new event in the given list that matches this
+        poller's configuration.  This is used when polling through an
+        :any:`EventHub`, which returns events for every entity.
         """
-
         for event in events:
-            # Ignore cached events
-            if event["id"] in self._previous_event_cache:
-                continue
+            entity = event.get("entity") or {}
 
-            return event
+            if (
+                event["id"] > self._after_id
+                and event["action"] == self._action
+                and entity.get("type") == self._entity_type
+                and entity.get("id") == self._entity_id
+            ):
+                return event
 
         return None
 
     def wait_for_next_event(
-        self, timeout: int = 240, interval: int = 5
+        self, timeout: int = 240, interval: Optional[float] = None
     ) -> Event:
         """
         Waits for and returns the next event matching the
@@ -177,74 +873,632 @@ class EventPoller:
 
         :param timeout: The timeout in seconds before this polling operation will fail.
         :type timeout: int
-        :param interval: The time in seconds to wait between polls.
-        :type interval: int
+        :param interval: The time in seconds to wait between polls.  If not given,
+                         polls are spaced out by a :any:`PollSchedule`.
+        :type interval: float
 
         :returns: The resulting event.
         :rtype: Event
         """
+        interval = _resolve_interval(interval, self._action)
+
+        if self._hub is not None:
+            result_event = self._hub.wait_for(
+                self._find_new_event,
+                timeout=timeout,
+                interval=interval,
+                after_id=self._after_id,
+            )
+            self._advance(result_event)
+            return Event(self._client, result_event["id"], json=result_event)
+
         result_event: Dict[str, Any] = {}
 
         def poll_func():
-            new_event = self._check_has_new_event(
-                self._client.get(
-                    "/account/events", filters=self._build_filter()
-                )["data"]
-            )
+            nonlocal result_event
+            result_event = self._poll_next_event()
+            return result_event is not None
 
-            event_exists = new_event is not None
+        if poll_func():
+            return Event(self._client, result_event["id"], json=result_event)
 
-            if event_exists:
-                nonlocal result_event
-                result_event = new_event
-                self._attempt_merge_event_into_cache(new_event)
+        _poll(poll_func, timeout, interval)
 
-            return event_exists
+        return Event(self._client, result_event["id"], json=result_event)
 
-        if poll_func():
+    async def async_wait_for_next_event(
+        self, timeout: float = 240, interval: Optional[float] = None
+    ) -> Event:
+        """
+        An awaitable version of :meth:`wait_for_next_event`.  This waits between
+        polls with `asyncio.sleep`, and only uses a thread for the duration of
+        each request, so any number of waits may run concurrently.
+
+        :param timeout: The timeout in seconds before this polling operation will fail.
+        :type timeout: float
+        :param interval: The time in seconds to wait between polls.  If not given,
+                         polls are spaced out by a :any:`PollSchedule`.
+        :type interval: float
+
+        :returns: The resulting event.
+        :rtype: Event
+        """
+        interval = _resolve_interval(interval, self._action)
+
+        if self._hub is not None:
+            result_event = await self._hub.async_wait_for(
+                self._find_new_event,
+                timeout=timeout,
+                interval=interval,
+                after_id=self._after_id,
+            )
+            self._advance(result_event)
             return Event(self._client, result_event["id"], json=result_event)
 
-        polling.poll(
-            poll_func,
-            step=interval,
-            timeout=timeout,
+        result_event = await _poll_async(
+            self._poll_next_event, timeout, interval
         )
 
         return Event(self._client, result_event["id"], json=result_event)
 
+    def _poll_next_event(self) -> Optional[Dict[str, Any]]:
+        """
+        Requests the next event matching this poller's configuration, and
+        returns it if it exists.
+        """
+        # Only events newer than the last one seen are requested, so the
+        # first result is always the next event
+        events = self._client.get(
+            "/account/events", filters=self._build_filter()
+        )["data"]
+
+        if len(events) < 1:
+            return None
+
+        self._advance(events[0])
+        return events[0]
+
     def wait_for_next_event_finished(
-        self, timeout: int = 240, interval: int = 5
+        self, timeout: int = 240, interval: Optional[float] = None
     ) -> Event:
         """
         Waits for the next event to enter status `finished` or `notification`.
 
         :param timeout: The timeout in seconds before this polling operation will fail.
         :type timeout: int
-        :param interval: The time in seconds to wait between polls.
-        :type interval: int
+        :param interval: The time in seconds to wait between polls.  If not given,
+                         polls are spaced out by a :any:`PollSchedule` using the
+                         event's reported progress.
+        :type interval: float
 
         :returns: The resulting event.
         :rtype: Event
         """
 
         timeout_ctx = TimeoutContext(timeout_seconds=timeout)
-        event = self.wait_for_next_event(timeout_ctx.seconds_remaining)
+        event = self.wait_for_next_event(
+            timeout_ctx.seconds_remaining, interval=interval
+        )
+
+        interval = _resolve_interval(interval, self._action)
+
+        if self._hub is not None:
+            return self._wait_for_finished_hub(event, timeout_ctx, interval)
 
         def poll_func():
             event._api_get()
+            return _event_finished(event, interval)
 
-            if event.status == "failed":
-                raise EventError(event.id, event.message)
+        if poll_func():
+            return event
 
-            return event.status in ["finished", "notification"]
+        _poll(poll_func, timeout_ctx.seconds_remaining, interval)
 
-        if poll_func():
+        return event
+
+    async def async_wait_for_next_event_finished(
+        self, timeout: float = 240, interval: Optional[float] = None
+    ) -> Event:
+        """
+        An awaitable version of :meth:`wait_for_next_event_finished`.  See
+        :meth:`async_wait_for_next_event`.
+
+        :param timeout: The timeout in seconds before this polling operation will fail.
+        :type timeout: float
+        :param interval: The time in seconds to wait between polls.  If not given,
+                         polls are spaced out by a :any:`PollSchedule` using the
+                         event's reported progress.
+        :type interval: float
+
+        :returns: The resulting event.
+        :rtype: Event
+        """
+        timeout_ctx = TimeoutContext(timeout_seconds=timeout)
+        event = await self.async_wait_for_next_event(
+            timeout_ctx.seconds_remaining, interval=interval
+        )
+
+        interval = _resolve_interval(interval, self._action)
+
+        if self._hub is not None:
+            check = self._finished_check(event, interval)
+            if check([event._raw_json]) is not None:
+                return event
+
+            result = await self._hub.async_wait_for(
+                check,
+                timeout=timeout_ctx.seconds_remaining,
+                interval=interval,
+                watch={event.id},
+            )
+            return Event(self._client, result["id"], json=result)
+
+        if _event_finished(event, interval):
+            return event
+
+        def poll_func():
+            event._api_get()
+            return _event_finished(event, interval) or None
+
+        await _poll_async(poll_func, timeout_ctx.seconds_remaining, interval)
+
+        return event
+
+    @staticmethod
+    def _finished_check(
+        event: Event, interval: Union[float, PollSchedule]
+    ) -> Callable[[List[Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        """
+        Returns a check for :meth:`EventHub.wait_for` that finds the given
+        event once it has finished.
+        """
+
+        def check(values: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            for value in values:
+                if value["id"] != event.id:
+                    continue
+
+                if isinstance(interval, PollSchedule):
+                    interval.observe(value)
+
+                if value["status"] == "failed":
+                    raise EventError(value["id"], value.get("message"))
+
+                if value["status"] in ["finished", "notification"]:
+                    return value
+
+            return None
+
+        return check
+
+    def _wait_for_finished_hub(
+        self,
+        event: Event,
+        timeout_ctx: TimeoutContext,
+        interval: Union[float, PollSchedule],
+    ) -> Event:
+        """
+        Waits for the given event to finish by watching it through this
+        poller's :any:`EventHub`.
+        """
+        check = self._finished_check(event, interval)
+        if check([event._raw_json]) is not None:
             return event
 
-        polling.poll(
-            poll_func,
-            step=interval,
+        result = self._hub.wait_for(
+            check,
             timeout=timeout_ctx.seconds_remaining,
+            interval=interval,
+            watch={event.id},
         )
 
-        return event
+        return Event(self._client, result["id"], json=result)
+
+
+class EventSubscription:
+    """
+    EventSubscription delivers new account events to a callback as they appear.
+    Subscriptions should not be created manually, and are instead created
+    through :meth:`PollingGroup.subscribe`.
+
+    A background thread polls the event feed, and a small pool of worker
+    threads calls the callback.  Each event is delivered at least once: if the
+    callback raises, it is called again with the same event up to `retries`
+    times.  Events are never delivered more than once successfully, even if
+    the feed returns them again.
+
+    Events waiting for a worker are held in a queue of at most `max_pending`
+    events.  When the queue is full, the poller either waits for room before
+    polling again (``overflow="block"``), or discards new events and counts
+    them in :attr:`dropped` (``overflow="drop"``).
+
+    Subscriptions can be used as context managers, stopping when the block
+    exits.
+    """
+
+    #: The number of delivered event IDs remembered for deduplication.
+    DELIVERED_HISTORY = 10000
+
+    def __init__(
+        self,
+        client: "LinodeClient",
+        callback: Callable[[Event], Any],
+        entity_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        action: Optional[str] = None,
+        status: Optional[List[str]] = None,
+        interval: float = 5,
+        workers: int = 4,
+        max_pending: int = 100,
+        overflow: str = "block",
+        retries: int = 3,
+        after_id: Optional[int] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        if overflow not in ("block", "drop"):
+            raise ValueError(
+                "Invalid overflow {}; expected block or drop".format(overflow)
+            )
+
+        self._client = client
+        self.callback = callback
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        self.action = action
+        self.status = status
+        self.interval = interval
+        self.workers = workers
+        self.overflow = overflow
+        self.retries = retries
+
+        #: The number of events discarded because the queue was full.
+        self.dropped = 0
+
+        #: The number of events whose callback failed on every attempt.
+        self.failed = 0
+
+        self._after_id = after_id
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+        # Events that match but haven't reached a wanted status yet
+        self._watched: Set[int] = set()
+
+        self._delivered: "OrderedDict[int, None]" = OrderedDict()
+        self._delivered_lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether this subscription is polling for events.
+        """
+        return bool(self._threads) and not self._stop.is_set()
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of events waiting to be delivered.
+        """
+        return self._queue.qsize()
+
+    def start(self):
+        """
+        Starts polling for events.  Events created after this is called are
+        delivered, unless the subscription was created with `after_id`.
+        """
+        if self._threads:
+            raise RuntimeError("This subscription has already been started")
+
+        if self._after_id is None:
+            self._after_id = _latest_event_id(self._client)
+
+        self._threads = [
+            threading.Thread(target=self._run_poller, daemon=True)
+        ] + [
+            threading.Thread(target=self._run_worker, daemon=True)
+            for _ in range(self.workers)
+        ]
+
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, wait: bool = True, timeout: Optional[float] = None):
+        """
+        Stops polling for events.  Events already queued are still delivered.
+
+        :param wait: Whether to wait for queued events to be delivered.
+        :type wait: bool
+        :param timeout: The longest time in seconds to wait for each thread.
+        :type timeout: float
+        """
+        self._stop.set()
+
+        if not wait:
+            return
+
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def poll(self):
+        """
+        Fetches new events and queues those that match for delivery.  This is
+        called by the subscription's poller thread, and should not usually be
+        called directly.
+        """
+        events = _fetch_events(
+            self._client,
+            _event_stream_filter(
+                self._after_id,
+                entity_type=self.entity_type,
+                entity_id=self.entity_id,
+                action=self.action,
+                watched=self._watched,
+            ),
+        )
+
+        for event in events:
+            self._after_id = max(self._after_id, event["id"])
+
+            if self.status is not None and event["status"] not in self.status:
+                # Keep following this event until it reaches a wanted status,
+                # unless it has already stopped changing
+                if event["status"] in BUSY_EVENT_STATUSES:
+                    self._watched.add(event["id"])
+                else:
+                    self._watched.discard(event["id"])
+                continue
+
+            self._watched.discard(event["id"])
+            self._enqueue(event)
+
+    def _enqueue(self, event: Dict[str, Any]):
+        if self.overflow == "drop":
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                self.dropped += 1
+            return
+
+        # Waiting here holds up the next poll until the workers catch up
+        while not self._stop.is_set():
+            try:
+                self._queue.put(event, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _claim(self, event_id: int) -> bool:
+        """
+        Marks an event as delivered, returning False if it already was.
+        """
+        with self._delivered_lock:
+            if event_id in self._delivered:
+                return False
+
+            self._delivered[event_id] = None
+
+            if len(self._delivered) > self.DELIVERED_HISTORY:
+                self._delivered.popitem(last=False)
+
+            return True
+
+    def _run_poller(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Failed to poll for subscribed events")
+
+            self._stop.wait(self.interval)
+
+    def _run_worker(self):
+        while True:
+            try:
+                event = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+
+            try:
+                if self._claim(event["id"]):
+                    self._deliver(event)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, event: Dict[str, Any]):
+        for attempt in range(self.retries + 1):
+            try:
+                self.callback(Event(self._client, event["id"], json=event))
+                return
+            except Exception:
+                logger.exception(
+                    "Subscription callback failed for event %s (attempt %s)",
+                    event["id"],
+                    attempt + 1,
+                )
+
+        with self._delivered_lock:
+            self.failed += 1
+
+
+#: How often in seconds an object waiting on its events is fetched anyway,
+#: in case its state changed without an event saying so.
+STATE_REFRESH_INTERVAL = 60
+
+
+def _wait_for_entity_state(
+    client: "LinodeClient",
+    entities: Union[List[Tuple[str, Any]], Callable[[], List[Tuple[str, Any]]]],
+    refresh: Callable[[], bool],
+    timeout: float = 240,
+    interval: Optional[float] = None,
+):
+    """
+    Waits until `refresh` returns True.  `refresh` should fetch an object and
+    check its state; it's called once up front, and after that only when an
+    event on one of the given entities completes.  Each poll in between is a
+    single request for new events on those entities.
+
+    :param entities: The (entity type, entity ID) pairs whose events may
+                     change the object's state, or a function returning them,
+                     which is called again after each refresh.
+    """
+
+    def entity_conditions() -> List[Dict[str, Any]]:
+        pairs = entities() if callable(entities) else entities
+        return [{"entity.type": t, "entity.id": i} for t, i in pairs]
+
+    conditions = entity_conditions()
+
+    after_id = _latest_event_id(client)
+
+    # Events already running on the entities, such as a boot requested just
+    # before waiting, are updated in place and never pass the cursor, so they
+    # are followed by ID from the start
+    watched: Set[int] = {
+        e["id"]
+        for e in _fetch_events(
+            client,
+            {
+                "+and": [
+                    {"+or": conditions},
+                    {"+or": [{"status": s} for s in BUSY_EVENT_STATUSES]},
+                ]
+            },
+        )
+    }
+
+    if refresh():
+        return
+
+    conditions = entity_conditions()
+
+    interval = _resolve_interval(interval)
+    last_refresh = time.monotonic()
+
+    def poll_func() -> bool:
+        nonlocal after_id, conditions, last_refresh
+
+        filters = _event_stream_filter(after_id, watched=watched)
+
+        if len(conditions) == 1:
+            filters.update(conditions[0])
+        else:
+            stream = {k: filters.pop(k) for k in ("id", "+or") if k in filters}
+            filters["+and"] = [{"+or": conditions}, stream]
+
+        settled = False
+
+        for event in _fetch_events(client, filters):
+            after_id = max(after_id, event["id"])
+
+            if event["status"] in BUSY_EVENT_STATUSES:
+                watched.add(event["id"])
+
+                if isinstance(interval, PollSchedule):
+                    interval.observe(event)
+            else:
+                watched.discard(event["id"])
+                settled = True
+
+        now = time.monotonic()
+        if not settled and now - last_refresh < STATE_REFRESH_INTERVAL:
+            return False
+
+        last_refresh = now
+        if refresh():
+            return True
+
+        conditions = entity_conditions()
+        return False
+
+    _poll(poll_func, timeout, interval)
+
+
+def _event_finished(
+    event: Event, interval: Union[float, PollSchedule, None] = None
+) -> bool:
+    """
+    Whether the given event has finished, raising an EventError if it failed.
+    If a schedule is given, it's updated with the event's progress.
+    """
+    if isinstance(interval, PollSchedule):
+        interval.observe(event._raw_json)
+
+    if event.status == "failed":
+        raise EventError(event.id, event.message)
+
+    return event.status in ["finished", "notification"]
+
+
+def _resolve_interval(
+    interval: Optional[float], action: Optional[str] = None
+) -> Union[float, PollSchedule]:
+    """
+    Returns the given fixed interval, or a new schedule if none was given.
+    """
+    return interval if interval is not None else PollSchedule(action=action)
+
+
+def _poll(
+    poll_func: Callable[[], bool],
+    timeout: float,
+    interval: Union[float, PollSchedule],
+):
+    """
+    Calls poll_func until it returns True, waiting the given fixed interval
+    or as long as the given schedule decides between calls.
+    """
+    if not isinstance(interval, PollSchedule):
+        polling.poll(poll_func, step=interval, timeout=timeout)
+        return
+
+    polling.poll(
+        poll_func,
+        step=interval.current,
+        step_function=lambda _: interval.advance(),
+        timeout=timeout,
+    )
+
+
+async def _poll_async(
+    poll_func: Callable[[], Any],
+    timeout: float,
+    interval: Union[float, PollSchedule],
+) -> Any:
+    """
+    Calls poll_func in a worker thread until it returns something other than
+    None, and returns that value.  Between calls, this waits the given fixed
+    interval or as long as the given schedule decides using `asyncio.sleep`.
+    """
+    deadline = time.monotonic() + timeout
+
+    while True:
+        result = await asyncio.to_thread(poll_func)
+        if result is not None:
+            return result
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise polling.TimeoutException([], None)
+
+        if isinstance(interval, PollSchedule):
+            step = interval.current
+            interval.advance()
+        else:
+            step = interval
+
+        await asyncio.sleep(min(step, remaining))
@@ -0,0 +1,346 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from linode_api4.objects.filtering import (
+    Filter,
+    FilterableAttribute,
+    _flatten,
+)
+from linode_api4.paginated_list import (
+    AdaptivePageSize,
+    PaginatedList,
+    _observer,
+    _resolve_page_size,
+)
+
+if TYPE_CHECKING:
+    from linode_api4.linode_client import BaseClient
+    from linode_api4.objects import Base
+
+#: The keys of an X-Filter that order or limit results, rather than select them.
+_ORDERING_KEYS = ("+order_by", "+order", "+limit")
+
+
+def _fields(dct: Any) -> List[str]:
+    """
+    Returns the names of every field the given X-Filter dict refers to.
+    """
+    if isinstance(dct, list):
+        return [f for d in dct for f in _fields(d)]
+
+    if not isinstance(dct, dict):
+        return []
+
+    result = []
+    for key, value in dct.items():
+        if key in ("+and", "+or"):
+            result.extend(_fields(value))
+        elif not key.startswith("+"):
+            result.append(key)
+
+    return result
+
+
+def _conjuncts(dct: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Splits the given X-Filter dict into conditions that must all hold, so that
+    each may be sent to the API or evaluated locally on its own.
+    """
+    result = []
+
+    for key, value in _flatten(dct).items():
+        if key == "+and":
+            for term in value:
+                result.extend(_conjuncts(term))
+        elif key not in _ORDERING_KEYS:
+            result.append({key: value})
+
+    return result
+
+
+class Query:
+    """
+    A Query lists a collection, filtering it on any of its models' properties,
+    not only those the API can filter on::
+
+       running = (
+           client.query(Instance)
+           .where(Instance.region == "us-east", status="running")
+           .order_by(Instance.label)
+           .limit(10)
+       )
+
+       for instance in running:
+           print(instance.label)
+
+    Conditions on properties the API accepts filters for are sent with the
+    request, and the rest are evaluated locally as each page arrives.  Results
+    are returned as they are found, and no more pages are requested once the
+    query's limit is reached, so selective queries fetch few pages even when
+    they can't be filtered by the API.
+
+    Queries should be made with :meth:`LinodeClient.query <BaseClient.query>`,
+    and are only supported for top-level collections.  Each method returns a
+    new Query, leaving the one it was called on unchanged.
+    """
+
+    def __init__(self, client: "BaseClient", model: Type["Base"]):
+        self._client = client
+        self.model = model
+        self._filters: Tuple[Filter, ...] = ()
+        self._predicates: Tuple[Callable[[Any], bool], ...] = ()
+        self._order: Optional[Tuple[str, bool]] = None
+        self._limit: Optional[int] = None
+
+    def _copy(self, **changes) -> "Query":
+        result = Query(self._client, self.model)
+        result.__dict__.update(self.__dict__)
+        result.__dict__.update(changes)
+        return result
+
+    def where(
+        self,
+        *conditions: Union[Filter, Callable[[Any], bool]],
+        **fields: Any,
+    ) -> "Query":
+        """
+        Returns a query for the results of this one that meet all the given
+        conditions.
+
+        :param conditions: Filters, such as ``Instance.label.contains("web")``,
+                           or functions that are given each model and return
+                           whether it should be included.  Functions are always
+                           evaluated locally.
+        :type conditions: Union[Filter, Callable[[Base], bool]]
+        :param fields: Values the named properties of results must have.
+
+        :returns: The new query.
+        :rtype: Query
+        """
+        filters = list(self._filters)
+        predicates = list(self._predicates)
+
+        for condition in conditions:
+            if isinstance(condition, Filter):
+                filters.append(condition)
+            elif callable(condition):
+                predicates.append(condition)
+            else:
+                raise TypeError(
+                    "Expected a Filter or function, got {}".format(
+                        type(condition).__name__
+                    )
+                )
+
+        for name, value in fields.items():
+            filters.append(Filter({name: value}))
+
+        return self._copy(
+            _filters=tuple(filters), _predicates=tuple(predicates)
+        )
+
+    def order_by(
+        self, field: Union[FilterableAttribute, str], desc: bool = False
+    ) -> "Query":
+        """
+        Returns a query for the results of this one in the given order.
+
+        :param field: The property to order by.
+        :type field: Union[FilterableAttribute, str]
+        :param desc: If True, results are in descending order.
+        :type desc: bool
+
+        :returns: The new query.
+        :rtype: Query
+        """
+        if isinstance(field, FilterableAttribute):
+            field = field.name
+
+        return self._copy(_order=(field, desc))
+
+    def limit(self, amount: int) -> "Query":
+        """
+        Returns a query for at most the given number of results of this one.
+
+        :param amount: The most results to return.
+        :type amount: int
+
+        :returns: The new query.
+        :rtype: Query
+        """
+        if not isinstance(amount, int) or amount < 0:
+            raise ValueError("Limit must be a non-negative int!")
+
+        return self._copy(_limit=amount)
+
+    def _is_filterable(self, name: str) -> bool:
+        # Nested fields, and fields not known to be filterable, are evaluated
+        # locally
+        for key, prop in getattr(self.model, "properties", {}).items():
+            if name in (key, prop.alias_of):
+                return prop.filterable is True
+
+        return False
+
+    def plan(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Returns how this query's conditions are evaluated, as the filters sent
+        to the API and the conditions evaluated locally.  Local functions
+        given to :meth:`where` are not included.
+
+        :returns: The X-Filter sent with each request, or None if there isn't
+                  one, and the conditions evaluated locally.
+        :rtype: Tuple[Optional[dict], List[dict]]
+        """
+        remote = []
+        local = []
+
+        for f in self._filters:
+            for condition in _conjuncts(f.dct):
+                if all(self._is_filterable(n) for n in _fields(condition)):
+                    remote.append(condition)
+                else:
+                    local.append(condition)
+
+        if self._order is not None and self._is_filterable(self._order[0]):
+            ordering = {"+order_by": self._order[0]}
+            if self._order[1]:
+                ordering["+order"] = "desc"
+        else:
+            ordering = {}
+
+        if not remote and not ordering:
+            return None, local
+
+        if len(remote) == 1:
+            api_filter = dict(remote[0])
+        elif remote:
+            api_filter = {"+and": remote}
+        else:
+            api_filter = {}
+
+        api_filter.update(ordering)
+
+        return api_filter, local
+
+    def _pages(self, api_filter: Optional[Dict[str, Any]]) -> Iterator[list]:
+        endpoint = self.model.api_list()
+        policy = _resolve_page_size(self._client)
+
+        if not isinstance(policy, AdaptivePageSize):
+            page, pages = 1, 1
+
+            while page <= pages:
+                url = "{}?page={}".format(endpoint, page)
+                if policy is not None:
+                    url += "&page_size={}".format(policy)
+
+                result = self._client.get(url, filters=api_filter)
+
+                yield PaginatedList.make_list(
+                    result["data"], self._client, self.model
+                )
+
+                pages = result.get("pages", 1)
+                page += 1
+
+            return
+
+        observe = _observer(policy)
+        offset, total = 0, 1
+
+        while offset < total:
+            # pages may only grow where a page of the new size starts
+            page_size = policy.block_size(policy.initial)
+            while offset % page_size:
+                page_size //= 2
+
+            result = self._client.get(
+                "{}?page={}&page_size={}".format(
+                    endpoint, offset // page_size + 1, page_size
+                ),
+                filters=api_filter,
+                observe=observe,
+            )
+
+            yield PaginatedList.make_list(
+                result["data"], self._client, self.model
+            )
+
+            if not result["data"]:
+                return
+
+            offset += len(result["data"])
+            total = result.get("results", offset)
+
+    def __iter__(self) -> Iterator["Base"]:
+        if self._limit == 0:
+            return
+
+        api_filter, local = self.plan()
+        checks = [Filter(c).compile() for c in local] + list(self._predicates)
+
+        def matches(obj):
+            return all(check(obj) for check in checks)
+
+        if self._order is not None and (
+            api_filter is None or "+order_by" not in api_filter
+        ):
+            # Ordering on a property the API can't sort by needs every match
+            # before any can be returned
+            found = [
+                o
+                for page in self._pages(api_filter)
+                for o in page
+                if matches(o)
+            ]
+            ordering = {"+order_by": self._order[0]}
+            if self._order[1]:
+                ordering["+order"] = "desc"
+            if self._limit is not None:
+                ordering["+limit"] = self._limit
+
+            yield from Filter(ordering).apply(found)
+            return
+
+        count = 0
+
+        for page in self._pages(api_filter):
+            for obj in page:
+                if not matches(obj):
+                    continue
+
+                yield obj
+                count += 1
+
+                if self._limit is not None and count >= self._limit:
+                    return
+
+    def all(self) -> List["Base"]:
+        """
+        Returns every result of this query.
+
+        :returns: The results.
+        :rtype: List[Base]
+        """
+        return list(self)
+
+    def first(self) -> Optional["Base"]:
+        """
+        Returns the first result of this query, fetching only as many pages as
+        it takes to find it.
+
+        :returns: The first result, or None if there are none.
+        :rtype: Optional[Base]
+        """
+        return next(iter(self), None)
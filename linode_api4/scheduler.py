@@ -0,0 +1,223 @@
+"""
+Contains the request scheduler used to share a client's capacity between
+interactive and background traffic.
+"""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+#: The priority class that requests made in the current context are scheduled in.
+#: This is set using :meth:`LinodeClient.priority`.
+_current_priority: ContextVar[Optional[str]] = ContextVar(
+    "linode_api4_request_priority", default=None
+)
+
+
+class PriorityClass:
+    """
+    Describes how requests in one priority class are scheduled by a
+    :any:`RequestScheduler`.
+
+    :param weight: The share of the client's capacity this class receives when
+                   other classes are also waiting.  A class with weight 4 is
+                   dispatched four times as often as a class with weight 1.
+    :type weight: float
+    :param max_concurrency: The maximum number of requests in this class that may
+                            be in flight at once.  If not given, this class is
+                            only limited by the scheduler's overall limit.
+    :type max_concurrency: int
+    """
+
+    def __init__(
+        self, weight: float = 1, max_concurrency: Optional[int] = None
+    ):
+        if weight <= 0:
+            raise ValueError("weight must be greater than 0")
+
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.weight = weight
+        self.max_concurrency = max_concurrency
+
+    def __repr__(self):
+        return "PriorityClass(weight={}, max_concurrency={})".format(
+            self.weight, self.max_concurrency
+        )
+
+
+#: The priority classes used when none are given.  Requests made outside of a
+#: :meth:`LinodeClient.priority` block are scheduled as "interactive".
+DEFAULT_PRIORITY_CLASSES = {
+    "interactive": PriorityClass(weight=8),
+    "background": PriorityClass(weight=1),
+}
+
+DEFAULT_PRIORITY = "interactive"
+
+
+class RequestScheduler:
+    """
+    RequestScheduler limits the number of requests a client has in flight at
+    once, and decides which waiting request is sent next using weighted fair
+    queuing between priority classes.  Requests within a class are sent in the
+    order they were made.
+
+    Schedulers should not be constructed manually, and are instead created by
+    passing `max_concurrent_requests` to a :any:`LinodeClient`.
+
+    :param max_concurrency: The maximum number of requests in flight at once.
+    :type max_concurrency: int
+    :param classes: The priority classes requests may be made in, by name.
+    :type classes: Dict[str, PriorityClass]
+    :param default: The class of requests made without an explicit priority.
+                    Defaults to "interactive" if that class is defined, and
+                    otherwise to the class with the highest weight.
+    :type default: str
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        classes: Optional[Dict[str, PriorityClass]] = None,
+        default: Optional[str] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        if classes is not None and not classes:
+            raise ValueError("At least one priority class must be defined")
+
+        self.classes = dict(
+            DEFAULT_PRIORITY_CLASSES if classes is None else classes
+        )
+
+        if default is None:
+            default = (
+                DEFAULT_PRIORITY
+                if DEFAULT_PRIORITY in self.classes
+                else max(self.classes, key=lambda n: self.classes[n].weight)
+            )
+
+        if default not in self.classes:
+            raise ValueError(
+                "Default priority class {} is not defined".format(default)
+            )
+
+        self.max_concurrency = max_concurrency
+        self.default = default
+
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._active = {name: 0 for name in self.classes}
+        self._waiting = {name: deque() for name in self.classes}
+
+        # Weighted fair queuing state: each class carries the virtual finish
+        # time of its last dispatched request, and the class with the earliest
+        # next finish time is served first.
+        self._finish = {name: 0.0 for name in self.classes}
+        self._virtual_time = 0.0
+
+    def validate(self, name: str):
+        """
+        Raises a ValueError if the given priority class is not defined.
+        """
+        if name not in self.classes:
+            raise ValueError(
+                "Unknown priority class {}; expected one of {}".format(
+                    name, ", ".join(self.classes)
+                )
+            )
+
+    def _next_class(self) -> Optional[str]:
+        """
+        Returns the class whose oldest waiting request should be sent next,
+        or None if no request may be sent right now.
+        """
+        if self._in_flight >= self.max_concurrency:
+            return None
+
+        best = None
+        best_finish = None
+
+        for name, waiting in self._waiting.items():
+            if not waiting:
+                continue
+
+            limit = self.classes[name].max_concurrency
+            if limit is not None and self._active[name] >= limit:
+                continue
+
+            finish = self._finish[name] + 1.0 / self.classes[name].weight
+            if best is None or finish < best_finish:
+                best, best_finish = name, finish
+
+        return best
+
+    def acquire(self, name: Optional[str] = None):
+        """
+        Blocks until a request in the given priority class may be sent.  Every
+        call must be paired with a call to :meth:`release`.
+
+        :param name: The priority class of the request.  Defaults to the
+                     scheduler's default class.
+        :type name: str
+        """
+        name = name or self.default
+        self.validate(name)
+
+        ticket = object()
+
+        with self._cond:
+            waiting = self._waiting[name]
+
+            # A class that was idle starts from the current virtual time, so
+            # it can't claim the capacity it didn't use while idle.
+            if not waiting and self._active[name] == 0:
+                self._finish[name] = max(self._finish[name], self._virtual_time)
+
+            waiting.append(ticket)
+
+            while (
+                self._next_class() != name
+                or self._waiting[name][0] is not ticket
+            ):
+                self._cond.wait()
+
+            waiting.popleft()
+            self._in_flight += 1
+            self._active[name] += 1
+            self._finish[name] += 1.0 / self.classes[name].weight
+            self._virtual_time = self._finish[name]
+
+            # another request may be eligible to be sent as well
+            self._cond.notify_all()
+
+    def release(self, name: Optional[str] = None):
+        """
+        Marks a request in the given priority class as completed.
+
+        :param name: The priority class of the request.
+        :type name: str
+        """
+        name = name or self.default
+
+        with self._cond:
+            self._in_flight -= 1
+            self._active[name] -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, name: Optional[str] = None):
+        """
+        A context manager that holds a request slot in the given priority class
+        for its duration.
+        """
+        self.acquire(name)
+        try:
+            yield
+        finally:
+            self.release(name)
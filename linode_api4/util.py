@@ -2,8 +2,9 @@
 Contains various utility functions.
 """
 
+import importlib
 import string
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
 
 
 def drop_null_keys(data: Dict[Any, Any], recursive=True) -> Dict[Any, Any]:
@@ -60,3 +61,61 @@ def generate_device_suffixes(n: int) -> list[str]:
         result.append(s)
         i += 1
     return result
+
+
+def lazy_exports(
+    package: str,
+    namespace: Dict[str, Any],
+    exports: Dict[str, Iterable[str]],
+    submodules: Iterable[str] = (),
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds the module-level ``__getattr__`` and ``__dir__`` functions (PEP 562)
+    for a package whose exports are only imported when they are first accessed.
+
+    :param package: The name of the package, i.e. its ``__name__``.
+    :param namespace: The package's globals, where loaded exports are cached.
+    :param exports: A dict mapping module names to the names they export.
+                    Relative module names are resolved against the package.
+    :param submodules: The package's submodules in import order.  These may be
+                       accessed as attributes of the package, and are searched
+                       for names that aren't listed in ``exports``.
+    """
+    modules = {
+        name: module for module, names in exports.items() for name in names
+    }
+    submodules = tuple(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(package, name)
+            )
+
+        if name in modules:
+            module = importlib.import_module(modules[name], package)
+            value = getattr(module, name)
+        elif name in submodules:
+            return importlib.import_module("." + name, package)
+        else:
+            # Fall back to searching every submodule, where later submodules
+            # take precedence as they would with star imports.
+            found = False
+            for submodule in submodules:
+                module = importlib.import_module("." + submodule, package)
+                if hasattr(module, name):
+                    value = getattr(module, name)
+                    found = True
+
+            if not found:
+                raise AttributeError(
+                    "module {!r} has no attribute {!r}".format(package, name)
+                )
+
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(modules) | set(submodules))
+
+    return __getattr__, __dir__
@@ -0,0 +1,151 @@
+import threading
+import time
+from test.unit.base import ClientBaseCase
+
+from linode_api4 import BatchResult, Instance
+
+
+class BatchExecutorTest(ClientBaseCase):
+    """
+    Tests for running operations through client.batch()
+    """
+
+    def test_run_methods(self):
+        """
+        Tests that (object, method) items are run and their results returned
+        in order.
+        """
+        instances = [Instance(self.client, 123), Instance(self.client, 456)]
+
+        with self.mock_post({}) as m:
+            results = self.client.batch().run(
+                [(instances[0], "reboot"), (instances[1], Instance.reboot)]
+            )
+
+            self.assertEqual(m.call_count, 2)
+            self.assertEqual(
+                sorted(c[0][0][1:] for c in m.mock.call_args_list),
+                [
+                    "/linode/instances/123/reboot",
+                    "/linode/instances/456/reboot",
+                ],
+            )
+
+        self.assertEqual([r.item[0] for r in results], instances)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual([r.result for r in results], [True, True])
+
+    def test_run_callables_with_args(self):
+        """
+        Tests that callables and items with args and kwargs are supported.
+        """
+
+        def add(a, b, scale=1):
+            return (a + b) * scale
+
+        class Adder:
+            def add(self, a, b, scale=1):
+                return add(a, b, scale=scale)
+
+        results = self.client.batch(max_workers=2).run(
+            [
+                lambda: 1,
+                (Adder(), "add", (1, 2)),
+                (Adder(), "add", (1, 2), {"scale": 3}),
+            ]
+        )
+
+        self.assertEqual([r.result for r in results], [1, 3, 9])
+
+    def test_errors_in_order(self):
+        """
+        Tests that errors are collected per item without stopping the batch.
+        """
+
+        def fail():
+            raise ValueError("nope")
+
+        results = self.client.batch().run([lambda: 1, fail, lambda: 3])
+
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(results[2].result, 3)
+
+    def test_fail_fast(self):
+        """
+        Tests that items not yet started are cancelled after a failure in
+        fail-fast mode.
+        """
+
+        def fail():
+            raise ValueError("nope")
+
+        results = self.client.batch(max_workers=1, fail_fast=True).run(
+            [lambda: 1, fail, lambda: 3, lambda: 4]
+        )
+
+        self.assertTrue(results[0].ok)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertTrue(results[2].cancelled)
+        self.assertTrue(results[3].cancelled)
+        self.assertFalse(results[3].ok)
+
+    def test_max_workers(self):
+        """
+        Tests that no more than max_workers items run at once.
+        """
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        self.client.batch(max_workers=3).run([work] * 12)
+
+        self.assertEqual(peak, 3)
+
+    def test_rate(self):
+        """
+        Tests that items are started no faster than the given rate.
+        """
+        starts = []
+
+        results = self.client.batch(max_workers=4, rate=50).run(
+            [lambda: starts.append(time.monotonic())] * 5
+        )
+
+        self.assertTrue(all(r.ok for r in results))
+        self.assertGreaterEqual(max(starts) - min(starts), 4 / 50 * 0.9)
+
+    def test_progress(self):
+        """
+        Tests that the progress callback is called for every item.
+        """
+        calls = []
+
+        self.client.batch(
+            progress=lambda r, done, total: calls.append((r, done, total))
+        ).run([lambda: 1, lambda: 2])
+
+        self.assertEqual([(c[1], c[2]) for c in calls], [(1, 2), (2, 2)])
+        self.assertTrue(all(isinstance(c[0], BatchResult) for c in calls))
+
+    def test_invalid_items(self):
+        """
+        Tests that invalid items and options are rejected up front.
+        """
+        with self.assertRaises(TypeError):
+            self.client.batch().run([123])
+
+        with self.assertRaises(ValueError):
+            self.client.batch(max_workers=0)
+
+        with self.assertRaises(ValueError):
+            self.client.batch(rate=0)
@@ -0,0 +1,140 @@
+import time
+from test.unit.base import ClientBaseCase
+
+from linode_api4 import Instance, QueryCache, Volume
+from linode_api4.cache import cache_key
+from linode_api4.objects import and_, or_
+
+
+class QueryCacheTest(ClientBaseCase):
+    """
+    Tests caching the results of listing collections.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.cache = QueryCache(ttl={Instance: 60, Volume: 0})
+        self.client.query_cache = self.cache
+
+    def test_cache_key(self):
+        """
+        Tests that filters with the same meaning have the same key
+        """
+        a = Instance.label == "a"
+        b = Instance.region == "us-east"
+        c = Instance.tags.contains("prod")
+
+        self.assertEqual(
+            cache_key("/linode/instances", and_(a, and_(b, c)).dct),
+            cache_key("/linode/instances", and_(and_(c, a), b).dct),
+        )
+        self.assertNotEqual(
+            cache_key("/linode/instances", and_(a, b).dct),
+            cache_key("/linode/instances", or_(a, b).dct),
+        )
+        self.assertNotEqual(
+            cache_key("/linode/instances", a.dct),
+            cache_key("/volumes", a.dct),
+        )
+
+    def test_cached_lists(self):
+        """
+        Tests that identical requests are served from the cache until they
+        expire, and that models with no TTL aren't cached
+        """
+        with self.mock_get("linode/instances") as m:
+            first = self.client.linode.instances(
+                Instance.label == "a", Instance.region == "us-east"
+            )
+            second = self.client.linode.instances(
+                Instance.region == "us-east", Instance.label == "a"
+            )
+            self.assertEqual(m.call_count, 1)
+
+            # each hit is its own list over the cached pages
+            self.assertIsNot(first, second)
+            self.assertIs(first.lists, second.lists)
+            self.assertEqual(next(first).id, next(second).id)
+
+            self.client.linode.instances(Instance.label == "b")
+            self.assertEqual(m.call_count, 2)
+
+            # expire every entry
+            for key, entry in list(self.cache._entries.items()):
+                self.cache._entries[key] = (time.monotonic() - 1,) + entry[1:]
+
+            self.client.linode.instances(Instance.label == "b")
+            self.assertEqual(m.call_count, 3)
+
+        with self.mock_get("volumes") as m:
+            self.client.volumes()
+            self.client.volumes()
+            self.assertEqual(m.call_count, 2)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 5))
+
+    def test_changed_since(self):
+        """
+        Tests that changed_since always asks the API
+        """
+        with self.mock_get("linode/instances") as m:
+            self.client.linode.changed_since("2024-01-01T00:00:00")
+            self.client.linode.changed_since("2024-01-01T00:00:00")
+            self.assertEqual(m.call_count, 2)
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_eviction(self):
+        """
+        Tests that the least recently used results are evicted first
+        """
+        self.cache.max_entries = 2
+
+        with self.mock_get("linode/instances") as m:
+            self.client.linode.instances(Instance.label == "a")
+            self.client.linode.instances(Instance.label == "b")
+            self.client.linode.instances(Instance.label == "a")
+            self.client.linode.instances(Instance.label == "c")
+            self.assertEqual(m.call_count, 3)
+
+            self.client.linode.instances(Instance.label == "a")
+            self.assertEqual(m.call_count, 3)
+            self.client.linode.instances(Instance.label == "b")
+            self.assertEqual(m.call_count, 4)
+
+    def test_invalidation(self):
+        """
+        Tests that events and changes made by the client drop the results they
+        may have changed
+        """
+        with self.mock_get("linode/instances") as m:
+            self.client.linode.instances()
+            self.client.account.events()
+            self.assertEqual(len(self.cache), 2)
+
+            self.assertEqual(
+                self.cache.apply(
+                    {
+                        "action": "volume_create",
+                        "entity": {"type": "volume", "id": 1},
+                    }
+                ),
+                1,
+            )
+            self.assertEqual(len(self.cache), 1)
+
+            self.cache.apply(
+                {"action": "linode_boot", "entity": {"type": "linode", "id": 1}}
+            )
+            self.assertEqual(len(self.cache), 0)
+
+            self.client.linode.instances()
+
+        with self.mock_put("linode/instances/123"):
+            instance = Instance(self.client, 123)
+            instance._set("_populated", True)
+            instance.label = "renamed"
+            instance.save()
+
+        self.assertEqual(len(self.cache), 0)
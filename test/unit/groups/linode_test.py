@@ -1,3 +1,5 @@
+import json
+from datetime import datetime
 from test.unit.base import ClientBaseCase
 from test.unit.objects.linode_interface_test import (
     build_interface_options_public,
@@ -5,8 +7,12 @@ from test.unit.objects.linode_interface_test import (
     build_interface_options_vpc,
 )
 
-from linode_api4 import InstancePlacementGroupAssignment, InterfaceGeneration
-from linode_api4.objects import ConfigInterface
+from linode_api4 import (
+    Instance,
+    InstancePlacementGroupAssignment,
+    InterfaceGeneration,
+)
+from linode_api4.objects import ConfigInterface, limit, order_by
 
 
 class LinodeTest(ClientBaseCase):
@@ -142,6 +148,98 @@ class LinodeTest(ClientBaseCase):
 
         self.assertEqual(m.call_data["maintenance_policy"], "linode/migrate")
 
+    def test_changed_since(self):
+        """
+        Tests that only Instances updated since a time are requested, and that
+        the newest updated time is returned.
+        """
+        with self.mock_get("linode/instances") as m:
+            changes = self.client.linode.changed_since(
+                datetime(2016, 12, 31), Instance.group == "test"
+            )
+
+            self.assertEqual(
+                json.loads(m.call_headers["X-Filter"]),
+                {
+                    "+and": [
+                        {"group": "test"},
+                        {"updated": {"+gte": "2016-12-31T00:00:00"}},
+                    ],
+                    "+order_by": "updated",
+                    "+order": "asc",
+                },
+            )
+
+        self.assertEqual(len(changes), 3)
+        self.assertEqual([i.id for i in changes], [123, 456, 124])
+        self.assertEqual(changes.high_water_mark, datetime(2017, 1, 1))
+
+        with self.mock_get({"data": [], "page": 1, "pages": 1, "results": 0}):
+            changes = self.client.linode.changed_since("2018-01-01T00:00:00")
+
+        self.assertEqual(len(changes), 0)
+        self.assertEqual(changes.high_water_mark, datetime(2018, 1, 1))
+
+    def test_changed_since_ordering(self):
+        """
+        Tests that ordering from the given filters is replaced, and that their
+        conditions are flattened alongside the timestamp.
+        """
+        with self.mock_get("linode/instances") as m:
+            self.client.linode.changed_since(
+                "2016-12-31T00:00:00",
+                (Instance.group == "test") & (Instance.label == "a"),
+                order_by(Instance.label, desc=True),
+                limit(2),
+            )
+
+            self.assertEqual(
+                json.loads(m.call_headers["X-Filter"]),
+                {
+                    "+and": [
+                        {"group": "test"},
+                        {"label": "a"},
+                        {"updated": {"+gte": "2016-12-31T00:00:00"}},
+                    ],
+                    "+order_by": "updated",
+                    "+order": "asc",
+                    "+limit": 2,
+                },
+            )
+
+    def test_count(self):
+        """
+        Tests that Instances are counted from the smallest page, and that
+        oversized filters fall back to listing them.
+        """
+        with self.mock_get(
+            {"data": [{"id": 1}], "page": 1, "pages": 7, "results": 160}
+        ) as m:
+            count = self.client.linode.count(Instance.tags.contains("web"))
+
+            self.assertEqual(count, 160)
+            self.assertEqual(
+                m.call_url, "/linode/instances?page=1&page_size=25"
+            )
+            self.assertEqual(
+                json.loads(m.call_headers["X-Filter"]),
+                {"tags": {"+contains": "web"}},
+            )
+
+        with self.mock_get(
+            {"data": [], "page": 1, "pages": 1, "results": 0}
+        ) as m:
+            self.assertFalse(self.client.linode.exists(Instance.label == "x"))
+            self.assertEqual(m.call_count, 1)
+
+        f = Instance.id == 0
+        for i in range(1, 150):
+            f = f | (Instance.id == i)
+
+        with self.mock_get("linode/instances") as m:
+            self.assertEqual(self.client.linode.count(f), 3)
+            self.assertEqual(m.call_count, 2)
+
 
 class TypeTest(ClientBaseCase):
     def test_get_types(self):
@@ -1,11 +1,126 @@
+import asyncio
+import datetime
 import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from unittest.mock import patch
 
 import httpretty
+import polling
 import pytest
 
 from linode_api4 import LinodeClient
-from linode_api4.polling import EventError
+from linode_api4.polling import (
+    EventError,
+    EventHub,
+    PollSchedule,
+    TimeoutContext,
+)
+
+
+class FakeEventFeed:
+    """
+    Serves /account/events from a list of events, honoring the filters used
+    by the event hub.  Events are created through :meth:`add` and move to
+    their final status after a given number of further requests.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.filters = []
+        self._lock = threading.Lock()
+        self._next_id = 100
+
+    def add(
+        self,
+        entity_id,
+        action="linode_shutdown",
+        polls=2,
+        final="finished",
+        delay=0,
+        entity_type="linode",
+    ):
+        with self._lock:
+            self._next_id += 1
+            self.events.append(
+                {
+                    "id": self._next_id,
+                    "action": action,
+                    "entity": {"id": entity_id, "type": entity_type},
+                    "status": "started",
+                    "message": None,
+                    "_remaining": delay + polls,
+                    "_hidden": delay,
+                    "_final": final,
+                }
+            )
+
+    @staticmethod
+    def _matches(event, f):
+        for k, v in f.items():
+            if k in ("+order", "+order_by"):
+                continue
+
+            if k == "+or":
+                if not any(FakeEventFeed._matches(event, c) for c in v):
+                    return False
+            elif k == "+and":
+                if not all(FakeEventFeed._matches(event, c) for c in v):
+                    return False
+            elif k == "id":
+                if isinstance(v, dict):
+                    if not event["id"] > v["+gt"]:
+                        return False
+                elif event["id"] != v:
+                    return False
+            elif k.startswith("entity."):
+                if event["entity"][k.split(".")[1]] != v:
+                    return False
+            elif event[k] != v:
+                return False
+
+        return True
+
+    def _tick(self):
+        for event in self.events:
+            if event["_remaining"] == 0:
+                event["status"] = event["_final"]
+            event["_remaining"] -= 1
+            event["_hidden"] -= 1
+
+    def get_event(self, request, uri, headers):
+        """
+        Serves /account/events/{id}.
+        """
+        event_id = int(uri.rstrip("/").split("/")[-1])
+
+        with self._lock:
+            self._tick()
+            event = next(e for e in self.events if e["id"] == event_id)
+            body = {k: v for k, v in event.items() if not k.startswith("_")}
+
+        return 200, headers, json.dumps(body)
+
+    def __call__(self, request, uri, headers):
+        f = json.loads(request.headers["X-Filter"])
+
+        with self._lock:
+            self.filters.append(f)
+            self._tick()
+
+            data = [
+                {k: v for k, v in e.items() if not k.startswith("_")}
+                for e in self.events
+                if e["_hidden"] < 0 and self._matches(e, f)
+            ]
+
+        data.sort(key=lambda e: e["id"], reverse=f.get("+order") == "desc")
+
+        body = {"data": data, "page": 1, "pages": 1, "results": len(data)}
+        return 200, headers, json.dumps(body)
 
 
 class TestPolling:
@@ -329,6 +444,91 @@ class TestPolling:
         else:
             raise Exception("Expected event error, got none")
 
+    @httpretty.activate
+    def test_event_poller_cursor(self, client):
+        """
+        Tests that EventPoller only requests events newer than the newest
+        event it has seen.
+        """
+        existing = self.body_event_list_status("finished")
+        existing["data"][0]["id"] = 9
+
+        new = self.body_event_list_status("started")
+        new["data"][0]["id"] = 10
+
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://localhost/account/events",
+            responses=[
+                httpretty.Response(body=json.dumps(existing)),
+                httpretty.Response(body=json.dumps(new)),
+            ],
+        )
+
+        poller = client.polling.event_poller_create(
+            "linode", "linode_shutdown", entity_id=11111
+        )
+        assert poller.last_event_id == 9
+
+        result = poller.wait_for_next_event(interval=0.1)
+
+        assert result.id == 10
+        assert poller.last_event_id == 10
+
+        filters = [
+            json.loads(r.headers["X-Filter"])
+            for r in httpretty.latest_requests()
+        ]
+
+        assert filters[0]["+order"] == "desc"
+        assert "id" not in filters[0]
+        assert filters[1]["id"] == {"+gt": 9}
+
+    @httpretty.activate
+    def test_event_poller_checkpoint(self, client, tmp_path):
+        """
+        Tests that EventPoller resumes from its checkpoint file.
+        """
+        checkpoint = str(tmp_path / "poller.json")
+
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://localhost/account/events",
+            responses=[
+                httpretty.Response(
+                    body=json.dumps(self.body_event_list_empty())
+                ),
+                httpretty.Response(
+                    body=json.dumps(self.body_event_list_status("started"))
+                ),
+                httpretty.Response(
+                    body=json.dumps(self.body_event_list_empty())
+                ),
+            ],
+        )
+
+        client.polling.event_poller_create(
+            "linode", "linode_shutdown", entity_id=11111, checkpoint=checkpoint
+        ).wait_for_next_event(interval=0.1)
+
+        assert len(httpretty.latest_requests()) == 2
+
+        poller = client.polling.event_poller_create(
+            "linode", "linode_shutdown", entity_id=11111, checkpoint=checkpoint
+        )
+
+        # The position is restored without requesting the latest event
+        assert len(httpretty.latest_requests()) == 2
+        assert poller.last_event_id == 123
+
+        # Pollers with a different configuration ignore the checkpoint
+        other = client.polling.event_poller_create(
+            "linode", "linode_boot", entity_id=11111, checkpoint=checkpoint
+        )
+
+        assert len(httpretty.latest_requests()) == 3
+        assert other.last_event_id == 0
+
     def test_event_error(
         self,
     ):
@@ -342,3 +542,906 @@ class TestPolling:
         assert str(EventError(123, None)) == "Event 123 failed"
         assert str(EventError(123, "")) == "Event 123 failed"
         assert str(EventError(123, "foobar")) == "Event 123 failed: foobar"
+
+
+class TestEventHub:
+    @pytest.fixture
+    def client(self):
+        client = LinodeClient("testing", base_url="https://localhost")
+        client.polling.enable_event_hub()
+        return client
+
+    @pytest.fixture
+    def feed(self):
+        feed = FakeEventFeed()
+
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET, "https://localhost/account/events", body=feed
+        )
+
+        yield feed
+
+        httpretty.disable()
+        httpretty.reset()
+
+    def test_enable_event_hub(self, client, feed):
+        """
+        Tests that the event hub is created once per client and used by
+        new pollers.
+        """
+        hub = client.polling.event_hub
+
+        assert hub is not None
+        assert client.polling.enable_event_hub() is hub
+        assert (
+            client.polling.event_poller_create("linode", "linode_shutdown")._hub
+            is hub
+        )
+
+    def test_shared_event_stream(self, client, feed):
+        """
+        Tests that many concurrent pollers share a single stream of requests.
+        """
+        waiters = 20
+
+        pollers = [
+            client.polling.event_poller_create(
+                "linode", "linode_shutdown", entity_id=i
+            )
+            for i in range(waiters)
+        ]
+
+        # Only the first poller needs to find the hub's starting point
+        assert len(feed.filters) == 1
+
+        for i in range(waiters):
+            feed.add(i, polls=3)
+
+        with ThreadPoolExecutor(max_workers=waiters) as executor:
+            results = list(
+                executor.map(
+                    lambda p: p.wait_for_next_event_finished(
+                        timeout=10, interval=0.05
+                    ),
+                    pollers,
+                )
+            )
+
+        assert [r.entity.id for r in results] == list(range(waiters))
+        assert all(r.status == "finished" for r in results)
+
+        # Polling separately would take at least one request per waiter
+        assert len(feed.filters) < waiters
+
+        for f in feed.filters[1:]:
+            assert "entity.id" not in f
+            assert f["+order_by"] == "id"
+
+    def test_replay_history(self, client, feed):
+        """
+        Tests that events the hub received before a poller started waiting
+        are still delivered to it.
+        """
+        poller = client.polling.event_poller_create(
+            "linode", "linode_shutdown", entity_id=11111
+        )
+        feed.add(11111)
+
+        client.polling.event_hub.poll()
+        requests = len(feed.filters)
+
+        result = poller.wait_for_next_event(timeout=10, interval=60)
+
+        assert result.entity.id == 11111
+        assert len(feed.filters) == requests
+
+    def test_replay_history_truncated(self, client, feed):
+        """
+        Tests that events dropped from the hub's history are fetched again.
+        """
+        hub = EventHub(client, history_size=1)
+        after_id = hub.cursor()
+
+        feed.add(11111)
+        feed.add(22222)
+        hub.poll()
+
+        result = hub.wait_for(
+            lambda events: next(
+                (e for e in events if e["entity"]["id"] == 11111), None
+            ),
+            timeout=10,
+            interval=60,
+            after_id=after_id,
+        )
+
+        assert result["id"] == 101
+        assert feed.filters[-1]["id"] == {"+gt": after_id}
+
+    def test_event_failed(self, client, feed):
+        """
+        Tests that failed events raise an error through the event hub.
+        """
+        poller = client.polling.event_poller_create(
+            "linode", "linode_shutdown", entity_id=11111
+        )
+        feed.add(11111, final="failed")
+
+        with pytest.raises(EventError):
+            poller.wait_for_next_event_finished(timeout=10, interval=0.05)
+
+    def test_wait_for_entity_free(self, client, feed):
+        """
+        Tests that wait_for_entity_free waits for events that start while it
+        is waiting, and ignores other entities.
+        """
+        feed.add(11111, polls=2)
+        feed.add(22222, polls=100)
+        feed.add(11111, polls=3, delay=2)
+
+        client.polling.wait_for_entity_free("linode", 11111, 10, 0.05)
+
+        assert [e["status"] for e in feed.events] == [
+            "finished",
+            "started",
+            "finished",
+        ]
+
+    def test_async_shared_event_stream(self, client, feed):
+        """
+        Tests that async waits share the hub's stream of requests.
+        """
+        waiters = 20
+        pollers = [
+            client.polling.event_poller_create(
+                "linode", "linode_shutdown", entity_id=i
+            )
+            for i in range(waiters)
+        ]
+
+        for i in range(waiters):
+            feed.add(i, polls=3)
+
+        async def wait_all():
+            return await asyncio.gather(
+                *(
+                    p.async_wait_for_next_event_finished(
+                        timeout=10, interval=0.05
+                    )
+                    for p in pollers
+                ),
+                client.polling.async_wait_for_entity_free(
+                    "linode", 0, timeout=10, interval=0.05
+                ),
+            )
+
+        results = asyncio.run(wait_all())[:waiters]
+
+        assert [r.entity.id for r in results] == list(range(waiters))
+        assert all(r.status == "finished" for r in results)
+
+        # Polling separately would take at least one request per waiter
+        assert len(feed.filters) < waiters
+
+        for f in feed.filters[1:]:
+            if "entity.id" not in f:
+                assert f["+order_by"] == "id"
+
+        # Only the entity wait's initial request is for one entity
+        assert sum("entity.id" in f for f in feed.filters) == 1
+
+    def test_async_timeout(self, client, feed):
+        """
+        Tests that async waits on the event hub time out.
+        """
+        with pytest.raises(polling.TimeoutException):
+            asyncio.run(
+                client.polling.event_hub.async_wait_for(
+                    lambda events: None, timeout=0.2, interval=0.05
+                )
+            )
+
+        assert client.polling.event_hub._waiters == []
+
+    def test_timeout(self, client, feed):
+        """
+        Tests that waiting on the event hub times out.
+        """
+        with pytest.raises(polling.TimeoutException):
+            client.polling.event_hub.wait_for(
+                lambda events: None, timeout=0.2, interval=0.05
+            )
+
+
+class TestWaitForMany:
+    @pytest.fixture
+    def client(self):
+        return LinodeClient("testing", base_url="https://localhost")
+
+    @pytest.fixture
+    def feed(self):
+        feed = FakeEventFeed()
+
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET, "https://localhost/account/events", body=feed
+        )
+
+        yield feed
+
+        httpretty.disable()
+        httpretty.reset()
+
+    def test_wait_for_many(self, client, feed):
+        """
+        Tests that many entities are waited on with one request per poll, and
+        that results are returned as entities complete.
+        """
+        entities = [("linode", i) for i in range(50)]
+
+        # An event from before the call is ignored
+        feed.add(0, polls=0)
+
+        results = client.polling.wait_for_many(
+            entities, action="linode_shutdown", interval=0.01
+        )
+
+        for i in reversed(range(50)):
+            feed.add(i, polls=1 + i % 5)
+
+        # Unrelated events are ignored
+        feed.add(1000, polls=0)
+        feed.add(1, action="linode_boot", polls=0)
+
+        ids = [r.entity_id for r in results]
+
+        assert sorted(ids) == list(range(50))
+        assert ids.index(0) < ids.index(4)
+
+        # The baseline request, then one request per poll
+        assert len(feed.filters) <= 8
+
+        polls = feed.filters[1:]
+        assert all(f["action"] == "linode_shutdown" for f in polls)
+
+        # Later polls only ask for new events and the ones still running
+        events, entities = zip(*(f["+and"] for f in polls))
+        assert events[0]["+or"] == [{"id": {"+gt": 101}}]
+        assert events[1]["+or"][0] == {"id": {"+gt": 151}}
+        assert len(events[-1]["+or"]) == 11
+
+        # Entities are no longer requested once they complete
+        assert len(entities[0]["+or"]) == 50
+        assert len(entities[-1]["+or"]) == 10
+
+    def test_wait_for_many_chunked(self, client, feed):
+        """
+        Tests that entities too many to request at once are split over several
+        requests per poll.
+        """
+        results = client.polling.wait_for_many(
+            [("linode", i) for i in range(250)], interval=0.01
+        )
+
+        for i in range(250):
+            feed.add(i, polls=0)
+
+        assert sorted(r.entity_id for r in results) == list(range(250))
+
+        polls = feed.filters[1:]
+        assert [len(f["+and"][1]["+or"]) for f in polls] == [100, 100, 50]
+
+    def test_wait_for_many_errors(self, client, feed):
+        """
+        Tests that failed and timed out entities are reported.
+        """
+        results = client.polling.wait_for_many(
+            [("linode", 1), ("linode", 2), ("linode", 3), ("linode", 4)],
+            timeout=1,
+            entity_timeout=0.1,
+            interval=0.05,
+        )
+
+        feed.add(1, polls=0)
+        feed.add(2, polls=0, final="failed")
+        feed.add(3, polls=1000)
+
+        results = {r.entity_id: r for r in results}
+
+        assert results[1].ok
+        assert results[1].event.status == "finished"
+
+        assert isinstance(results[2].error, EventError)
+        assert results[2].event.id == 102
+
+        # Entity 3 started but took too long, and entity 4 never started
+        assert isinstance(results[3].error, polling.TimeoutException)
+        assert isinstance(results[4].error, polling.TimeoutException)
+
+
+class TestWaitForState:
+    @pytest.fixture
+    def client(self):
+        return LinodeClient("testing", base_url="https://localhost")
+
+    @pytest.fixture
+    def feed(self):
+        feed = FakeEventFeed()
+
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET, "https://localhost/account/events", body=feed
+        )
+
+        yield feed
+
+        httpretty.disable()
+        httpretty.reset()
+
+    @staticmethod
+    def register_object(url, feed, body):
+        """
+        Serves an object whose body depends on whether the feed's events have
+        all finished, and returns the list of requests made for it.
+        """
+        requests = []
+
+        def callback(request, uri, headers):
+            requests.append(uri)
+            done = all(e["status"] == "finished" for e in feed.events)
+            return 200, headers, json.dumps(body(done))
+
+        httpretty.register_uri(
+            httpretty.GET, "https://localhost" + url, body=callback
+        )
+
+        return requests
+
+    def test_instance_wait_for(self, client, feed):
+        """
+        Tests that an Instance is only re-fetched when its event completes.
+        """
+        from linode_api4 import Instance
+
+        feed.add(123, action="linode_boot", polls=5, delay=1)
+        feed.add(456, action="linode_boot", polls=0, delay=1)
+
+        gets = self.register_object(
+            "/linode/instances/123",
+            feed,
+            lambda done: {
+                "id": 123,
+                "status": "running" if done else "booting",
+            },
+        )
+
+        instance = Instance(client, 123)
+        assert instance.wait_for(interval=0.01) is instance
+
+        assert instance.status == "running"
+        assert len(gets) == 2
+
+        # after the requests for the latest event and already running events
+        polls = feed.filters[2:]
+        assert len(polls) == 5
+        assert all(f["entity.id"] == 123 for f in polls)
+
+        # The started event is followed until it completes
+        assert polls[-1]["+or"] == [{"id": {"+gt": 101}}, {"id": 101}]
+
+    def test_wait_for_running_event(self, client, feed):
+        """
+        Tests that an event already running when the wait starts is followed
+        until it completes, even though it never passes the cursor.
+        """
+        from linode_api4 import Instance
+
+        feed.add(123, action="linode_boot", polls=3)
+
+        gets = self.register_object(
+            "/linode/instances/123",
+            feed,
+            lambda done: {
+                "id": 123,
+                "status": "running" if done else "booting",
+            },
+        )
+
+        instance = Instance(client, 123)
+        instance.wait_for(timeout=1, interval=0.01)
+
+        assert instance.status == "running"
+        assert len(gets) == 2
+        assert feed.filters[-1]["+or"] == [{"id": {"+gt": 101}}, {"id": 101}]
+
+    def test_image_wait_for(self, client, feed):
+        """
+        Tests that an Image is matched to its events by its numeric ID.
+        """
+        from linode_api4 import Image
+
+        feed.add(1337, "image_upload", polls=1, delay=1, entity_type="image")
+
+        gets = self.register_object(
+            "/images/private/1337",
+            feed,
+            lambda done: {
+                "id": "private/1337",
+                "status": "available" if done else "pending_upload",
+            },
+        )
+
+        image = Image(client, "private/1337")
+        image.wait_for(interval=0.01)
+
+        assert image.status == "available"
+        assert len(gets) == 2
+        assert feed.filters[-1]["entity.id"] == 1337
+
+    def test_node_pool_wait_for_ready(self, client, feed):
+        """
+        Tests that a node pool watches the events of its cluster and nodes.
+        """
+        from linode_api4 import LKENodePool
+
+        feed.add(18881, "lke_node_recycle", polls=2, entity_type="lkecluster")
+        feed.add(111, "linode_boot", polls=3, delay=2)
+
+        gets = self.register_object(
+            "/lke/clusters/18881/pools/456",
+            feed,
+            lambda done: {
+                "id": 456,
+                "nodes": [
+                    {"id": "a", "instance_id": 111, "status": "ready"},
+                    {
+                        "id": "b",
+                        "instance_id": 222,
+                        "status": "ready" if done else "not_ready",
+                    },
+                ],
+            },
+        )
+
+        pool = LKENodePool(client, 456, 18881)
+        pool.wait_for_ready(interval=0.01)
+
+        assert all(node.status == "ready" for node in pool.nodes)
+
+        # One fetch for the node IDs, one up front and one on completion;
+        # the cluster's event settling first triggers one more
+        assert len(gets) <= 4
+        assert feed.filters[-1]["+and"][0]["+or"] == [
+            {"entity.type": "lkecluster", "entity.id": 18881},
+            {"entity.type": "linode", "entity.id": 111},
+            {"entity.type": "linode", "entity.id": 222},
+        ]
+
+    def test_node_pool_wait_for_nodes(self, client, feed):
+        """
+        Tests that a node pool isn't ready until it has as many nodes as its
+        count, and that nodes added while waiting are watched.
+        """
+        from linode_api4 import LKENodePool
+
+        feed.add(18881, "lke_pool_create", polls=2, entity_type="lkecluster")
+        feed.add(111, "linode_boot", polls=2, delay=3)
+
+        def callback(request, uri, headers):
+            created, booted = (e["status"] == "finished" for e in feed.events)
+            node = {
+                "id": "a",
+                "instance_id": 111,
+                "status": "ready" if booted else "not_ready",
+            }
+            body = {"id": 456, "count": 1, "nodes": [node] if created else []}
+            return 200, headers, json.dumps(body)
+
+        httpretty.register_uri(
+            httpretty.GET,
+            "https://localhost/lke/clusters/18881/pools/456",
+            body=callback,
+        )
+
+        pool = LKENodePool(client, 456, 18881)
+        pool.wait_for_ready(timeout=5, interval=0.01)
+
+        assert [node.status for node in pool.nodes] == ["ready"]
+        assert feed.filters[-1]["+and"][0]["+or"] == [
+            {"entity.type": "lkecluster", "entity.id": 18881},
+            {"entity.type": "linode", "entity.id": 111},
+        ]
+
+    def test_wait_for_timeout(self, client, feed):
+        """
+        Tests that waiting on a state that's never reached times out.
+        """
+        from linode_api4 import Volume
+
+        self.register_object(
+            "/volumes/1", feed, lambda done: {"id": 1, "status": "creating"}
+        )
+
+        with pytest.raises(polling.TimeoutException):
+            Volume(client, 1).wait_for(timeout=0.1, interval=0.01)
+
+
+class TestAsyncPolling:
+    @pytest.fixture
+    def client(self):
+        return LinodeClient("testing", base_url="https://localhost")
+
+    @pytest.fixture
+    def feed(self):
+        feed = FakeEventFeed()
+
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET,
+            re.compile(r"https://localhost/account/events/\d+"),
+            body=feed.get_event,
+        )
+        httpretty.register_uri(
+            httpretty.GET, "https://localhost/account/events", body=feed
+        )
+
+        yield feed
+
+        httpretty.disable()
+        httpretty.reset()
+
+    def test_async_wait_for_next_event_finished(self, client, feed):
+        """
+        Tests that many pollers can be awaited concurrently.
+        """
+        pollers = [
+            client.polling.event_poller_create(
+                "linode", "linode_shutdown", entity_id=i
+            )
+            for i in range(20)
+        ]
+
+        for i in range(20):
+            feed.add(i, polls=3)
+
+        async def wait_all():
+            return await asyncio.gather(
+                *(
+                    p.async_wait_for_next_event_finished(
+                        timeout=10, interval=0.01
+                    )
+                    for p in pollers
+                )
+            )
+
+        results = asyncio.run(wait_all())
+
+        assert [r.entity.id for r in results] == list(range(20))
+        assert all(r.status == "finished" for r in results)
+
+    def test_async_wait_failed(self, client, feed):
+        """
+        Tests that failed events raise an error when awaited.
+        """
+        poller = client.polling.event_poller_create(
+            "linode", "linode_shutdown", entity_id=1
+        )
+        feed.add(1, final="failed")
+
+        with pytest.raises(EventError):
+            asyncio.run(
+                poller.async_wait_for_next_event_finished(
+                    timeout=10, interval=0.01
+                )
+            )
+
+    def test_async_wait_for_entity_free(self, client, feed):
+        """
+        Tests that waiting for an entity to be free can be awaited, and
+        times out.
+        """
+        feed.add(1, polls=3)
+        feed.add(2, polls=1000)
+
+        asyncio.run(
+            client.polling.async_wait_for_entity_free(
+                "linode", 1, timeout=10, interval=0.01
+            )
+        )
+        assert feed.events[0]["status"] == "finished"
+
+        with pytest.raises(polling.TimeoutException):
+            asyncio.run(
+                client.polling.async_wait_for_entity_free(
+                    "linode", 2, timeout=0.1, interval=0.01
+                )
+            )
+
+    def test_async_subscribe(self, client, feed):
+        """
+        Tests that new events are yielded by an async subscription.
+        """
+        feed.add(1, polls=0)
+
+        async def collect():
+            result = []
+
+            async for event in client.polling.async_subscribe(
+                entity_type="linode", action="linode_shutdown", interval=0.01
+            ):
+                result.append(event)
+
+                if len(result) == 1:
+                    feed.add(2, action="linode_boot")
+                    feed.add(3)
+
+                if len(result) == 2:
+                    return result
+
+        feed.add(4, delay=1)
+
+        events = asyncio.run(collect())
+
+        # The event from before the subscription and the boot are skipped
+        assert [e.entity.id for e in events] == [4, 3]
+        assert feed.filters[-1]["id"] == {"+gt": 102}
+
+
+class TestSubscribe:
+    @pytest.fixture
+    def client(self):
+        return LinodeClient("testing", base_url="https://localhost")
+
+    @pytest.fixture
+    def feed(self):
+        feed = FakeEventFeed()
+
+        httpretty.enable()
+        httpretty.register_uri(
+            httpretty.GET, "https://localhost/account/events", body=feed
+        )
+
+        yield feed
+
+        httpretty.disable()
+        httpretty.reset()
+
+    @staticmethod
+    def collector(count):
+        """
+        Returns a callback that records events, and an Event that is set once
+        it has received the given number of events.
+        """
+        received = []
+        done = threading.Event()
+        lock = threading.Lock()
+
+        def callback(event):
+            with lock:
+                received.append(event)
+                if len(received) >= count:
+                    done.set()
+
+        return callback, received, done
+
+    def test_subscribe(self, client, feed):
+        """
+        Tests that new matching events are delivered to the callback.
+        """
+        feed.add(1, polls=0)
+
+        callback, received, done = self.collector(3)
+
+        with client.polling.subscribe(
+            callback, action="linode_shutdown", interval=0.01
+        ) as subscription:
+            assert subscription.running
+
+            feed.add(2)
+            feed.add(3, action="linode_boot")
+            feed.add(4)
+            feed.add(5)
+
+            assert done.wait(5)
+
+        assert not subscription.running
+        assert sorted(e.entity.id for e in received) == [2, 4, 5]
+        assert all(f["action"] == "linode_shutdown" for f in feed.filters[1:])
+
+    def test_subscribe_status(self, client, feed):
+        """
+        Tests that events are delivered once they reach a wanted status.
+        """
+        callback, received, done = self.collector(1)
+
+        with client.polling.subscribe(
+            callback, status="finished", interval=0.01
+        ):
+            feed.add(1, polls=5)
+            feed.add(2, polls=2, final="failed")
+
+            assert done.wait(5)
+
+        assert [(e.entity.id, e.status) for e in received] == [(1, "finished")]
+
+    def test_subscribe_retries(self, client, feed):
+        """
+        Tests that failed callbacks are retried, and that events are only
+        delivered once.
+        """
+        attempts = []
+        delivered = threading.Event()
+
+        def callback(event):
+            attempts.append(event.id)
+            if len(attempts) < 3:
+                raise ValueError("not yet")
+            delivered.set()
+
+        # The subscription's first poll finds the existing event
+        feed.add(1)
+        subscription = client.polling.subscribe(
+            callback, interval=60, after_id=0
+        )
+
+        assert delivered.wait(5)
+
+        # The same event returned again is not delivered again
+        subscription._after_id = 0
+        subscription.poll()
+        subscription.stop()
+
+        assert attempts == [101, 101, 101]
+        assert subscription.failed == 0
+
+    def test_subscribe_failed(self, client, feed):
+        """
+        Tests that events are given up on after all retries fail.
+        """
+
+        def callback(event):
+            raise ValueError("always")
+
+        feed.add(1)
+        subscription = client.polling.subscribe(
+            callback, interval=60, retries=1, after_id=0
+        )
+
+        deadline = time.monotonic() + 5
+        while subscription.failed < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        subscription.stop()
+
+        assert subscription.failed == 1
+
+    def test_subscribe_overflow(self, client, feed):
+        """
+        Tests that events are dropped when the queue is full.
+        """
+        release = threading.Event()
+
+        for i in range(5):
+            feed.add(i)
+
+        subscription = client.polling.subscribe(
+            lambda event: release.wait(5),
+            interval=60,
+            workers=1,
+            max_pending=1,
+            overflow="drop",
+            after_id=0,
+        )
+
+        while subscription.dropped + subscription.pending < 4:
+            time.sleep(0.01)
+
+        # One event is being delivered, one is queued, and the rest are dropped
+        assert subscription.dropped >= 2
+        assert subscription.pending <= 1
+
+        release.set()
+        subscription.stop()
+
+    def test_subscribe_invalid(self, client):
+        """
+        Tests that invalid subscription options are rejected.
+        """
+        with pytest.raises(ValueError):
+            client.polling.subscribe(print, overflow="nope")
+
+        with pytest.raises(ValueError):
+            client.polling.subscribe(print, workers=0)
+
+
+class TestTimeoutContext:
+    def test_start(self):
+        """
+        Tests that a context started in the past accounts for whole days.
+        """
+        ctx = TimeoutContext(timeout_seconds=60)
+        assert ctx.valid
+
+        ctx.start(datetime.datetime.now() - datetime.timedelta(days=2))
+
+        assert ctx.seconds_since_started >= 2 * 24 * 60 * 60
+        assert ctx.expired
+
+        # The default start time is the time of the call
+        ctx.start()
+        assert ctx.seconds_since_started < 1
+        assert ctx.valid
+
+
+class TestPollSchedule:
+    @staticmethod
+    def event(action, **kwargs):
+        return {"id": 1, "action": action, "status": "started", **kwargs}
+
+    def test_backoff(self):
+        """
+        Tests that the schedule backs off when progress is unknown.
+        """
+        schedule = PollSchedule(initial=1, maximum=3, jitter=0)
+
+        assert schedule.current == 1
+        assert [schedule.advance() for _ in range(5)] == [1, 1.5, 2.25, 3, 3]
+
+    def test_jitter(self):
+        """
+        Tests that intervals are jittered within the configured fraction.
+        """
+        schedule = PollSchedule(initial=10, maximum=10, jitter=0.1)
+
+        values = [schedule.advance() for _ in range(50)]
+
+        assert all(9 <= v <= 11 for v in values)
+        assert len(set(values)) > 1
+
+    def test_time_remaining(self):
+        """
+        Tests that the next poll is timed halfway to the reported completion.
+        """
+        schedule = PollSchedule(maximum=100, jitter=0)
+        schedule.observe(self.event("test_remaining", time_remaining="0:01:00"))
+
+        assert schedule.advance() == 30
+
+        # The estimate is only used once
+        assert schedule.advance() == 1
+
+    def test_percent_complete(self):
+        """
+        Tests that the completion time is estimated from progress reports.
+        """
+        schedule = PollSchedule(maximum=100, jitter=0)
+
+        with patch("linode_api4.polling.time.monotonic", return_value=100):
+            schedule.observe(self.event("test_percent", percent_complete=10))
+
+        with patch("linode_api4.polling.time.monotonic", return_value=110):
+            schedule.observe(self.event("test_percent", percent_complete=20))
+
+        # 1% per second with 80% to go
+        assert schedule.advance() == 40
+
+    def test_duration_history(self):
+        """
+        Tests that recent durations of an action are used when its events
+        don't report progress.
+        """
+        finished = PollSchedule(action="test_history")
+        finished.observe(
+            self.event("test_history", status="finished", duration=20)
+        )
+
+        schedule = PollSchedule(action="test_history", maximum=100, jitter=0)
+
+        with patch("linode_api4.polling.time.monotonic", return_value=100):
+            schedule.observe(self.event("test_history"))
+
+        with patch("linode_api4.polling.time.monotonic", return_value=104):
+            schedule.observe(self.event("test_history"))
+
+        assert schedule.advance() == 8
@@ -0,0 +1,120 @@
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+# Reports which linode_api4 modules are loaded after running a snippet
+PROBE = """
+import json, sys
+{}
+print(json.dumps(sorted(m for m in sys.modules if m.startswith("linode_api4"))))
+"""
+
+# Reports how long importing the package takes, in seconds
+TIMING_PROBE = """
+import time
+start = time.perf_counter()
+import linode_api4
+print(time.perf_counter() - start)
+"""
+
+#: The longest importing the package may take.  Importing every model and
+#: group takes several times this, while the lazy package takes a few ms.
+MAX_IMPORT_SECONDS = 0.1
+
+
+class LazyImportTest(TestCase):
+    """
+    Tests that models and groups are only imported when they're used.
+    """
+
+    def loaded_after(self, code):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        return set(json.loads(out.stdout.splitlines()[-1]))
+
+    def test_import_package(self):
+        """
+        Tests that importing the package doesn't import any models or groups.
+        """
+        loaded = self.loaded_after("import linode_api4")
+
+        self.assertNotIn("linode_api4.groups", loaded)
+        self.assertNotIn("linode_api4.objects.linode", loaded)
+        self.assertNotIn("linode_api4.objects.database", loaded)
+
+    def test_import_time(self):
+        """
+        Tests that importing the package is fast, taking the best of a few
+        runs in fresh interpreters to allow for noise.
+        """
+        timings = [
+            float(
+                subprocess.run(
+                    [sys.executable, "-c", TIMING_PROBE],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout.splitlines()[-1]
+            )
+            for _ in range(3)
+        ]
+
+        self.assertLess(min(timings), MAX_IMPORT_SECONDS)
+
+    def test_create_client(self):
+        """
+        Tests that creating a client doesn't import any groups, and that
+        accessing a group only imports what it needs.
+        """
+        loaded = self.loaded_after(
+            "from linode_api4 import LinodeClient\nLinodeClient('x')"
+        )
+        self.assertFalse(
+            {m for m in loaded if m.startswith("linode_api4.groups")}
+        )
+
+        loaded = self.loaded_after(
+            "from linode_api4 import LinodeClient\nLinodeClient('x').domains"
+        )
+        self.assertIn("linode_api4.groups.domain", loaded)
+        self.assertNotIn("linode_api4.groups.database", loaded)
+        self.assertNotIn("linode_api4.objects.database", loaded)
+
+    def test_exports(self):
+        """
+        Tests that lazily exported names resolve to the same objects as their
+        defining modules.
+        """
+        import linode_api4
+        from linode_api4.groups.linode import LinodeGroup
+        from linode_api4.linode_client import LinodeClient
+        from linode_api4.objects.linode import Instance
+
+        self.assertIs(linode_api4.Instance, Instance)
+        self.assertIs(linode_api4.LinodeClient, LinodeClient)
+        self.assertIs(linode_api4.groups.LinodeGroup, LinodeGroup)
+        self.assertIn("Instance", dir(linode_api4))
+
+        for name in linode_api4.__all__:
+            self.assertTrue(hasattr(linode_api4, name), name)
+
+        with self.assertRaises(AttributeError):
+            linode_api4.NotARealThing
+
+    def test_group_cached(self):
+        """
+        Tests that a client's groups are created once and reused.
+        """
+        from linode_api4 import LinodeClient
+        from linode_api4.groups import LinodeGroup
+
+        client = LinodeClient("x")
+
+        self.assertIsInstance(client.linode, LinodeGroup)
+        self.assertIs(client.linode, client.linode)
+        self.assertIsNot(client.linode, LinodeClient("x").linode)
@@ -0,0 +1,130 @@
+import gc
+from test.unit.base import ClientBaseCase, mock_get
+from unittest.mock import patch
+
+from linode_api4 import Invalidator
+from linode_api4.objects import Config, Disk, Event, Image, Instance, Volume
+
+
+class InvalidatorTest(ClientBaseCase):
+    """
+    Tests invalidating models from account events.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.invalidator = Invalidator(self.client)
+
+    @staticmethod
+    def event(action, entity, secondary_entity=None):
+        return {
+            "id": 1,
+            "action": action,
+            "status": "finished",
+            "entity": {"id": entity[1], "type": entity[0]},
+            "secondary_entity": (
+                {"id": secondary_entity[1], "type": secondary_entity[0]}
+                if secondary_entity
+                else None
+            ),
+        }
+
+    def test_apply(self):
+        """
+        Tests that only the models an event refers to are invalidated
+        """
+        instance = self.client.load(Instance, 123)
+        other = self.client.load(Instance, 456)
+        volume = Volume(self.client, 123, json={"id": 123, "label": "v"})
+        disk = self.client.load(Disk, 12345, 123)
+        config = self.client.load(Config, 456789, 123)
+
+        self.invalidator.track(instance, other, volume, disk, config)
+        self.assertEqual(self.invalidator.tracked, 5)
+
+        invalidated = self.invalidator.apply(
+            self.event("disk_create", ("linode", 123), ("disk", 12345))
+        )
+
+        self.assertEqual(invalidated, [disk])
+        self.assertFalse(disk._populated)
+        self.assertTrue(instance._populated)
+        self.assertTrue(other._populated)
+        self.assertTrue(volume._populated)
+        self.assertTrue(config._populated)
+
+        # the Instance's own fields didn't change, so it isn't re-fetched
+        with patch(
+            "linode_api4.linode_client.requests.Session.get",
+            side_effect=mock_get,
+        ) as get:
+            self.assertEqual(instance.label, "linode123")
+            self.assertEqual(disk.label, "Ubuntu 17.04 Disk")
+
+        self.assertEqual(
+            [c.args[0] for c in get.call_args_list],
+            ["//linode/instances/123/disks/12345"],
+        )
+
+    def test_apply_relationships(self):
+        """
+        Tests that invalidated models forget the related objects they've loaded
+        """
+        volume = Volume(
+            self.client, 1, json={"id": 1, "label": "v", "linode_id": 123}
+        )
+        self.assertEqual(volume.linode.id, 123)
+        self.invalidator.track(volume)
+
+        self.invalidator.apply(
+            self.event("volume_attach", ("volume", 1), ("linode", 456))
+        )
+
+        self.assertFalse(hasattr(volume, "_linode_relcache"))
+
+    def test_apply_derived(self):
+        """
+        Tests that secondary entities are matched by the event's action
+        """
+        config = self.client.load(Config, 456789, 123)
+        self.invalidator.track(config)
+
+        event = Event(
+            self.client,
+            1,
+            json=self.event(
+                "linode_config_update",
+                ("linode", 123),
+                ("linode_config", 456789),
+            ),
+        )
+
+        self.assertEqual(self.invalidator.apply(event), [config])
+
+    def test_image(self):
+        """
+        Tests that private Images are matched by the numeric part of their ID
+        """
+        image = Image(
+            self.client, "private/123", json={"id": "private/123", "size": 1}
+        )
+        self.invalidator.track(image)
+
+        self.assertEqual(
+            self.invalidator.apply(self.event("image_update", ("image", 123))),
+            [image],
+        )
+
+    def test_weak_references(self):
+        """
+        Tests that models are forgotten once they're no longer used
+        """
+        self.invalidator.track(Instance(self.client, 123))
+        gc.collect()
+
+        self.assertEqual(self.invalidator.tracked, 0)
+        self.assertEqual(
+            self.invalidator.apply(self.event("linode_boot", ("linode", 123))),
+            [],
+        )
@@ -1,7 +1,13 @@
 from datetime import datetime
 from test.unit.base import ClientBaseCase
+from unittest.mock import patch
 
-from linode_api4 import FirewallCreateDevicesOptions, LongviewSubscription
+from linode_api4 import (
+    AdaptivePageSize,
+    FirewallCreateDevicesOptions,
+    LinodeClient,
+    LongviewSubscription,
+)
 from linode_api4.objects.beta import BetaProgram
 from linode_api4.objects.linode import Instance
 from linode_api4.objects.networking import IPAddress
@@ -25,6 +31,25 @@ class LinodeClientGeneralTest(ClientBaseCase):
 
             self.assertEqual(m.call_data_raw, None)
 
+    def test_paging(self):
+        """
+        Tests that the page size can be overridden for a block of calls
+        """
+        with self.mock_get("linode/instances") as m:
+            with self.client.paging(AdaptivePageSize(initial=50)):
+                instances = self.client.linode.instances()
+
+            self.assertEqual(m.call_url, "/linode/instances?page_size=50")
+            self.assertIsInstance(instances.page_size_policy, AdaptivePageSize)
+
+            with self.client.paging(200):
+                self.client.linode.instances()
+
+            self.assertEqual(m.call_url, "/linode/instances?page_size=200")
+
+            self.client.linode.instances()
+            self.assertEqual(m.call_url, "/linode/instances")
+
     def test_get_account(self):
         a = self.client.account()
         self.assertEqual(a._populated, True)
@@ -318,6 +343,43 @@ class LinodeClientGeneralTest(ClientBaseCase):
 
         assert called
 
+    def test_connection_pool_size(self):
+        """
+        Tests that the configured pool sizes are applied to the session's
+        HTTP adapters.
+        """
+        client = LinodeClient(
+            "testing",
+            base_url="/",
+            pool_connections=4,
+            pool_maxsize=64,
+            pool_block=True,
+        )
+
+        for prefix in ("http://", "https://"):
+            adapter = client.session.get_adapter(prefix + "localhost")
+
+            assert adapter._pool_connections == 4
+            assert adapter._pool_maxsize == 64
+            assert adapter._pool_block is True
+            assert adapter.max_retries is client._retry_config
+
+    def test_preconnect(self):
+        """
+        Tests that preconnecting opens the requested number of connections,
+        capped at the pool size.
+        """
+        client = LinodeClient("testing", base_url="/", pool_maxsize=4)
+
+        with patch.object(client.session, "head") as m:
+            client.preconnect()
+            assert m.call_count == 1
+            assert m.call_args[0][0] == "/"
+
+        with patch.object(client.session, "head") as m:
+            client.preconnect(connections=16)
+            assert m.call_count == 4
+
 
 class MaintenanceGroupTest(ClientBaseCase):
     """
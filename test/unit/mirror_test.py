@@ -0,0 +1,223 @@
+import json
+import re
+import time
+
+import httpretty
+import pytest
+
+from linode_api4 import Instance, LinodeClient, Mirror, Volume
+from linode_api4.mirror import DEFAULT_COLLECTIONS
+from linode_api4.objects.filtering import order_by
+
+
+class FakeApi:
+    """
+    Serves Linode and Volume collections and the account event feed, and
+    records the requests made of it.
+    """
+
+    def __init__(self):
+        self.objects = {
+            "linode/instances": {
+                i: {
+                    "id": i,
+                    "label": "linode{}".format(i),
+                    "region": "us-east" if i % 2 else "us-west",
+                    "status": "running",
+                    "updated": "2024-01-01T00:00:00",
+                }
+                for i in range(1, 6)
+            },
+            "volumes": {
+                10: {
+                    "id": 10,
+                    "label": "vol",
+                    "linode_id": None,
+                    "updated": "2024-01-01T00:00:00",
+                }
+            },
+        }
+        self.events = []
+        self.requests = []
+
+    def register(self):
+        httpretty.register_uri(
+            httpretty.GET,
+            re.compile(r"https://localhost/.*"),
+            body=self,
+        )
+
+    def __call__(self, request, uri, headers):
+        path = uri.split("localhost/", 1)[1].split("?")[0].rstrip("/")
+        filters = json.loads(request.headers.get("X-Filter") or "{}")
+        self.requests.append((path, filters))
+
+        if path == "account/events":
+            data = [
+                e
+                for e in self.events
+                if e["id"] > filters.get("id", {"+gt": 0})["+gt"]
+            ]
+            if filters.get("+order") == "desc":
+                data = sorted(data, key=lambda e: -e["id"])
+            return 200, headers, json.dumps({"data": data, "pages": 1})
+
+        if path in self.objects:
+            data = list(self.objects[path].values())
+            if "updated" in filters:
+                since = filters["updated"]["+gte"]
+                data = [d for d in data if d["updated"] >= since]
+            return 200, headers, json.dumps({"data": data, "pages": 1})
+
+        collection, _, object_id = path.rpartition("/")
+        obj = self.objects.get(collection, {}).get(int(object_id))
+        if obj is None:
+            return (
+                404,
+                headers,
+                json.dumps({"errors": [{"reason": "Not found"}]}),
+            )
+
+        return 200, headers, json.dumps(obj)
+
+    def add_event(self, action, entity_type, entity_id, status="finished"):
+        self.events.append(
+            {
+                "id": len(self.events) + 1,
+                "action": action,
+                "status": status,
+                "entity": {"type": entity_type, "id": entity_id},
+            }
+        )
+
+
+class TestMirror:
+    @pytest.fixture
+    def api(self):
+        api = FakeApi()
+
+        httpretty.enable()
+        api.register()
+
+        yield api
+
+        httpretty.disable()
+        httpretty.reset()
+
+    @pytest.fixture
+    def mirror(self, api, tmp_path):
+        client = LinodeClient("testing", base_url="https://localhost")
+        collections = [
+            c for c in DEFAULT_COLLECTIONS if c.name in ("instances", "volumes")
+        ]
+
+        with Mirror(client, str(tmp_path / "mirror.db"), collections) as m:
+            yield m
+
+    def test_full_sync(self, api, mirror):
+        """
+        Tests that the first sync lists every collection, and that reads are
+        served from the database afterwards.
+        """
+        assert mirror.sync() == {"instances": 5, "volumes": 1}
+        assert mirror.last_synced is not None
+
+        api.requests.clear()
+
+        instances = mirror.query(Instance, region="us-east")
+        assert [i.id for i in instances] == [1, 3, 5]
+        assert all(isinstance(i, Instance) for i in instances)
+        assert instances[0].label == "linode1"
+
+        assert mirror.get(Volume, 10).label == "vol"
+        assert mirror.get(Volume, 11) is None
+        assert [v.id for v in mirror.query(Volume, linode_id=None)] == [10]
+        assert mirror.count(Instance) == 5
+
+        # filters are evaluated locally
+        instances = mirror.query(
+            Instance,
+            Instance.label.contains("linode"),
+            order_by(Instance.id, desc=True).limit(2),
+            region="us-west",
+        )
+        assert [i.id for i in instances] == [4, 2]
+
+        assert api.requests == []
+
+    def test_volatile_fields(self, api, mirror):
+        """
+        Tests that reading volatile fields of mirrored objects doesn't
+        re-fetch them, however old they are.
+        """
+        mirror.sync()
+        api.requests.clear()
+
+        instance = mirror.get(Instance, 1)
+        instance._set("_loaded_at", time.monotonic() - 3600)
+
+        assert instance.status == "running"
+        assert [i.status for i in mirror.query(Instance)] == ["running"] * 5
+        assert api.requests == []
+
+    def test_incremental_sync(self, api, mirror):
+        """
+        Tests that later syncs only fetch what events and updated timestamps
+        say has changed.
+        """
+        mirror.sync()
+        api.requests.clear()
+
+        api.objects["linode/instances"][2]["label"] = "renamed"
+        api.add_event("linode_update", "linode", 2)
+
+        del api.objects["linode/instances"][3]
+        api.add_event("linode_delete", "linode", 3)
+
+        api.objects["volumes"][10]["label"] = "resized"
+        api.objects["volumes"][10]["updated"] = "2999-01-01T00:00:00"
+
+        # Events on objects that are gone are tolerated
+        api.add_event("linode_boot", "linode", 99)
+
+        assert mirror.sync() == {"instances": 3, "volumes": 1}
+
+        assert mirror.get(Instance, 2).label == "renamed"
+        assert mirror.get(Instance, 3) is None
+        assert mirror.get(Volume, 10).label == "resized"
+        assert mirror.count(Instance) == 4
+
+        # Only changed objects were requested individually
+        fetched = [
+            p for p, _ in api.requests if p.startswith("linode/instances/")
+        ]
+        assert sorted(fetched) == ["linode/instances/2", "linode/instances/99"]
+
+        # The volume list was filtered on its updated timestamp
+        assert any(p == "volumes" and "updated" in f for p, f in api.requests)
+
+    def test_child_delete_events(self, api, mirror):
+        """
+        Tests that events deleting an object's children, which name the
+        object itself, don't remove it from the mirror.
+        """
+        mirror.sync()
+
+        api.objects["linode/instances"][2]["label"] = "resized"
+        api.add_event("disk_delete", "linode", 2)
+        api.add_event("linode_config_delete", "linode", 4)
+
+        mirror.sync()
+
+        assert mirror.count(Instance) == 5
+        assert mirror.get(Instance, 2).label == "resized"
+        assert mirror.get(Instance, 4) is not None
+
+    def test_unmirrored_model(self, mirror):
+        """
+        Tests that querying a model that isn't mirrored fails.
+        """
+        from linode_api4 import Domain
+
+        with pytest.raises(ValueError):
+            mirror.query(Domain)
@@ -0,0 +1,224 @@
+import json
+from datetime import datetime
+from test.unit.base import ClientBaseCase
+from unittest.mock import patch
+
+from linode_api4.objects import Instance, Volume, and_, or_
+from linode_api4.objects.filtering import (
+    Filter,
+    _flatten,
+    _split,
+    limit,
+    order_by,
+)
+
+
+class FilterMatchesTest(ClientBaseCase):
+    """
+    Tests evaluating filters against loaded models.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.instances = list(self.client.linode.instances())
+
+    def test_equality(self):
+        """
+        Tests matching field values, including related models and list fields
+        """
+        instance = self.client.load(Instance, 123)
+
+        self.assertTrue((Instance.label == "linode123").matches(instance))
+        self.assertFalse((Instance.label == "linode456").matches(instance))
+        self.assertTrue((Instance.region == "us-east-1a").matches(instance))
+        self.assertFalse((Instance.region != "us-east-1a").matches(instance))
+
+        # a single value matches list fields containing it
+        self.assertTrue((Instance.tags == "something").matches(instance))
+
+    def test_operators(self):
+        """
+        Tests comparison and containment operators
+        """
+        instance = self.client.load(Instance, 123)
+
+        self.assertTrue(Instance.label.contains("123").matches(instance))
+        self.assertFalse(Instance.label.contains("456").matches(instance))
+        self.assertTrue(
+            (Instance.created < datetime(2018, 1, 1)).matches(instance)
+        )
+        self.assertTrue(
+            (Instance.created >= "2017-01-01T00:00:00").matches(instance)
+        )
+        self.assertFalse(
+            (Instance.created > datetime(2018, 1, 1)).matches(instance)
+        )
+
+        # missing values never compare
+        self.assertFalse((Volume.size > 0).matches({"id": 1}))
+
+    def test_combinations(self):
+        """
+        Tests +and and +or filters, and JSON dicts
+        """
+        f = or_(
+            Instance.label == "linode123",
+            and_(Instance.label.contains("linode"), Instance.id == 124),
+        )
+        predicate = f.compile()
+
+        self.assertEqual(
+            [i.id for i in self.instances if predicate(i)], [123, 124]
+        )
+        self.assertTrue(f.matches({"id": 124, "label": "linode124"}))
+        self.assertFalse(f.matches({"id": 125, "label": "linode125"}))
+
+    def test_apply(self):
+        """
+        Tests that filters are applied to collections in order and limited
+        """
+        f = order_by(Instance.label, desc=True).limit(2)
+
+        self.assertEqual(
+            [i.label for i in f.apply(self.instances)],
+            ["linode456", "linode124"],
+        )
+        self.assertEqual(
+            [i.id for i in (Instance.id > 123).apply(self.instances)],
+            [456, 124],
+        )
+        self.assertEqual(len(limit(1).apply(self.instances)), 1)
+
+    def test_unsupported_operator(self):
+        """
+        Tests that unknown operators are rejected
+        """
+        with self.assertRaises(ValueError):
+            Filter({"label": {"+like": "linode"}}).compile()
+
+
+class FilterPlanningTest(ClientBaseCase):
+    """
+    Tests combining and splitting large filters.
+    """
+
+    def test_chaining(self):
+        """
+        Tests that chained filters build flat lists, and that earlier filters
+        in a chain aren't changed by later ones
+        """
+        base = (Instance.id == 1) | (Instance.id == 2)
+        f = base
+        for i in range(3, 1001):
+            f = f | (Instance.id == i)
+
+        self.assertEqual(f.dct["+or"], [{"id": i} for i in range(1, 1001)])
+        self.assertEqual(base.dct, {"+or": [{"id": 1}, {"id": 2}]})
+        self.assertEqual(
+            (base & (Instance.label == "a")).dct,
+            {"+and": [{"+or": [{"id": 1}, {"id": 2}]}, {"label": "a"}]},
+        )
+
+    def test_flatten_and_split(self):
+        """
+        Tests that nested conditions are merged, and oversized disjunctions
+        are split
+        """
+        self.assertEqual(
+            _flatten({"+or": [{"+or": [{"a": 1}, {"a": 2}]}, {"a": 3}]}),
+            {"+or": [{"a": 1}, {"a": 2}, {"a": 3}]},
+        )
+
+        dct = {
+            "+and": [
+                {"region": "us-east"},
+                {"+or": [{"id": i} for i in range(5)]},
+            ],
+            "+order_by": "label",
+        }
+        self.assertEqual(_split(dct, 5), [dct])
+        self.assertEqual(
+            _split(dct, 2),
+            [
+                {
+                    "+and": [
+                        {"region": "us-east"},
+                        {"+or": [{"id": i} for i in ids]},
+                    ],
+                    "+order_by": "label",
+                }
+                for ids in ((0, 1), (2, 3), (4,))
+            ],
+        )
+
+    def test_chunked_request(self):
+        """
+        Tests that collections filtered on oversized disjunctions are requested
+        in parts whose results are merged
+        """
+        f = Instance.id == 0
+        for i in range(1, 250):
+            f = f | (Instance.id == i)
+
+        with self.mock_get("linode/instances") as m:
+            result = self.client.linode.instances(
+                f, order_by(Instance.label, desc=True)
+            )
+
+        self.assertEqual(m.call_count, 3)
+        sizes = [
+            len(json.loads(c[1]["headers"]["X-Filter"])["+and"][0]["+or"])
+            for c in m.mock.call_args_list
+        ]
+        self.assertEqual(sorted(sizes), [50, 100, 100])
+
+        # every part returned the same page, which is only included once
+        self.assertEqual(len(result), 3)
+        self.assertEqual(
+            [i.label for i in result], ["linode456", "linode124", "linode123"]
+        )
+        self.assertEqual(result.first().id, 456)
+
+    def test_chunked_resumable(self):
+        """
+        Tests that resumable iteration over a collection filtered on an
+        oversized disjunction requests each part, merging them by ID
+        """
+        # 5 is in the first and last parts
+        f = Instance.id == 0
+        for i in list(range(1, 250)) + [5]:
+            f = f | (Instance.id == i)
+
+        def fake_get(url, filters=None, **kwargs):
+            terms = filters.get("+and", [filters])
+            ids = sorted({t["id"] for t in terms[0]["+or"]})
+            if len(terms) > 1:
+                ids = [i for i in ids if i > terms[1]["id"]["+gt"]]
+
+            # keyset pages, ordered by ID, have 25 objects, and the initial
+            # listing has everything
+            page = ids[:25] if "+order_by" in filters else ids
+            return {
+                "data": [{"id": i} for i in page],
+                "page": 1,
+                "pages": 1 if page == ids else 2,
+                "results": len(ids),
+            }
+
+        with patch.object(self.client, "get", side_effect=fake_get) as m:
+            result = self.client.linode.instances(f)
+            self.assertEqual(len(result), 250)
+
+            m.reset_mock()
+            scan = result.resumable()
+            ids = [i.id for i in scan]
+
+        self.assertEqual(ids, list(range(250)))
+        self.assertEqual(scan.last_id, 249)
+
+        # 4 pages for each full part, and 3 for the last
+        self.assertEqual(m.call_count, 11)
+        for c in m.call_args_list:
+            chunk = c[1]["filters"].get("+and", [c[1]["filters"]])[0]
+            self.assertLessEqual(len(chunk["+or"]), 100)
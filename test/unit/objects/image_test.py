@@ -101,7 +101,10 @@ class ImageTest(ClientBaseCase):
             self.assertEqual(url, "https://linode.com/")
             self.assertEqual(data.read(), TEST_IMAGE_CONTENT)
 
-        with patch("requests.put", put_mock), self.mock_post("/images/upload"):
+        with (
+            patch.object(self.client.session, "put", put_mock),
+            self.mock_post("/images/upload"),
+        ):
             image = self.client.image_upload(
                 "Realest Image Upload",
                 "us-southeast",
@@ -0,0 +1,203 @@
+import json
+import threading
+import time
+from test.unit.base import ClientBaseCase, MockResponse
+from unittest.mock import patch
+
+from linode_api4.objects import (
+    Base,
+    Instance,
+    NeverRefresh,
+    StaleWhileRevalidate,
+    TTLPolicy,
+)
+from linode_api4.objects.base import REVALIDATION_WORKERS
+
+
+def backdate(obj, seconds):
+    """
+    Makes the given object look like it was populated the given number of
+    seconds ago.
+    """
+    obj._set("_loaded_at", time.monotonic() - seconds)
+
+
+class StalenessPolicyTest(ClientBaseCase):
+    """
+    Tests when volatile properties are re-fetched.
+    """
+
+    def test_default_ttl(self):
+        """
+        Tests that volatile properties are refreshed after 15 seconds by default
+        """
+        instance = self.client.load(Instance, 123)
+
+        with self.mock_get("linode/instances/123") as m:
+            backdate(instance, 10)
+            self.assertEqual(instance.status, "running")
+            self.assertFalse(m.called)
+
+            backdate(instance, 20)
+            self.assertEqual(instance.status, "running")
+            self.assertEqual(m.call_count, 1)
+
+            # non-volatile properties are never refreshed
+            backdate(instance, 20)
+            self.assertEqual(instance.label, "linode123")
+            self.assertEqual(m.call_count, 1)
+
+    def test_resolution(self):
+        """
+        Tests that policies configured for a class take precedence over
+        policies for all models
+        """
+
+        class PinnedInstance(Instance):
+            staleness_policy = NeverRefresh()
+
+        self.client.staleness_policy = TTLPolicy(60)
+        self.assertIsInstance(
+            Instance(self.client, 123)._staleness_policy(), TTLPolicy
+        )
+        self.assertIsInstance(
+            PinnedInstance(self.client, 123)._staleness_policy(), NeverRefresh
+        )
+
+        policy = StaleWhileRevalidate()
+        self.client.staleness_policy = {Base: NeverRefresh(), Instance: policy}
+        self.assertIs(Instance(self.client, 123)._staleness_policy(), policy)
+        self.assertIs(
+            PinnedInstance(self.client, 123)._staleness_policy(),
+            PinnedInstance.staleness_policy,
+        )
+
+    def test_never_refresh(self):
+        """
+        Tests that volatile properties can be configured to never refresh
+        """
+        self.client.staleness_policy = NeverRefresh()
+        instance = self.client.load(Instance, 123)
+
+        with self.mock_get("linode/instances/123") as m:
+            backdate(instance, 3600)
+            self.assertEqual(instance.status, "running")
+            self.assertFalse(m.called)
+
+            # invalidated objects are still loaded
+            instance.invalidate()
+            self.assertEqual(instance.status, "running")
+            self.assertEqual(m.call_count, 1)
+
+    def test_stale_while_revalidate(self):
+        """
+        Tests that stale values are returned while they're refreshed in the
+        background, unless they're older than the max age
+        """
+        self.client.staleness_policy = StaleWhileRevalidate(15, max_age=60)
+        instance = self.client.load(Instance, 123)
+
+        released = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            released.wait(5)
+            return MockResponse(200, {"id": 123, "status": "offline"})
+
+        with patch(
+            "linode_api4.linode_client.requests.Session.get",
+            side_effect=slow_get,
+        ) as m:
+            backdate(instance, 20)
+            self.assertEqual(instance.status, "running")
+            self.assertEqual(instance.status, "running")
+
+            released.set()
+            for _ in range(100):
+                if not instance._revalidating:
+                    break
+                time.sleep(0.01)
+
+            self.assertEqual(m.call_count, 1)
+            self.assertEqual(instance.status, "offline")
+
+            backdate(instance, 90)
+            self.assertEqual(instance.status, "offline")
+            self.assertEqual(m.call_count, 2)
+            self.assertFalse(instance._revalidating)
+
+    def test_revalidation_is_bounded(self):
+        """
+        Tests that background re-fetches of many stale objects share a bounded
+        set of threads
+        """
+        self.client.staleness_policy = StaleWhileRevalidate(15, max_age=60)
+        instances = [
+            Instance(self.client, i, json={"id": i, "status": "running"})
+            for i in range(20)
+        ]
+
+        lock = threading.Lock()
+        running = []
+        most = 0
+
+        def slow_get(*args, **kwargs):
+            nonlocal most
+            with lock:
+                running.append(1)
+                most = max(most, len(running))
+            time.sleep(0.02)
+            with lock:
+                running.pop()
+            return MockResponse(200, {"id": 1, "status": "offline"})
+
+        with patch(
+            "linode_api4.linode_client.requests.Session.get",
+            side_effect=slow_get,
+        ) as m:
+            for instance in instances:
+                backdate(instance, 20)
+                self.assertEqual(instance.status, "running")
+
+            for _ in range(200):
+                if not any(i._revalidating for i in instances):
+                    break
+                time.sleep(0.01)
+
+        self.assertEqual(m.call_count, 20)
+        self.assertLessEqual(most, REVALIDATION_WORKERS)
+
+
+class ClientRefreshTest(ClientBaseCase):
+    """
+    Tests refreshing many objects at once.
+    """
+
+    def test_refresh(self):
+        """
+        Tests that stale objects are refreshed with a single list request
+        """
+        instances = [
+            self.client.load(Instance, i) for i in (123, 456, 124, 123)
+        ]
+        for instance in instances[1:]:
+            backdate(instance, 20)
+
+        with self.mock_get("linode/instances") as m:
+            refreshed = self.client.refresh(instances)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(m.call_url, "/linode/instances?page=1")
+        self.assertEqual(
+            json.loads(m.call_headers["X-Filter"]),
+            {"+or": [{"id": 456}, {"id": 124}, {"id": 123}]},
+        )
+
+        self.assertCountEqual(refreshed, instances[1:])
+        self.assertTrue(all(not i._is_stale() for i in instances))
+
+        with self.mock_get("linode/instances") as m:
+            self.assertEqual(self.client.refresh(instances), [])
+            self.assertFalse(m.called)
+
+            self.client.refresh(instances, stale_only=False)
+            self.assertEqual(m.call_count, 1)
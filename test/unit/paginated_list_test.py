@@ -1,7 +1,11 @@
+import math
+import sys
+from array import array
 from unittest import TestCase
-from unittest.mock import MagicMock, call
+from unittest.mock import MagicMock, call, patch
 
-from linode_api4.paginated_list import PaginatedList
+from linode_api4 import Instance
+from linode_api4.paginated_list import AdaptivePageSize, PaginatedList
 
 
 class PaginationSlicingTest(TestCase):
@@ -67,13 +71,15 @@ class PaginationSlicingTest(TestCase):
         """
         self.assertEqual(self.normal_list[30:], self.paginated_list[30:])
 
-    def test_slice_unsupported_step(self):
+    def test_slice_step(self):
         """
-        Tests that steps outside of 1 raise a NotImplementedError
+        Tests that slices with steps work, and that a step of 0 is an error
         """
-        for step in (-1, 0, 2, 3):
-            with self.assertRaises(NotImplementedError):
-                self.paginated_list[::step]
+        for s in (slice(None, None, -1), slice(2, 20, 3), slice(-3, 4, -2)):
+            self.assertEqual(self.normal_list[s], self.paginated_list[s])
+
+        with self.assertRaises(ValueError):
+            self.paginated_list[::0]
 
     def test_slice_backward_indexing(self):
         """
@@ -134,3 +140,368 @@ class PageLoadingTest(TestCase):
         p = PaginatedList(client, "/test", page=[], max_pages=0, total_items=0)
 
         assert len(p) == 0
+
+
+class KeyedModel:
+    """
+    A test model that keeps the ID it was made with
+    """
+
+    def __init__(self, id=None):
+        self.id = id
+
+    @classmethod
+    def make_instance(cls, id, *args, **kwargs):
+        return cls(id)
+
+
+class RangeLoadingTest(TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get = MagicMock(side_effect=self.fake_get)
+
+        # 100 items in pages of 10, with the first page loaded
+        self.paginated_list = PaginatedList(
+            self.client,
+            "test",
+            page=[KeyedModel(i) for i in range(10)],
+            max_pages=10,
+            total_items=100,
+        )
+
+    def fake_get(self, url, filters=None):
+        page = int(url.split("page=")[1].split("&")[0])
+        return {
+            "data": [{"id": i} for i in range((page - 1) * 10, page * 10)],
+            "pages": 10,
+            "page": page,
+            "results": 100,
+        }
+
+    def loaded_pages(self):
+        return [i for i, p in enumerate(self.paginated_list.lists) if p]
+
+    def test_slice_loads_covering_pages(self):
+        """
+        Tests that slices are lazy, and load only the pages they cover
+        """
+        view = self.paginated_list[35:52]
+        self.assertEqual(len(view), 17)
+        self.assertFalse(self.client.get.called)
+
+        self.assertEqual([o.id for o in view], list(range(35, 52)))
+        self.assertEqual(self.loaded_pages(), [0, 3, 4, 5])
+        self.assertEqual(self.client.get.call_count, 3)
+
+        # pages are never loaded twice
+        self.assertEqual([o.id for o in view[::-8]], [51, 43, 35])
+        self.assertEqual(self.client.get.call_count, 3)
+
+    def test_negative_and_step_slices(self):
+        """
+        Tests that negative and stepped slices load only the pages holding
+        their items
+        """
+        self.assertEqual(
+            [o.id for o in self.paginated_list[-5:]], list(range(95, 100))
+        )
+        self.assertEqual(self.loaded_pages(), [0, 9])
+
+        self.assertEqual(
+            [o.id for o in self.paginated_list[-12::-40]], [88, 48, 8]
+        )
+        self.assertEqual(self.loaded_pages(), [0, 4, 8, 9])
+
+        self.assertEqual(self.paginated_list.last().id, 99)
+        self.assertEqual(self.client.get.call_count, 3)
+
+
+class ColumnExportTest(TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get = MagicMock(side_effect=self.fake_get)
+
+        # 30 Instances in pages of 10, with the first page loaded
+        self.pages = [
+            [self.instance_json(i) for i in range(p * 10, p * 10 + 10)]
+            for p in range(3)
+        ]
+        self.paginated_list = PaginatedList(
+            self.client,
+            "linode/instances",
+            page=[
+                Instance(self.client, j["id"], json=j) for j in self.pages[0]
+            ],
+            max_pages=3,
+            total_items=30,
+        )
+
+    @staticmethod
+    def instance_json(i):
+        return {
+            "id": i,
+            "label": "linode{}".format(i),
+            "specs": {"memory": 1024 * (i % 4 + 1), "vcpus": i % 4 + 1},
+            "tags": ["web"] if i % 2 else [],
+            "backups": {"enabled": i % 3 == 0},
+            "usage": i / 2 if i % 5 else None,
+        }
+
+    def fake_get(self, url, filters=None, **kwargs):
+        page = int(url.split("page=")[1].split("&")[0])
+        return {
+            "data": self.pages[page - 1],
+            "pages": 3,
+            "page": page,
+            "results": 30,
+        }
+
+    def test_to_columns(self):
+        """
+        Tests that fields are returned as typed columns, read from the JSON of
+        pages that aren't loaded without making models or keeping the pages
+        """
+        columns = self.paginated_list.to_columns(
+            [
+                Instance.id,
+                "specs.memory",
+                "specs.vcpus",
+                "backups.enabled",
+                "tags",
+                "usage",
+                "missing",
+            ]
+        )
+
+        self.assertEqual(columns["id"], array("q", range(30)))
+        self.assertEqual(columns["specs.memory"].typecode, "q")
+        self.assertEqual(sum(columns["specs.vcpus"]), 73)
+
+        self.assertEqual(
+            columns["backups.enabled"][:4], [True, False, False, True]
+        )
+        self.assertEqual(columns["tags"][:2], [[], ["web"]])
+        self.assertEqual(columns["missing"], [None] * 30)
+
+        usage = columns["usage"]
+        self.assertEqual(usage.typecode, "d")
+        self.assertTrue(math.isnan(usage[0]))
+        self.assertEqual(usage[1], 0.5)
+
+        self.assertEqual(
+            [c[0][0] for c in self.client.get.call_args_list],
+            [
+                "/linode/instances?page=2&page_size=10",
+                "/linode/instances?page=3&page_size=10",
+            ],
+        )
+        self.assertEqual(self.paginated_list.lists[1:], [None, None])
+
+    def test_column_types(self):
+        """
+        Tests that integer columns with missing values become float columns,
+        and that numeric columns holding anything else become lists
+        """
+        for values, expected in (
+            ([1, 2], array("q", [1, 2])),
+            ([1, 2.5], array("d", [1, 2.5])),
+            ([None, 1, None], array("d", [math.nan, 1, math.nan])),
+            ([1, None, "a"], [1, None, "a"]),
+            ([1, 2**64], [1, 2**64]),
+            ([True, 1], [True, 1]),
+        ):
+            data = [{"id": i, "v": v} for i, v in enumerate(values)]
+            client = MagicMock()
+            client.get.return_value = {
+                "data": data,
+                "pages": 1,
+                "page": 1,
+                "results": len(data),
+            }
+
+            p = PaginatedList(
+                client,
+                "test",
+                page=[KeyedModel(i) for i in range(len(values))],
+                total_items=len(values),
+            )
+            # read the page from its JSON, rather than the models above
+            p.lists[0] = None
+
+            result = p.to_columns(["v"])["v"]
+
+            self.assertEqual(type(result), type(expected))
+            self.assertEqual(
+                [None if v != v else v for v in result],
+                [None if v != v else v for v in expected],
+            )
+
+    def test_formats(self):
+        """
+        Tests that formats needing missing libraries raise clear errors before
+        any pages are requested
+        """
+        with self.assertRaises(ValueError):
+            self.paginated_list.to_columns(["id"], format="csv")
+
+        with patch.dict(sys.modules, {"numpy": None}):
+            with self.assertRaisesRegex(ImportError, "require numpy"):
+                self.paginated_list.to_columns(["id"], format="numpy")
+
+        self.assertEqual(self.client.get.call_count, 0)
+
+
+class AdaptivePageSizeTest(TestCase):
+    def test_preferred_size(self):
+        """
+        Tests that pages grow towards the size that loads in the target time,
+        in whole multiples of the first page
+        """
+        policy = AdaptivePageSize(initial=25, maximum=500, target_seconds=1.0)
+        self.assertEqual(policy.preferred(), 25)
+        self.assertEqual(policy.block_size(25), 25)
+
+        # 25 items of 1kB in 0.1 seconds: 4ms an item
+        policy.observe(0.1, 25000, 25)
+        self.assertEqual(policy.preferred(), 250)
+        self.assertEqual(policy.block_size(25), 200)
+
+        # fast responses are capped at the maximum
+        for _ in range(10):
+            policy.observe(0.001, 100000, 100)
+        self.assertEqual(policy.preferred(), 500)
+        self.assertEqual(policy.block_size(25), 400)
+
+        with self.assertRaises(ValueError):
+            AdaptivePageSize(initial=600, maximum=500)
+
+    def test_block_loading(self):
+        """
+        Tests that later pages are loaded in larger blocks covering several
+        pages of the first page's size
+        """
+        client = MagicMock()
+
+        def fake_get(url, filters=None, **kwargs):
+            query = dict(p.split("=") for p in url.split("?")[1].split("&"))
+            page, size = int(query["page"]), int(query["page_size"])
+            return {
+                "data": [
+                    {"id": i}
+                    for i in range((page - 1) * size, min(page * size, 100))
+                ],
+                "pages": -(-100 // size),
+                "page": page,
+                "results": 100,
+            }
+
+        client.get = MagicMock(side_effect=fake_get)
+
+        policy = AdaptivePageSize(initial=10, maximum=40)
+        policy.observe(0.001, 1000, 10)
+
+        p = PaginatedList(
+            client,
+            "test",
+            page=[KeyedModel(i) for i in range(10)],
+            max_pages=10,
+            total_items=100,
+            page_size_policy=policy,
+        )
+
+        self.assertEqual([o.id for o in p], list(range(100)))
+        self.assertEqual(
+            [c[0][0] for c in client.get.call_args_list],
+            [
+                "/test?page=2&page_size=10",
+                "/test?page=2&page_size=20",
+                "/test?page=2&page_size=40",
+                "/test?page=3&page_size=40",
+            ],
+        )
+
+
+class ResumableIterationTest(TestCase):
+    def setUp(self):
+        self.ids = list(range(1, 8))
+
+        self.client = MagicMock()
+        self.client.page_size = 2
+        self.client.get = MagicMock(side_effect=self.fake_get)
+
+    def fake_get(self, url, filters=None):
+        """
+        Serves self.ids two at a time, honoring "+gt" on id
+        """
+        after = 0
+        for condition in filters.get("+and", [filters]):
+            after = condition.get("id", {}).get("+gt", after)
+
+        remaining = [i for i in self.ids if i > after]
+        return {
+            "data": [{"id": i} for i in remaining[:2]],
+            "pages": max(1, (len(remaining) + 1) // 2),
+            "page": 1,
+            "results": len(remaining),
+        }
+
+    def test_tolerates_churn(self):
+        """
+        Tests that objects added and removed during iteration cause neither
+        errors, duplicates nor gaps
+        """
+        p = PaginatedList(
+            self.client,
+            "test",
+            page=[KeyedModel()],
+            max_pages=4,
+            total_items=7,
+            filters={"status": "active"},
+        )
+
+        seen = []
+        for obj in p.resumable():
+            seen.append(obj.id)
+            if obj.id == 2:
+                # an object already returned is removed, and one is added
+                self.ids.remove(1)
+                self.ids.append(8)
+
+        self.assertEqual(seen, list(range(1, 9)))
+        self.assertEqual(
+            self.client.get.call_args_list[1],
+            call(
+                "/test?page_size=2",
+                filters={
+                    "+and": [{"status": "active"}, {"id": {"+gt": 2}}],
+                    "+order_by": "id",
+                    "+order": "asc",
+                },
+            ),
+        )
+
+    def test_cursor(self):
+        """
+        Tests that iteration can be continued from a saved cursor
+        """
+        p = PaginatedList(
+            self.client, "test", page=[KeyedModel()], max_pages=4, total_items=7
+        )
+
+        scan = p.resumable()
+        for obj in scan:
+            if obj.id == 3:
+                cursor = scan.cursor
+                break
+
+        self.assertEqual(
+            [o.id for o in p.resumable(cursor=cursor)], [4, 5, 6, 7]
+        )
+
+        with self.assertRaises(ValueError):
+            PaginatedList(self.client, "other", page=[KeyedModel()]).resumable(
+                cursor=cursor
+            )
+
+        with self.assertRaises(ValueError):
+            p.resumable(cursor="not a cursor")
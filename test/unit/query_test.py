@@ -0,0 +1,125 @@
+from test.unit.base import ClientBaseCase
+from unittest.mock import patch
+
+from linode_api4 import Domain, Instance, Query
+
+
+class QueryTest(ClientBaseCase):
+    """
+    Tests querying collections with conditions evaluated locally.
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        # three pages of Instances, every third of which is offline
+        self.pages = [
+            [
+                {
+                    "id": i,
+                    "label": "linode{}".format(i),
+                    "region": "us-east",
+                    "status": "offline" if i % 3 == 0 else "running",
+                }
+                for i in range(start, start + 5)
+            ]
+            for start in (1, 6, 11)
+        ]
+
+    def fake_get(self, url, filters=None, **kwargs):
+        page = int(url.split("page=")[1].split("&")[0])
+        return {
+            "data": self.pages[page - 1],
+            "page": page,
+            "pages": len(self.pages),
+            "results": sum(len(p) for p in self.pages),
+        }
+
+    def test_plan(self):
+        """
+        Tests that conditions the API can filter on are sent to it, and the
+        rest are evaluated locally
+        """
+        query = (
+            self.client.query(Instance)
+            .where(Instance.region == "us-east", status="running")
+            .where((Instance.label == "a") | (Instance.status == "offline"))
+            .order_by(Instance.label, desc=True)
+        )
+
+        self.assertIsInstance(query, Query)
+        self.assertEqual(
+            query.plan(),
+            (
+                {"region": "us-east", "+order_by": "label", "+order": "desc"},
+                [
+                    {"status": "running"},
+                    {"+or": [{"label": "a"}, {"status": "offline"}]},
+                ],
+            ),
+        )
+
+        # each method returns a new query
+        self.assertEqual(
+            self.client.query(Instance).where(status="running").plan(),
+            (None, [{"status": "running"}]),
+        )
+
+    def test_unknown_filterability(self):
+        """
+        Tests that conditions on properties not known to be filterable are
+        evaluated locally, except on IDs
+        """
+        self.assertEqual(
+            self.client.query(Domain)
+            .where(Domain.id == 1, domain="example.org")
+            .order_by(Domain.status)
+            .plan(),
+            ({"id": 1}, [{"domain": "example.org"}]),
+        )
+
+    def test_stops_paging_at_limit(self):
+        """
+        Tests that results are returned as pages arrive, and that no more pages
+        are fetched once the limit is reached
+        """
+        with patch.object(self.client, "get", side_effect=self.fake_get) as m:
+            result = (
+                self.client.query(Instance)
+                .where(Instance.status == "offline")
+                .limit(2)
+                .all()
+            )
+
+            self.assertEqual([i.id for i in result], [3, 6])
+            self.assertEqual(m.call_count, 2)
+            self.assertIsNone(m.call_args[1]["filters"])
+
+            m.reset_mock()
+            first = (
+                self.client.query(Instance)
+                .where(lambda i: i.label.endswith("2"))
+                .first()
+            )
+            self.assertEqual(first.id, 2)
+            self.assertEqual(m.call_count, 1)
+
+    def test_local_ordering(self):
+        """
+        Tests that ordering on properties the API can't sort by considers
+        every page
+        """
+        with patch.object(self.client, "get", side_effect=self.fake_get) as m:
+            result = (
+                self.client.query(Instance)
+                .where(Instance.region == "us-east")
+                .order_by(Instance.status)
+                .limit(6)
+                .all()
+            )
+
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(m.call_args[1]["filters"], {"region": "us-east"})
+        self.assertEqual(
+            [i.status for i in result], ["offline"] * 5 + ["running"]
+        )
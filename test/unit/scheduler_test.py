@@ -0,0 +1,242 @@
+import threading
+import time
+from test.unit.base import ClientBaseCase
+from unittest import TestCase
+from unittest.mock import patch
+
+from linode_api4 import LinodeClient, PriorityClass, RequestScheduler
+
+
+class RequestSchedulerTest(TestCase):
+    """
+    Tests for the RequestScheduler
+    """
+
+    @staticmethod
+    def wait_for_waiting(scheduler, name, count):
+        deadline = time.monotonic() + 5
+        while len(scheduler._waiting[name]) < count:
+            if time.monotonic() > deadline:
+                raise AssertionError("Requests were never queued")
+            time.sleep(0.001)
+
+    def start_waiters(self, scheduler, name, count, order):
+        def waiter():
+            with scheduler.slot(name):
+                order.append(name)
+
+        threads = [
+            threading.Thread(target=waiter, daemon=True) for _ in range(count)
+        ]
+        for i, t in enumerate(threads, 1):
+            # start waiters one at a time so they queue in a known order
+            t.start()
+            self.wait_for_waiting(scheduler, name, i)
+        return threads
+
+    def test_weighted_order(self):
+        """
+        Tests that queued requests in a higher weighted class are sent first.
+        """
+        scheduler = RequestScheduler(1)
+        order = []
+
+        scheduler.acquire()
+
+        threads = self.start_waiters(scheduler, "background", 3, order)
+        threads += self.start_waiters(scheduler, "interactive", 3, order)
+
+        scheduler.release()
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(order, ["interactive"] * 3 + ["background"] * 3)
+
+    def test_fair_share(self):
+        """
+        Tests that a lower weighted class still receives its share when both
+        classes are backlogged.
+        """
+        scheduler = RequestScheduler(
+            1,
+            classes={
+                "a": PriorityClass(weight=2),
+                "b": PriorityClass(weight=1),
+            },
+            default="a",
+        )
+        order = []
+
+        scheduler.acquire("a")
+
+        threads = self.start_waiters(scheduler, "a", 4, order)
+        threads += self.start_waiters(scheduler, "b", 2, order)
+
+        scheduler.release("a")
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(order, ["a", "a", "b", "a", "a", "b"])
+
+    def test_max_concurrency(self):
+        """
+        Tests that the overall and per-class limits are respected.
+        """
+        scheduler = RequestScheduler(
+            3,
+            classes={
+                "interactive": PriorityClass(weight=1),
+                "background": PriorityClass(weight=1, max_concurrency=1),
+            },
+        )
+        lock = threading.Lock()
+        running = {"interactive": 0, "background": 0}
+        peak = {"interactive": 0, "background": 0, "total": 0}
+
+        def work(name):
+            with scheduler.slot(name):
+                with lock:
+                    running[name] += 1
+                    peak[name] = max(peak[name], running[name])
+                    peak["total"] = max(peak["total"], sum(running.values()))
+                time.sleep(0.01)
+                with lock:
+                    running[name] -= 1
+
+        threads = [
+            threading.Thread(target=work, args=(name,))
+            for name in ["interactive", "background"] * 6
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(peak["background"], 1)
+        self.assertEqual(peak["total"], 3)
+
+    def test_invalid_configuration(self):
+        """
+        Tests that invalid configurations are rejected.
+        """
+        with self.assertRaises(ValueError):
+            RequestScheduler(0)
+
+        with self.assertRaises(ValueError):
+            RequestScheduler(1, classes={"a": PriorityClass()}, default="b")
+
+        with self.assertRaises(ValueError):
+            RequestScheduler(1, classes={})
+
+        with self.assertRaises(ValueError):
+            PriorityClass(weight=0)
+
+        with self.assertRaises(ValueError):
+            RequestScheduler(1).acquire("missing")
+
+    def test_custom_classes(self):
+        """
+        Tests that custom classes default to the given class, or else to the
+        class with the highest weight.
+        """
+        classes = {
+            "batch": PriorityClass(weight=1),
+            "web": PriorityClass(weight=4),
+        }
+
+        self.assertEqual(RequestScheduler(1, classes=classes).default, "web")
+        self.assertEqual(
+            RequestScheduler(1, classes=classes, default="batch").default,
+            "batch",
+        )
+        self.assertEqual(RequestScheduler(1).default, "interactive")
+
+        scheduler = RequestScheduler(1, classes=classes)
+        with scheduler.slot(None):
+            self.assertEqual(scheduler._active["web"], 1)
+
+
+class ClientPriorityTest(ClientBaseCase):
+    """
+    Tests for scheduling requests made by a client
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client = LinodeClient(
+            "testing", base_url="/", max_concurrent_requests=2
+        )
+
+    def test_priority(self):
+        """
+        Tests that requests are scheduled in the class of the enclosing
+        priority block.
+        """
+        with patch.object(
+            self.client.scheduler,
+            "acquire",
+            wraps=self.client.scheduler.acquire,
+        ) as m:
+            self.client.regions()
+
+            with self.client.priority("background"):
+                self.client.regions()
+
+                self.client.batch().run([self.client.regions])
+
+            self.client.regions()
+
+        self.assertEqual(
+            [c[0][0] for c in m.call_args_list],
+            [None, "background", "background", None],
+        )
+        self.assertEqual(self.client.scheduler._in_flight, 0)
+
+    def test_unknown_priority(self):
+        """
+        Tests that an unknown priority class is rejected.
+        """
+        with self.assertRaises(ValueError):
+            with self.client.priority("urgent"):
+                pass
+
+    def test_priority_classes_require_limit(self):
+        """
+        Tests that priority classes can't be given without a request limit.
+        """
+        with self.assertRaises(ValueError):
+            LinodeClient(
+                "testing",
+                base_url="/",
+                priority_classes={"interactive": PriorityClass()},
+            )
+
+    def test_default_priority(self):
+        """
+        Tests that the client's default priority class is passed to its
+        scheduler, and requires a request limit.
+        """
+        client = LinodeClient(
+            "testing",
+            base_url="/",
+            max_concurrent_requests=2,
+            priority_classes={"batch": PriorityClass(), "web": PriorityClass()},
+            default_priority="batch",
+        )
+        self.assertEqual(client.scheduler.default, "batch")
+
+        with self.assertRaises(ValueError):
+            LinodeClient("testing", base_url="/", default_priority="batch")
+
+    def test_no_scheduler(self):
+        """
+        Tests that priorities have no effect without a request limit.
+        """
+        client = LinodeClient("testing", base_url="/")
+
+        self.assertIsNone(client.scheduler)
+
+        with client.priority("anything"):
+            self.assertEqual(len(client.regions()), 11)
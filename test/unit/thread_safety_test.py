@@ -0,0 +1,215 @@
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from test.unit.fixtures import TestFixtures
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+from linode_api4 import Instance, LinodeClient, PaginatedList, Tag, Volume
+
+FIXTURES = TestFixtures()
+
+THREADS = 32
+
+# The stand-in server answers slowly so that concurrent requests overlap
+RESPONSE_DELAY = 0.05
+
+PAGED_ENDPOINT = "test/paged"
+PAGED_PAGES = 4
+PAGED_PAGE_SIZE = 25
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves unit test fixtures, as well as a synthetic paginated collection,
+    and records every request made.
+    """
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        path = url.path.strip("/")
+
+        with self.server.requests_lock:
+            self.server.requests[self.path] += 1
+
+        time.sleep(RESPONSE_DELAY)
+
+        if path == PAGED_ENDPOINT:
+            page = int(parse_qs(url.query)["page"][0])
+            body = {
+                "data": [
+                    {"id": (page - 1) * PAGED_PAGE_SIZE + i}
+                    for i in range(PAGED_PAGE_SIZE)
+                ],
+                "page": page,
+                "pages": PAGED_PAGES,
+                "results": PAGED_PAGES * PAGED_PAGE_SIZE,
+            }
+        else:
+            body = FIXTURES.get_fixture(path)
+
+        raw = json.dumps(body).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadSafetyTest(TestCase):
+    """
+    Stress tests sharing a single client and its models between many threads.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.server.daemon_threads = True
+        cls.server.requests_lock = threading.Lock()
+        cls.server_thread = threading.Thread(
+            target=cls.server.serve_forever, daemon=True
+        )
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests = Counter()
+        self.client = LinodeClient(
+            "testing",
+            base_url="http://127.0.0.1:{}".format(self.server.server_port),
+            pool_maxsize=THREADS,
+        )
+
+    def run_concurrently(self, func):
+        """
+        Calls func from many threads at once and returns the results.
+        """
+        barrier = threading.Barrier(THREADS)
+
+        def worker(_):
+            barrier.wait()
+            return func()
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            return list(executor.map(worker, range(THREADS)))
+
+    def requests_to(self, path):
+        return sum(
+            count
+            for url, count in self.server.requests.items()
+            if urlparse(url).path == path
+        )
+
+    def test_lazy_load(self):
+        """
+        Tests that a shared, unloaded object is only fetched once.
+        """
+        instance = Instance(self.client, 123)
+
+        results = self.run_concurrently(lambda: (instance.label, instance.type))
+
+        self.assertEqual(self.requests_to("/linode/instances/123"), 1)
+        self.assertEqual(set(results), {(instance.label, instance.type)})
+        self.assertEqual(instance.label, "linode123")
+
+    def test_relationship_cache(self):
+        """
+        Tests that all threads receive the same related object.
+        """
+        volume = Volume(self.client, 3)
+
+        results = self.run_concurrently(lambda: volume.linode)
+
+        self.assertEqual(self.requests_to("/volumes/3"), 1)
+        self.assertEqual(len({id(r) for r in results}), 1)
+        self.assertEqual(results[0].id, 1)
+
+    def test_instance_ips(self):
+        """
+        Tests that an Instance's IPs are only fetched once.
+        """
+        instance = Instance(self.client, 123)
+
+        results = self.run_concurrently(lambda: instance.ips)
+
+        self.assertEqual(self.requests_to("/linode/instances/123/ips"), 1)
+        self.assertEqual(len({id(r) for r in results}), 1)
+
+    def test_tag_objects(self):
+        """
+        Tests that a Tag's tagged objects are only fetched once.
+        """
+        tag = Tag(self.client, "something")
+
+        self.run_concurrently(lambda: len(tag.objects))
+
+        self.assertEqual(self.requests_to("/tags/something"), 1)
+
+    def make_paged_list(self):
+        first_page = self.client.get(
+            "/{}?page=1&page_size={}".format(PAGED_ENDPOINT, PAGED_PAGE_SIZE)
+        )
+        self.server.requests.clear()
+
+        return PaginatedList.make_paginated_list(
+            first_page, self.client, Instance, page_url=PAGED_ENDPOINT
+        )
+
+    def test_page_loading(self):
+        """
+        Tests that iterating a shared list from many threads loads each page
+        exactly once.
+        """
+        p = self.make_paged_list()
+
+        results = self.run_concurrently(lambda: [o.id for o in p])
+
+        expected = list(range(PAGED_PAGES * PAGED_PAGE_SIZE))
+        for r in results:
+            self.assertEqual(r, expected)
+
+        self.assertEqual(
+            self.requests_to("/" + PAGED_ENDPOINT), PAGED_PAGES - 1
+        )
+        for page in range(2, PAGED_PAGES + 1):
+            self.assertEqual(
+                self.server.requests[
+                    "/{}?page={}&page_size={}".format(
+                        PAGED_ENDPOINT, page, PAGED_PAGE_SIZE
+                    )
+                ],
+                1,
+            )
+
+    def test_shared_next(self):
+        """
+        Tests that calling next() on a shared list from many threads yields
+        every item exactly once.
+        """
+        p = self.make_paged_list()
+
+        def drain():
+            seen = []
+            while True:
+                try:
+                    seen.append(next(p).id)
+                except StopIteration:
+                    return seen
+
+        results = self.run_concurrently(drain)
+
+        self.assertEqual(
+            sorted(i for r in results for i in r),
+            list(range(PAGED_PAGES * PAGED_PAGE_SIZE)),
+        )